@@ -6,6 +6,7 @@ from static_frame.core.batch import Batch as Batch
 from static_frame.core.bus import Bus as Bus
 from static_frame.core.display import Display as Display
 from static_frame.core.display import DisplayActive as DisplayActive
+from static_frame.core.block_executor import BlockExecutor as BlockExecutor
 from static_frame.core.interface_meta import InterfaceMeta as InterfaceMeta
 from static_frame.core.display_config import DisplayConfig as DisplayConfig
 from static_frame.core.display_config import DisplayConfigs as DisplayConfigs
@@ -26,6 +27,7 @@ from static_frame.core.exception import StoreFileMutation
 from static_frame.core.frame import Frame as Frame
 from static_frame.core.frame import FrameAssign as FrameAssign
 from static_frame.core.frame import FrameGO as FrameGO
+from static_frame.core.frame_builder import FrameBuilder as FrameBuilder
 from static_frame.core.hloc import HLoc as HLoc
 from static_frame.core.index import ILoc as ILoc
 from static_frame.core.index import Index as Index
@@ -66,6 +68,7 @@ from static_frame.core.node_iter import IterNodeGroupAxis
 from static_frame.core.node_iter import IterNodeNoArg
 from static_frame.core.node_iter import IterNodeType as IterNodeType
 from static_frame.core.node_iter import IterNodeWindow
+from static_frame.core.node_lazy import LazyExpression
 from static_frame.core.node_selector import InterfaceAssignQuartet
 from static_frame.core.node_selector import InterfaceAssignTrio
 from static_frame.core.node_selector import InterfaceAsType
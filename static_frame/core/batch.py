@@ -1,6 +1,7 @@
 import typing as tp
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import numpy as np
 
@@ -13,9 +14,18 @@ from static_frame.core.display_config import DisplayConfig
 from static_frame.core.doc_str import doc_inject
 from static_frame.core.frame import Frame
 from static_frame.core.index_auto import IndexAutoFactoryType
+from static_frame.core.node_iter import ChunkSize
+from static_frame.core.node_iter import CHUNKSIZE_AUTO
+from static_frame.core.node_iter import chunks_auto
+from static_frame.core.node_iter import chunksize_validate
+from static_frame.core.node_iter import len_container
+from static_frame.core.node_iter import pool_map_chunks
 from static_frame.core.node_selector import InterfaceGetItem
 from static_frame.core.node_selector import InterfaceSelectTrio
 from static_frame.core.series import Series
+from static_frame.core.shared_blocks import frame_from_spec
+from static_frame.core.shared_blocks import SharedBlocks
+from static_frame.core.shared_blocks import shared_memory_validate
 from static_frame.core.store import Store
 from static_frame.core.store import StoreConfigMap
 from static_frame.core.store_client_mixin import StoreClientMixin
@@ -46,6 +56,38 @@ def call_attr(bundle: tp.Tuple[FrameOrSeries, str, tp.Any, tp.Any]) -> FrameOrSe
         return Series.from_element(post, index=(frame.name,))
     return post
 
+def call_attr_shared(bundle: tp.Tuple[tp.Any, str, tp.Any, tp.Any]) -> FrameOrSeries:
+    # as call_attr, but a Frame might be given as a spec of blocks in shared memory
+    container, attr, args, kwargs = bundle
+    return call_attr((from_shared(container), attr, args, kwargs))
+
+def call_func_shared(func: AnyCallable, container: tp.Any) -> tp.Any:
+    return func(from_shared(container))
+
+def from_shared(container: tp.Any) -> FrameOrSeries:
+    if isinstance(container, tuple):
+        return frame_from_spec(container)
+    return container # type: ignore
+
+
+def map_pool(
+        executor: tp.Any,
+        func: AnyCallable,
+        args: tp.Iterable[tp.Any],
+        sizes: tp.List[int],
+        chunksize: ChunkSize,
+        max_workers: tp.Optional[int],
+        ) -> tp.Iterator[tp.Any]:
+    '''
+    Map ``func`` to ``args`` with the executor, returning an iterator of results in order. As with ``Executor.map``, ``args`` are consumed immediately. If ``chunksize`` is 'auto', ``sizes`` (populated as ``args`` are consumed) is used to form chunks of similar total size for ``max_workers``.
+    '''
+    if chunksize != CHUNKSIZE_AUTO:
+        return executor.map(func, args, chunksize=chunksize) # type: ignore
+    args = list(args)
+    chunks = chunks_auto(sizes, max_workers)
+    futures = pool_map_chunks(executor, func, args, chunks, sizes, True) # type: ignore
+    return (post for _, post in futures)
+
 
 class Batch(ContainerOperand, StoreClientMixin):
     '''
@@ -59,6 +101,7 @@ class Batch(ContainerOperand, StoreClientMixin):
             '_max_workers',
             '_chunksize',
             '_use_threads',
+            '_use_shared_memory',
             )
 
     _config: StoreConfigMap
@@ -70,8 +113,9 @@ class Batch(ContainerOperand, StoreClientMixin):
             name: NameType = None,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
             ) -> 'Batch':
         '''Return a :obj:`Batch` from an iterable of :obj:`Frame`; labels will be drawn from :obj:`Frame.name`.
         '''
@@ -81,6 +125,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=max_workers,
                 chunksize=chunksize,
                 use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
                 )
 
     @classmethod
@@ -100,17 +145,28 @@ class Batch(ContainerOperand, StoreClientMixin):
             name: NameType = None,
             config: StoreConfigMapInitializer = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
             ):
+        '''
+        Args:
+            chunksize: Passed to the pool executor; if 'auto', :obj:`Frame` are combined into chunks of similar total count of rows.
+            use_shared_memory: When True, and using a ProcessPoolExecutor, the blocks of each :obj:`Frame` are placed in shared memory, and workers build :obj:`Frame` from views of these blocks rather than receiving pickled :obj:`Frame`; requires Python 3.8.
+        '''
         self._items = items # might be a generator!
         self._name = name
 
         self._config = StoreConfigMap.from_initializer(config)
 
+        chunksize_validate(chunksize)
+        if use_shared_memory and not use_threads:
+            shared_memory_validate()
+
         self._max_workers = max_workers
         self._chunksize = chunksize
         self._use_threads = use_threads
+        self._use_shared_memory = use_shared_memory
 
     #---------------------------------------------------------------------------
 
@@ -131,6 +187,7 @@ class Batch(ContainerOperand, StoreClientMixin):
                 max_workers=self._max_workers,
                 chunksize=self._chunksize,
                 use_threads=self._use_threads,
+                use_shared_memory=self._use_shared_memory,
                 )
 
     #---------------------------------------------------------------------------
@@ -194,17 +251,28 @@ class Batch(ContainerOperand, StoreClientMixin):
             return self._derive(gen)
 
         pool_executor = ThreadPoolExecutor if self._use_threads else ProcessPoolExecutor
+        use_shared_memory = self._use_shared_memory and not self._use_threads
 
         labels = []
-        def arg_gen() -> tp.Iterator[tp.Tuple[FrameOrSeries, str, tp.Any, tp.Any]]:
+        sizes = []
+        def arg_gen(shared: SharedBlocks) -> tp.Iterator[tp.Tuple[tp.Any, str, tp.Any, tp.Any]]:
             for label, frame in self._items:
                 labels.append(label)
-                yield frame, attr, args, kwargs
+                sizes.append(len_container(frame))
+                if use_shared_memory and isinstance(frame, Frame):
+                    yield shared.share_frame(frame), attr, args, kwargs
+                else:
+                    yield frame, attr, args, kwargs
 
         def gen_pool() -> IteratorFrameItems:
-            with pool_executor(max_workers=self._max_workers) as executor:
+            with SharedBlocks() as shared, pool_executor(max_workers=self._max_workers) as executor:
                 yield from zip(labels,
-                        executor.map(call_attr, arg_gen(), chunksize=self._chunksize)
+                        map_pool(executor,
+                                call_attr_shared if use_shared_memory else call_attr,
+                                arg_gen(shared),
+                                sizes,
+                                self._chunksize,
+                                self._max_workers)
                         )
 
         return self._derive(gen_pool)
@@ -218,17 +286,28 @@ class Batch(ContainerOperand, StoreClientMixin):
             return self._derive(gen)
 
         pool_executor = ThreadPoolExecutor if self._use_threads else ProcessPoolExecutor
+        use_shared_memory = self._use_shared_memory and not self._use_threads
 
         labels = []
-        def arg_gen() -> tp.Iterator[FrameOrSeries]:
+        sizes = []
+        def arg_gen(shared: SharedBlocks) -> tp.Iterator[tp.Any]:
             for label, frame in self._items:
                 labels.append(label)
-                yield frame
+                sizes.append(len_container(frame))
+                if use_shared_memory and isinstance(frame, Frame):
+                    yield shared.share_frame(frame)
+                else:
+                    yield frame
 
         def gen_pool() -> IteratorFrameItems:
-            with pool_executor(max_workers=self._max_workers) as executor:
+            with SharedBlocks() as shared, pool_executor(max_workers=self._max_workers) as executor:
                 yield from zip(labels,
-                        executor.map(func, arg_gen(), chunksize=self._chunksize)
+                        map_pool(executor,
+                                partial(call_func_shared, func) if use_shared_memory else func,
+                                arg_gen(shared),
+                                sizes,
+                                self._chunksize,
+                                self._max_workers)
                         )
 
         return self._derive(gen_pool)
@@ -430,7 +509,7 @@ class Batch(ContainerOperand, StoreClientMixin):
     def sort_values(self,
             key: KeyOrKeys,
             *,
-            ascending: bool = True,
+            ascending: tp.Union[bool, tp.Iterable[bool]] = True,
             axis: int = 1,
             kind: str = DEFAULT_SORT_KIND) -> 'Batch':
         '''
@@ -0,0 +1,138 @@
+import typing as tp
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+
+from static_frame.core.util import BLOCK_EXECUTOR_ELEMENTS
+from static_frame.core.util import DTYPE_BOOL_KIND
+from static_frame.core.util import DTYPE_COMPLEX_KIND
+from static_frame.core.util import DTYPE_FLOAT_KIND
+from static_frame.core.util import DTYPE_INT_KINDS
+
+
+_THREAD_NAME_PREFIX = 'static_frame_block'
+
+# kinds for which an output array can be allocated before the function is applied
+_ROW_CHUNK_KINDS = (DTYPE_BOOL_KIND, DTYPE_FLOAT_KIND, DTYPE_COMPLEX_KIND, *DTYPE_INT_KINDS)
+
+T = tp.TypeVar('T')
+
+
+class BlockExecutor:
+    '''Utility interface for setting the number of threads used to process the blocks of a ``Frame`` in parallel. A value of 1 (the default) processes blocks sequentially. :obj:`BlockExecutor.set` sets the default for all threads; :obj:`BlockExecutor.context` sets the value for the current thread only.
+    '''
+
+    _max_workers: int = 1
+    # values set by context(), specific to each thread
+    _local = threading.local()
+
+    @classmethod
+    def set(cls, max_workers: int) -> None:
+        if max_workers < 1:
+            raise RuntimeError(f'invalid max_workers: {max_workers}')
+        cls._max_workers = max_workers
+
+    @classmethod
+    def get(cls) -> int:
+        max_workers: tp.Optional[int] = getattr(cls._local, 'max_workers', None)
+        if max_workers is None:
+            return cls._max_workers
+        return max_workers
+
+    @classmethod
+    @contextmanager
+    def context(cls, max_workers: int) -> tp.Iterator[None]:
+        '''Set the number of threads used by the current thread for the duration of a ``with`` block, restoring the prior value on exit.
+        '''
+        if max_workers < 1:
+            raise RuntimeError(f'invalid max_workers: {max_workers}')
+        prior = getattr(cls._local, 'max_workers', None)
+        cls._local.max_workers = max_workers
+        try:
+            yield
+        finally:
+            cls._local.max_workers = prior
+
+
+# one executor for each count of workers requested; as callers in other threads might hold an executor, executors are never shut down
+_EXECUTORS: tp.Dict[int, ThreadPoolExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    '''Return the shared executor for ``max_workers``, creating it if necessary.
+    '''
+    executor = _EXECUTORS.get(max_workers)
+    if executor is None:
+        with _EXECUTORS_LOCK:
+            executor = _EXECUTORS.get(max_workers)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                        max_workers=max_workers,
+                        thread_name_prefix=_THREAD_NAME_PREFIX,
+                        )
+                _EXECUTORS[max_workers] = executor
+    return executor
+
+
+def _assign_rows(
+        func: tp.Callable[[np.ndarray], np.ndarray],
+        array: np.ndarray,
+        out: np.ndarray,
+        rows: slice,
+        ) -> None:
+    out[rows] = func(array[rows])
+
+
+def map_blocks(
+        func: tp.Callable[[T], tp.Any],
+        items: tp.Iterable[T],
+        *,
+        size: int,
+        dtype: tp.Optional[np.dtype] = None,
+        ) -> tp.Iterator[tp.Any]:
+    '''
+    Apply ``func`` to each of ``items``, yielding results in order. If ``BlockExecutor`` is set to more than one thread and ``size`` (the count of elements processed) is large enough, items are dispatched to a thread pool.
+
+    Args:
+        size: the count of elements processed, used to determine if dispatching to threads is worthwhile.
+        dtype: if given, items must be arrays and ``func`` must return an array of this dtype and of the same shape; arrays with fewer blocks than threads are divided into row chunks.
+    '''
+    max_workers = BlockExecutor.get()
+
+    if (max_workers == 1
+            or size < BLOCK_EXECUTOR_ELEMENTS
+            # do not dispatch from within a worker, as waiting on the pool can deadlock
+            or threading.current_thread().name.startswith(_THREAD_NAME_PREFIX)
+            ):
+        yield from map(func, items)
+        return
+
+    executor = _get_executor(max_workers)
+    items = list(items)
+
+    if (dtype is None
+            or dtype.kind not in _ROW_CHUNK_KINDS
+            or len(items) >= max_workers
+            ):
+        yield from executor.map(func, items)
+        return
+
+    outs = []
+    futures = []
+    for array in items:
+        out = np.empty(array.shape, dtype=dtype) # type: ignore
+        outs.append(out)
+        rows = len(array) # type: ignore
+        step = max(-(-rows // max_workers), 1)
+        for start in range(0, rows, step):
+            futures.append(executor.submit(_assign_rows,
+                    func,
+                    array,
+                    out,
+                    slice(start, start + step),
+                    ))
+    for future in futures:
+        future.result()
+    yield from outs
@@ -5,6 +5,7 @@ import numpy as np
 
 
 from static_frame.core.container import ContainerBase
+from static_frame.core.container_util import index_many_set
 from static_frame.core.display import Display
 from static_frame.core.display import DisplayActive
 from static_frame.core.display import DisplayHeader
@@ -12,19 +13,27 @@ from static_frame.core.display_config import DisplayConfig
 from static_frame.core.doc_str import doc_inject
 from static_frame.core.exception import ErrorInitBus
 from static_frame.core.frame import Frame
+from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.node_selector import InterfaceGetItem
 from static_frame.core.series import Series
 from static_frame.core.store import Store
 from static_frame.core.store import StoreConfigMap
 from static_frame.core.store import StoreConfigMapInitializer
 from static_frame.core.store_client_mixin import StoreClientMixin
+from static_frame.core.type_blocks import TypeBlocks
 from static_frame.core.util import DTYPE_BOOL
 from static_frame.core.util import DTYPE_FLOAT_DEFAULT
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import GetItemKeyType
+from static_frame.core.util import INT_TYPES
+from static_frame.core.util import IndexInitializer
 from static_frame.core.util import NameType
 from static_frame.core.util import NULL_SLICE
 
+if tp.TYPE_CHECKING:
+    import asyncio # pylint: disable=W0611 #pragma: no cover
+    from concurrent.futures import Executor # pylint: disable=W0611 #pragma: no cover
+
 #-------------------------------------------------------------------------------
 class FrameDefferedMeta(type):
     def __repr__(cls) -> str:
@@ -47,13 +56,17 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         '_series',
         '_store',
         '_config',
+        '_loading',
         )
 
     _series: Series
     _store: tp.Optional[Store]
     _config: StoreConfigMap
+    _loading: tp.Dict[str, 'asyncio.Future[Frame]']
 
     STATIC = False
+    # in to_frame, the maximum total bytes of Frames read from the Store in the first pass that are retained for the second pass rather than read again
+    TO_FRAME_RETAIN_NBYTES = 2 ** 28
 
     @staticmethod
     def _deferred_series(labels: tp.Iterable[str]) -> Series:
@@ -126,6 +139,9 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         # providing None will result in default; providing a StoreConfig or StoreConfigMap will return an appropriate map
         self._config = StoreConfigMap.from_initializer(config)
 
+        # futures of reads in progress from aget(), by label
+        self._loading = {}
+
     #---------------------------------------------------------------------------
     # delegation
 
@@ -179,6 +195,47 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         if not self._loaded_all:
             self._update_series_cache_iloc(NULL_SLICE)
 
+    def _update_series_cache_frame(self, idx: int, frame: Frame) -> None:
+        '''Update the Series cache with a Frame read from the Store at position ``idx``.
+        '''
+        array = self._series.values.copy()
+        array[idx] = frame
+        array.flags.writeable = False
+
+        self._series = Series(array, index=self._series._index, dtype=object, own_index=True)
+        self._loaded[idx] = True
+        self._loaded_all = self._loaded.all()
+
+    async def _aload(self,
+            label: str,
+            idx: int,
+            executor: tp.Optional['Executor'],
+            ) -> Frame:
+        try:
+            frame = await self._store.aread( # type: ignore
+                    label,
+                    config=self._config[label],
+                    executor=executor,
+                    )
+            # the Frame might have been loaded synchronously while waiting
+            if self._loaded[idx]:
+                return self._series.values[idx] # type: ignore
+            self._update_series_cache_frame(idx, frame)
+            return frame
+        finally:
+            del self._loading[label]
+
+    def _iter_frames_uncached(self) -> tp.Iterator[Frame]:
+        '''
+        Iterate all Frames contained in this Bus, reading from the Store those not loaded without updating the Series cache.
+        '''
+        for label, frame in zip(self._series._index, self._series.values):
+            if frame is FrameDeferred:
+                if self._store is None:
+                    raise RuntimeError('no store defined')
+                frame = self._store.read(label, config=self._config[label])
+            yield frame
+
     #---------------------------------------------------------------------------
     # extraction
 
@@ -234,6 +291,53 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
         '''
         return self._extract_loc(key)
 
+    #---------------------------------------------------------------------------
+    # asynchronous loading
+
+    async def aget(self,
+            label: str,
+            *,
+            executor: tp.Optional['Executor'] = None,
+            ) -> Frame:
+        '''Return the :obj:`Frame` given by ``label``. If not yet loaded, the :obj:`Frame` is read from the Store in an executor (see :obj:`Store.aread`), such that an asyncio event loop is not blocked; concurrent calls for the same label share a single read.
+
+        Args:
+            label: A single label.
+            executor: Executor used for reading; if None, the event loop's default executor is used.
+        '''
+        import asyncio
+
+        idx = self._series._index.loc_to_iloc(label)
+        if not isinstance(idx, INT_TYPES):
+            raise RuntimeError(f'aget() requires a single label, not {label}')
+
+        if self._loaded[idx]:
+            return self._series.values[idx] # type: ignore
+        if self._store is None:
+            raise RuntimeError('no store defined')
+
+        future = self._loading.get(label)
+        if future is None:
+            future = asyncio.ensure_future(self._aload(label, idx, executor))
+            self._loading[label] = future
+        # shield the shared read from the cancellation of any one caller
+        return await asyncio.shield(future)
+
+    async def prefetch(self,
+            labels: tp.Iterable[str],
+            *,
+            executor: tp.Optional['Executor'] = None,
+            ) -> None:
+        '''Concurrently read from the Store, with :obj:`Bus.aget`, all :obj:`Frame` given by ``labels`` not yet loaded.
+
+        Args:
+            labels: An iterable of labels.
+            executor: Executor used for reading; if None, the event loop's default executor is used.
+        '''
+        import asyncio
+
+        await asyncio.gather(*(self.aget(label, executor=executor) for label in labels))
+
     #---------------------------------------------------------------------------
     # interfaces
 
@@ -418,3 +522,92 @@ class Bus(ContainerBase, StoreClientMixin): # not a ContainerOperand
                 return False
 
         return True
+
+    #---------------------------------------------------------------------------
+    # exporters
+
+    def to_frame(self, *,
+            axis: int = 0,
+            union: bool = True,
+            index: tp.Optional[IndexInitializer] = None,
+            columns: tp.Optional[IndexInitializer] = None,
+            name: NameType = None,
+            fill_value: object = np.nan,
+            consolidate_blocks: bool = False
+        ) -> Frame:
+        '''
+        Concatenate the contained :obj:`Frame` into a new :obj:`Frame`, using the :obj:`Bus` labels as the outer level of a hierarchical index on the provided ``axis``. :obj:`Frame` not yet loaded are read from the :obj:`Store` but not retained by the :obj:`Bus`. For vertical concatenation (``axis`` 0), output blocks are allocated once after a first pass collects shapes, labels, and dtypes; a second pass copies each :obj:`Frame` into those blocks. :obj:`Frame` read in the first pass are kept for the second pass up to a total of ``Bus.TO_FRAME_RETAIN_NBYTES``; beyond that, :obj:`Frame` are released after the first pass and read again in the second.
+        '''
+        name = name if name is not None else self._series._name
+
+        if axis != 0:
+            f = Frame.from_concat_items(
+                    zip(self._series._index, self._iter_frames_uncached()),
+                    axis=axis,
+                    union=union,
+                    name=name,
+                    fill_value=fill_value,
+                    consolidate_blocks=consolidate_blocks,
+                    )
+        elif not len(self._series):
+            f = Frame(name=name)
+        else:
+            index_items = []
+            # Frames to be provided to the second pass; None if to be read again
+            retained: tp.List[tp.Optional[Frame]] = []
+            retained_nbytes = 0
+
+            def frames_first() -> tp.Iterator[Frame]:
+                nonlocal retained_nbytes
+                for label, value, frame in zip(
+                        self._series._index,
+                        self._series.values,
+                        self._iter_frames_uncached(),
+                        ):
+                    index_items.append((label, frame._index))
+                    if value is not FrameDeferred:
+                        retained.append(frame) # already held by the Bus
+                    elif retained_nbytes + frame.nbytes <= self.TO_FRAME_RETAIN_NBYTES:
+                        retained_nbytes += frame.nbytes
+                        retained.append(frame)
+                    else:
+                        retained.append(None)
+                    yield frame
+
+            def frames_second() -> tp.Iterator[Frame]:
+                for i, label in enumerate(self._series._index):
+                    frame = retained[i]
+                    if frame is None:
+                        frame = self._store.read(label, config=self._config[label]) #type: ignore
+                    else:
+                        retained[i] = None # release once copied
+                    yield frame
+
+            metadata = Frame._concat_rows_metadata(frames_first())
+            columns_final = index_many_set(
+                    (frame_columns for _, frame_columns, _ in metadata),
+                    Frame._COLUMNS_CONSTRUCTOR,
+                    union=union,
+                    )
+            blocks = Frame._concat_rows_blocks(
+                    frames_second,
+                    metadata=metadata,
+                    columns=columns_final,
+                    fill_value=fill_value,
+                    )
+            if consolidate_blocks:
+                blocks = TypeBlocks.consolidate_blocks(blocks)
+
+            f = Frame(TypeBlocks.from_blocks(blocks),
+                    index=IndexHierarchy.from_index_items(index_items),
+                    columns=columns_final,
+                    name=name,
+                    own_data=True,
+                    own_index=True,
+                    own_columns=True,
+                    )
+
+        if index is not None or columns is not None:
+            # this relabels, as does Batch.to_frame
+            f = f.relabel(index=index, columns=columns)
+        return f
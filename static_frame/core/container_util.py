@@ -12,6 +12,7 @@ import typing as tp
 import numpy as np
 from numpy import char as npc
 
+from static_frame.core.block_executor import map_blocks
 from static_frame.core.index_base import IndexBase
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import Bloc2DKeyType
@@ -733,23 +734,29 @@ def apply_binary_operator_blocks(*,
         other: tp.Iterable[np.ndarray],
         operator: UFunc,
         apply_column_2d_filter: bool,
+        size: int = 0,
     ) -> tp.Iterator[np.ndarray]:
     '''
     Application from iterators of arrays, to iterators of arrays.
+
+    Args:
+        size: the count of elements processed, used to determine if pairs of arrays are dispatched to threads with ``map_blocks``.
     '''
 
     if apply_column_2d_filter:
         values = (column_2d_filter(op) for op in values)
         other = (column_2d_filter(op) for op in other)
 
-    for a, b in zip_longest(values, other):
-        yield apply_binary_operator(
-                values=a,
-                other=b,
+    def func(operands: tp.Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        return apply_binary_operator(
+                values=operands[0],
+                other=operands[1],
                 other_is_array=True,
                 operator=operator,
                 )
 
+    yield from map_blocks(func, zip_longest(values, other), size=size)
+
 
 def arrays_from_index_frame(
         container: 'Frame',
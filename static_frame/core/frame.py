@@ -46,14 +46,17 @@ from static_frame.core.index import _index_initializer_needs_init
 from static_frame.core.index import immutable_index_filter
 from static_frame.core.index import Index
 from static_frame.core.index import IndexGO
+from static_frame.core.index import PositionsAllocator
 from static_frame.core.index_auto import IndexAutoFactory
 from static_frame.core.index_auto import IndexAutoFactoryType
 from static_frame.core.index_auto import RelabelInput
 from static_frame.core.index_base import IndexBase
 from static_frame.core.index_correspondence import IndexCorrespondence
+from static_frame.core.index_correspondence import union_correspondence
 from static_frame.core.index_hierarchy import IndexHierarchy
 from static_frame.core.index_hierarchy import IndexHierarchyGO
 from static_frame.core.node_dt import InterfaceDatetime
+from static_frame.core.node_iter import array_from_vectorized
 from static_frame.core.node_iter import IterNodeApplyType
 from static_frame.core.node_iter import IterNodeAxis
 from static_frame.core.node_iter import IterNodeDepthLevelAxis
@@ -66,6 +69,7 @@ from static_frame.core.node_selector import InterfaceAsType
 from static_frame.core.node_selector import InterfaceGetItem
 from static_frame.core.node_selector import InterfaceSelectTrio
 # from static_frame.core.node_selector import InterfaceBatchQuartet
+from static_frame.core.node_lazy import LazyExpression
 from static_frame.core.node_str import InterfaceString
 from static_frame.core.series import Series
 from static_frame.core.store_filter import STORE_FILTER_DEFAULT
@@ -83,6 +87,9 @@ from static_frame.core.util import _read_url
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import argmax_2d
 from static_frame.core.util import argmin_2d
+from static_frame.core.util import argnlargest
+from static_frame.core.util import argnsmallest
+from static_frame.core.util import argsort_keys
 from static_frame.core.util import array_to_duplicated
 from static_frame.core.util import array_to_groups_and_locations
 from static_frame.core.util import array2d_to_tuples
@@ -90,10 +97,10 @@ from static_frame.core.util import Bloc2DKeyType
 from static_frame.core.util import CallableOrCallableMap
 from static_frame.core.util import column_1d_filter
 from static_frame.core.util import column_2d_filter
-from static_frame.core.util import concat_resolved
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DepthLevelSpecifier
 from static_frame.core.util import DTYPE_FLOAT_DEFAULT
+from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import dtype_to_fill_value
 from static_frame.core.util import DtypeSpecifier
@@ -104,6 +111,7 @@ from static_frame.core.util import FILL_VALUE_DEFAULT
 from static_frame.core.util import FRAME_INITIALIZER_DEFAULT
 from static_frame.core.util import FrameInitializer
 from static_frame.core.util import get_tuple_constructor
+from static_frame.core.util import groups_to_positions
 from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import GetItemKeyTypeCompound
 from static_frame.core.util import IndexConstructor
@@ -124,6 +132,7 @@ from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import name_filter
 from static_frame.core.util import NameType
 from static_frame.core.util import NULL_SLICE
+from static_frame.core.util import ROW_CHUNK_ELEMENTS
 from static_frame.core.util import Pair
 from static_frame.core.util import PairLeft
 from static_frame.core.util import PairRight
@@ -132,7 +141,7 @@ from static_frame.core.util import PathSpecifier
 from static_frame.core.util import PathSpecifierOrFileLike
 from static_frame.core.util import PathSpecifierOrFileLikeOrIterator
 from static_frame.core.util import resolve_dtype
-from static_frame.core.util import reversed_iter
+from static_frame.core.util import resolve_dtype_iter
 from static_frame.core.util import UFunc
 from static_frame.core.util import ufunc_unique
 from static_frame.core.util import write_optional_file
@@ -409,51 +418,19 @@ class Frame(ContainerOperand):
                         union=union,
                         )
                 own_columns = True
+            elif not isinstance(columns, IndexBase):
+                columns = index_from_optional_constructor(columns,
+                        default_constructor=cls._COLUMNS_CONSTRUCTOR,
+                        )
+                own_columns = True
 
-            def blocks() -> tp.Iterator[np.ndarray]:
-                aligned_frames = []
-                previous_frame = None
-                block_compatible = True
-                reblock_compatible = True
+            blocks = partial(cls._concat_rows_blocks,
+                    lambda: frames,
+                    metadata=cls._concat_rows_metadata(frames),
+                    columns=columns,
+                    fill_value=fill_value,
+                    )
 
-                for frame in frames:
-                    if len(frame.columns) != len(columns) or (frame.columns != columns).any():
-                        frame = frame.reindex(columns=columns, fill_value=fill_value)
-
-                    aligned_frames.append(frame)
-                    # column size is all the same by this point
-                    if previous_frame is not None: # after the first
-                        if block_compatible:
-                            block_compatible &= frame._blocks.block_compatible(
-                                    previous_frame._blocks,
-                                    axis=1) # only compare columns
-                        if reblock_compatible:
-                            reblock_compatible &= frame._blocks.reblock_compatible(
-                                    previous_frame._blocks)
-                    previous_frame = frame
-
-                if block_compatible or reblock_compatible:
-                    if not block_compatible and reblock_compatible:
-                        # after reblocking, will be compatible
-                        type_blocks = [f._blocks.consolidate() for f in aligned_frames]
-                    else: # blocks by column are compatible
-                        type_blocks = [f._blocks for f in aligned_frames]
-
-                    # all TypeBlocks have the same number of blocks by here
-                    for block_idx in range(len(type_blocks[0]._blocks)):
-                        block_parts = []
-                        for frame_idx in range(len(type_blocks)):
-                            b = column_2d_filter(
-                                    type_blocks[frame_idx]._blocks[block_idx])
-                            block_parts.append(b)
-                        # returns immutable array
-                        yield concat_resolved(block_parts)
-                else: # blocks not alignable
-                    # break into single column arrays for maximum type integrity; there might be an alternative reblocking that could be more efficient, but determining that shape might be complex
-                    for i in range(len(columns)):
-                        block_parts = [
-                            f._blocks._extract_array(column_key=i) for f in aligned_frames]
-                        yield concat_resolved(block_parts)
         else:
             raise NotImplementedError(f'no support for {axis}')
 
@@ -470,6 +447,130 @@ class Frame(ContainerOperand):
                 own_columns=own_columns,
                 own_index=own_index)
 
+    @staticmethod
+    def _concat_rows_metadata(
+            frames: tp.Iterable['Frame'],
+            ) -> tp.List[tp.Tuple[int, IndexBase, tp.Tuple[np.dtype, ...]]]:
+        '''
+        For each Frame, collect the metadata needed to allocate a vertical concatenation: the row count, the columns, and the dtype of each column.
+        '''
+        post = []
+        # frames from the same source generally share the same block structure; derive column dtypes once per structure
+        block_signature_to_dtypes: tp.Dict[tp.Tuple[tp.Any, ...], tp.Tuple[np.dtype, ...]] = {}
+        for frame in frames:
+            block_signature = tuple((b.dtype, b.shape[1] if b.ndim == 2 else 0)
+                    for b in frame._blocks._blocks)
+            dtypes = block_signature_to_dtypes.get(block_signature)
+            if dtypes is None:
+                dtypes = tuple(frame._blocks.dtypes)
+                block_signature_to_dtypes[block_signature] = dtypes
+            post.append((len(frame), frame._columns, dtypes))
+        return post
+
+    @staticmethod
+    def _concat_rows_blocks(
+            frames: tp.Callable[[], tp.Iterable['Frame']],
+            *,
+            metadata: tp.Sequence[tp.Tuple[int, IndexBase, tp.Tuple[np.dtype, ...]]],
+            columns: IndexBase,
+            fill_value: object,
+            ) -> tp.Iterator[np.ndarray]:
+        '''
+        Yield the blocks of a vertical concatenation. Output blocks are allocated once from ``metadata`` (as returned by ``_concat_rows_metadata``); ``frames`` is then called to provide an iterable of the same Frames, each of which is copied into the output blocks and can be released once the next Frame is drawn.
+        '''
+        # for each frame, map each final column position to a source column position, or -1 if the column has to be filled; if columns are aligned, the map is None
+        column_count = len(columns)
+        fill_dtype = np.array(fill_value).dtype
+        frame_locators = []
+        signatures = set()
+        row_count = 0
+
+        for frame_len, frame_columns, dtypes in metadata:
+            if len(frame_columns) == column_count and (frame_columns == columns).all():
+                locator = None
+            else:
+                locator = np.full(column_count, -1, dtype=DTYPE_INT_DEFAULT)
+                ic = IndexCorrespondence.from_correspondence(frame_columns, columns)
+                if ic.has_common:
+                    locator[ic.iloc_dst] = PositionsAllocator.get(len(frame_columns))[ic.iloc_src]
+                dtypes = tuple(dtypes[i] if i >= 0 else fill_dtype for i in locator.tolist())
+            signatures.add(dtypes)
+            frame_locators.append((slice(row_count, row_count + frame_len), locator))
+            row_count += frame_len
+
+        # resolve the final dtype of each column across all distinct column dtype signatures
+        dtypes_final = [resolve_dtype_iter(dts) for dts in zip(*signatures)]
+
+        # allocate, once, one block per contiguous run of columns of the same dtype
+        outs = []
+        run_starts = []
+        run_of_column = np.empty(column_count, dtype=DTYPE_INT_DEFAULT)
+        start = 0
+        while start < column_count:
+            stop = start + 1
+            while stop < column_count and dtypes_final[stop] == dtypes_final[start]:
+                stop += 1
+            run_of_column[start: stop] = len(outs)
+            run_starts.append(start)
+            outs.append(np.empty((row_count, stop - start), dtype=dtypes_final[start]))
+            start = stop
+
+        def assign(rows: slice, dst: np.ndarray, values: tp.Any) -> None:
+            # assign values to ascending final column positions, splitting across runs as necessary
+            runs = run_of_column[dst]
+            if runs[0] == runs[-1]:
+                parts: tp.Iterable[tp.Tuple[int, np.ndarray, tp.Any]] = ((runs[0], dst, values),)
+            else:
+                parts = ((run,
+                        dst[runs == run],
+                        values[:, runs == run] if isinstance(values, np.ndarray) else values,
+                        ) for run in np.unique(runs))
+            for run, dst_run, values_run in parts:
+                columns_run = dst_run - run_starts[run]
+                if columns_run[-1] - columns_run[0] == len(columns_run) - 1: # contiguous
+                    outs[run][rows, columns_run[0]: columns_run[-1] + 1] = values_run
+                else:
+                    outs[run][rows, columns_run] = values_run
+
+        run_of_column_list = run_of_column.tolist()
+
+        for frame, (rows, locator) in zip(frames(), frame_locators):
+            if len(frame) != rows.stop - rows.start:
+                raise RuntimeError(f'Frame length changed between passes: {frame.name}')
+            if locator is None: # columns are aligned
+                block_slices = frame._blocks._key_to_block_slices(None)
+            else:
+                present = locator >= 0
+                dst = np.nonzero(present)[0]
+                block_slices = frame._blocks._key_to_block_slices(locator[present])
+                if len(dst) < column_count:
+                    assign(rows, np.nonzero(~present)[0], fill_value)
+
+            pos = 0
+            for block_idx, key in block_slices:
+                b = frame._blocks._blocks[block_idx]
+                values = b if b.ndim == 1 else b[:, key]
+                width = 1 if values.ndim == 1 else values.shape[1]
+                run = run_of_column_list[pos] if locator is None else -1
+                if run >= 0 and run == run_of_column_list[pos + width - 1]:
+                    # destination columns are contiguous and within one run
+                    start = pos - run_starts[run]
+                    if values.ndim == 1:
+                        outs[run][rows, start] = values
+                    else:
+                        outs[run][rows, start: start + width] = values
+                else:
+                    dst_part = (PositionsAllocator.get(column_count)[pos: pos + width]
+                            if locator is None else dst[pos: pos + width])
+                    assign(rows, dst_part, column_2d_filter(values))
+                pos += width
+
+        for out in outs:
+            if out.shape[1] == 1:
+                out = out.reshape(row_count)
+            out.flags.writeable = False
+            yield out
+
     @classmethod
     def from_concat_items(cls,
             items: tp.Iterable[tp.Tuple[tp.Hashable, tp.Union['Frame', Series]]],
@@ -1180,8 +1281,8 @@ class Frame(ContainerOperand):
                 index=index_arrays[0],
                 **kwargs)
         return cls(
-                index=zip(*index_arrays),
-                index_constructor=IndexHierarchy.from_labels,
+                index=IndexHierarchy.from_arrays(index_arrays),
+                own_index=True,
                 **kwargs
                 )
 
@@ -1361,8 +1462,8 @@ class Frame(ContainerOperand):
         index_constructor = None
 
         if index_depth > 0:
-            index = [] # lazily populate
             if index_depth == 1:
+                index = [] # lazily populate
                 index_constructor = Index
 
                 def row_gen_final() -> tp.Iterator[tp.Sequence[tp.Any]]:
@@ -1371,11 +1472,14 @@ class Frame(ContainerOperand):
                         yield row[1:]
 
             else: # > 1
-                index_constructor = IndexHierarchy.from_labels
+                # lazily populate labels per depth, avoiding the creation of per-row labels
+                index = [[] for _ in range(index_depth)]
+                index_constructor = IndexHierarchy.from_arrays
 
                 def row_gen_final() -> tp.Iterator[tp.Sequence[tp.Any]]:
                     for row in row_gen:
-                        index.append(row[:index_depth])
+                        for labels, label in zip(index, row[:index_depth]):
+                            labels.append(label)
                         yield row[index_depth:]
         else:
             index = None
@@ -2087,8 +2191,8 @@ class Frame(ContainerOperand):
         if index_depth == 1:
             return cls(index=index_arrays[0], **kwargs)
         return cls(
-                index=zip(*index_arrays),
-                index_constructor=IndexHierarchy.from_labels,
+                index=IndexHierarchy.from_arrays(index_arrays),
+                own_index=True,
                 **kwargs
                 )
 
@@ -2455,6 +2559,13 @@ class Frame(ContainerOperand):
                 blocks_to_container=blocks_to_container,
                 )
 
+    @property
+    def via_lazy(self) -> LazyExpression:
+        '''
+        Interface for deferring operators applied to this container; call ``evaluate()`` on the resulting expression to align all containers once and apply operators, reusing intermediate arrays.
+        '''
+        return LazyExpression(None, (self,))
+
     @property
     def via_dt(self) -> InterfaceDatetime['Frame']:
         '''
@@ -2490,7 +2601,8 @@ class Frame(ContainerOperand):
             container=self,
             function_values=self._axis_array,
             function_items=self._axis_array_items,
-            yield_type=IterNodeType.VALUES
+            yield_type=IterNodeType.VALUES,
+            function_vectorized=self._axis_array_vectorized,
             )
 
     @property
@@ -2529,7 +2641,8 @@ class Frame(ContainerOperand):
             container=self,
             function_values=self._axis_series,
             function_items=self._axis_series_items,
-            yield_type=IterNodeType.VALUES
+            yield_type=IterNodeType.VALUES,
+            function_vectorized=self._axis_array_vectorized,
             )
 
     @property
@@ -2551,6 +2664,7 @@ class Frame(ContainerOperand):
             container=self,
             function_values=self._axis_group_loc,
             function_items=self._axis_group_loc_items,
+            function_positions=self._axis_group_loc_positions,
             yield_type=IterNodeType.VALUES,
             apply_type=IterNodeApplyType.SERIES_ITEMS_FLAT,
             )
@@ -2561,6 +2675,7 @@ class Frame(ContainerOperand):
             container=self,
             function_values=self._axis_group_loc,
             function_items=self._axis_group_loc_items,
+            function_positions=self._axis_group_loc_positions,
             yield_type=IterNodeType.ITEMS,
             apply_type=IterNodeApplyType.SERIES_ITEMS_FLAT,
             )
@@ -2571,6 +2686,7 @@ class Frame(ContainerOperand):
             container=self,
             function_values=self._axis_group_labels,
             function_items=self._axis_group_labels_items,
+            function_positions=self._axis_group_labels_positions,
             yield_type=IterNodeType.VALUES,
             apply_type=IterNodeApplyType.SERIES_ITEMS_FLAT,
             )
@@ -2581,6 +2697,7 @@ class Frame(ContainerOperand):
             container=self,
             function_values=self._axis_group_labels,
             function_items=self._axis_group_labels_items,
+            function_positions=self._axis_group_labels_positions,
             yield_type=IterNodeType.ITEMS,
             apply_type=IterNodeApplyType.SERIES_ITEMS_FLAT,
             )
@@ -2639,7 +2756,9 @@ class Frame(ContainerOperand):
             function_values=self._iter_element_loc,
             function_items=self._iter_element_loc_items,
             yield_type=IterNodeType.VALUES,
-            apply_type=IterNodeApplyType.FRAME_ELEMENTS
+            apply_type=IterNodeApplyType.FRAME_ELEMENTS,
+            function_vectorized=self._iter_element_vectorized,
+            function_map=self._iter_element_vectorized,
             )
 
     @property
@@ -3614,27 +3733,31 @@ class Frame(ContainerOperand):
         elif operator.__name__ == 'rmatmul':
             return matmul(other, self)
 
-        #TODO: use equals on columns, index before calling reindex
-
         if isinstance(other, Frame):
             name = None
-            # reindex both dimensions to union indices
-            columns = self._columns.union(other._columns)
-            index = self._index.union(other._index)
-
-            # NOTE: always own column, index, as we will just extract Typeblocks
-            self_tb = self.reindex(
-                    columns=columns,
-                    index=index,
-                    own_index=True,
-                    own_columns=True)._blocks
-            # NOTE: we create columns from self._columns, and thus other can only own it if STATIC matches
-            own_columns = other.STATIC == self.STATIC
-            other_tb = other.reindex(
-                    columns=columns,
-                    index=index,
-                    own_index=True,
-                    own_columns=own_columns)._blocks
+            # align both dimensions to union indices; when labels already match, no union or reindexing is done
+            index, index_ic, index_ic_other = union_correspondence(
+                    self._index, other._index)
+            columns, columns_ic, columns_ic_other = union_correspondence(
+                    self._columns, other._columns)
+            shape = (len(index), len(columns))
+
+            self_tb = self._blocks
+            if index_ic is not None or columns_ic is not None:
+                self_tb = TypeBlocks.from_blocks(self_tb.resize_blocks(
+                        index_ic=index_ic,
+                        columns_ic=columns_ic,
+                        fill_value=np.nan),
+                        shape_reference=shape,
+                        )
+            other_tb = other._blocks
+            if index_ic_other is not None or columns_ic_other is not None:
+                other_tb = TypeBlocks.from_blocks(other_tb.resize_blocks(
+                        index_ic=index_ic_other,
+                        columns_ic=columns_ic_other,
+                        fill_value=np.nan),
+                        shape_reference=shape,
+                        )
             return self.__class__(self_tb._ufunc_binary_operator(
                             operator=operator,
                             other=other_tb),
@@ -3646,9 +3769,19 @@ class Frame(ContainerOperand):
         elif isinstance(other, Series):
             name = None
             # when operating on a Series, we treat it as a row-wise operation, and thus take the union of the Series.index and Frame.columns
-            columns = self._columns.union(other._index)
-            self_tb = self.reindex(columns=columns, own_columns=True)._blocks
-            other_array = other.reindex(columns, own_index=True).values
+            columns, columns_ic, columns_ic_other = union_correspondence(
+                    self._columns, other._index)
+            self_tb = self._blocks
+            if columns_ic is not None:
+                self_tb = TypeBlocks.from_blocks(self_tb.resize_blocks(
+                        index_ic=None,
+                        columns_ic=columns_ic,
+                        fill_value=np.nan),
+                        shape_reference=(self._blocks._shape[0], len(columns)),
+                        )
+            other_array = other.values
+            if columns_ic_other is not None:
+                other_array = columns_ic_other.resize_array(other_array, np.nan)
             return self.__class__(self_tb._ufunc_binary_operator(
                             operator=operator,
                             other=other_array),
@@ -3726,17 +3859,14 @@ class Frame(ContainerOperand):
 
         dtype = None if not dtypes else dtypes[0]
 
-        # assumed not composable for axis 1, full-shape processing requires processing contiguous values
-        v = self.values
-        if skipna:
-            post = ufunc_skipna(v, axis=axis, dtype=dtype)
-        else:
-            post = ufunc(v, axis=axis, dtype=dtype)
-
-        post.flags.writeable = False
-
         return self.__class__(
-                TypeBlocks.from_blocks(post),
+                self._blocks.ufunc_shape_skipna(
+                        axis=axis,
+                        skipna=skipna,
+                        ufunc=ufunc,
+                        ufunc_skipna=ufunc_skipna,
+                        dtype=dtype,
+                        ),
                 index=self._index,
                 columns=self._columns,
                 own_data=True,
@@ -3757,6 +3887,48 @@ class Frame(ContainerOperand):
         yield from zip(keys, self._blocks.axis_values(axis))
 
 
+    def _axis_array_vectorized(self,
+            func: AnyCallable,
+            *,
+            axis: int,
+            dtype: DtypeSpecifier = None,
+            name: NameType = None,
+            ) -> Series:
+        '''Call ``func`` with 2D arrays of chunks of rows (axis=1) or of transposed columns (axis=0), such that each row of each array is a value of array iteration, returning a Series of the concatenated results.
+        '''
+        if axis == 1:
+            count, width, index = self._blocks._shape[0], self._blocks._shape[1], self._index
+        elif axis == 0:
+            count, width, index = self._blocks._shape[1], self._blocks._shape[0], self._columns
+        else:
+            raise AxisInvalid(f'no support for axis {axis}')
+
+        chunk_size = max(1, ROW_CHUNK_ELEMENTS // max(1, width))
+        parts = []
+        for start in range(0, count, chunk_size):
+            key = slice(start, start + chunk_size)
+            if axis == 1:
+                if width == 0: # rows of no columns, as provided by array iteration
+                    chunk = np.empty((min(chunk_size, count - start), 0), dtype=DTYPE_FLOAT_DEFAULT)
+                else:
+                    chunk = self._blocks._extract_array(row_key=key)
+            else:
+                chunk = self._blocks._extract_array(column_key=key).T
+            parts.append(array_from_vectorized(func(chunk), len(chunk), dtype))
+
+        if not parts:
+            array = np.empty(0, dtype=dtype)
+        elif len(parts) == 1:
+            array = parts[0]
+        else:
+            array = np.concatenate(parts)
+
+        return Series(array,
+                index=index,
+                name=name,
+                own_index=index.STATIC,
+                )
+
     def _axis_tuple(self, axis: int) -> tp.NamedTuple:
         '''Generator of named tuples across an axis.
 
@@ -3926,6 +4098,24 @@ class Frame(ContainerOperand):
         yield from (x for _, x in self._axis_group_loc_items(key=key, axis=axis))
 
 
+    def _axis_group_loc_positions(self,
+            key: GetItemKeyType,
+            *,
+            axis: int = 0
+            ) -> tp.Tuple[np.ndarray, tp.List[tp.Tuple[tp.Hashable, int, int]]]:
+        '''
+        Return positions ordered by group and, for each group, the group with the start and stop of its positions, such that groups can be described without being extracted.
+        '''
+        if axis == 0: # row iterator, selecting columns for group by
+            iloc_key = self._columns.loc_to_iloc(key)
+        elif axis == 1: # column iterator, selecting rows for group by
+            iloc_key = self._index.loc_to_iloc(key)
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        groups, locations = self._blocks.group_locations(axis=axis, key=iloc_key)
+        return groups_to_positions(groups, locations)
+
     def _axis_group_labels_items(self,
             depth_level: DepthLevelSpecifier = 0,
             *,
@@ -3974,6 +4164,25 @@ class Frame(ContainerOperand):
         yield from (x for _, x in self._axis_group_labels_items(
                 depth_level=depth_level, axis=axis))
 
+    def _axis_group_labels_positions(self,
+            depth_level: DepthLevelSpecifier = 0,
+            *,
+            axis: int = 0,
+            ) -> tp.Tuple[np.ndarray, tp.List[tp.Tuple[tp.Hashable, int, int]]]:
+        '''
+        Return positions ordered by group and, for each group, the group with the start and stop of its positions, such that groups can be described without being extracted.
+        '''
+        if axis == 0: # maintain columns, group by index
+            ref_index = self._index
+        elif axis == 1: # maintain index, group by columns
+            ref_index = self._columns
+        else:
+            raise AxisInvalid(f'invalid axis: {axis}')
+
+        groups, locations = array_to_groups_and_locations(
+                ref_index.values_at_depth(depth_level))
+        return groups_to_positions(groups, locations)
+
     #---------------------------------------------------------------------------
     def _axis_window_items(self, *,
             size: int,
@@ -4052,6 +4261,29 @@ class Frame(ContainerOperand):
     def _iter_element_loc(self) -> tp.Iterator[tp.Any]:
         yield from (x for _, x in self._iter_element_loc_items())
 
+    def _iter_element_vectorized(self,
+            func: AnyCallable,
+            *,
+            dtype: DtypeSpecifier = None,
+            name: NameType = None,
+            ) -> 'Frame':
+        '''Call ``func`` with each column array, returning a Frame of the results.
+        '''
+        rows = self._blocks._shape[0]
+        blocks = TypeBlocks.from_blocks(
+                (array_from_vectorized(func(column), rows, dtype)
+                for column in self._blocks.axis_values(0)),
+                shape_reference=self._blocks._shape,
+                )
+        return self.__class__(blocks,
+                index=self._index,
+                columns=self._columns,
+                name=name,
+                own_data=True,
+                own_index=True,
+                own_columns=self.STATIC,
+                )
+
 
     #---------------------------------------------------------------------------
     # transformations resulting in the same dimensionality
@@ -4073,16 +4305,19 @@ class Frame(ContainerOperand):
         if self._index.depth > 1:
             v = self._index.values
             order = np.lexsort([v[:, i] for i in range(v.shape[1]-1, -1, -1)])
+            if not ascending:
+                order = order[::-1]
+            index_values = self._index.values[order]
+            index_values.flags.writeable = False
+            index = self._index.from_labels(index_values, name=self._index.name)
         else:
-            # argsort lets us do the sort once and reuse the results
-            order = np.argsort(self._index.values, kind=kind)
-
-        if not ascending:
-            order = order[::-1]
-
-        index_values = self._index.values[order]
-        index_values.flags.writeable = False
-        index = self._index.from_labels(index_values, name=self._index.name)
+            index = self._index.sort(ascending=ascending)
+            if index is self._index: # already sorted
+                return self if self.STATIC else self.__class__(self)
+            # the sort order of an Index is cached, letting us do the sort once and reuse the results
+            order = self._index._argsort()
+            if not ascending:
+                order = order[::-1]
 
         blocks = self._blocks.iloc[order]
         return self.__class__(blocks,
@@ -4103,16 +4338,19 @@ class Frame(ContainerOperand):
         if self._columns.depth > 1:
             v = self._columns.values
             order = np.lexsort([v[:, i] for i in range(v.shape[1]-1, -1, -1)])
+            if not ascending:
+                order = order[::-1]
+            columns_values = self._columns.values[order]
+            columns_values.flags.writeable = False
+            columns = self._columns.from_labels(columns_values,  name=self._columns.name)
         else:
-            # argsort lets us do the sort once and reuse the results
-            order = np.argsort(self._columns.values, kind=kind)
-
-        if not ascending:
-            order = order[::-1]
-
-        columns_values = self._columns.values[order]
-        columns_values.flags.writeable = False
-        columns = self._columns.from_labels(columns_values,  name=self._columns.name)
+            columns = self._columns.sort(ascending=ascending)
+            if columns is self._columns: # already sorted
+                return self
+            # the sort order of an Index is cached, letting us do the sort once and reuse the results
+            order = self._columns._argsort()
+            if not ascending:
+                order = order[::-1]
 
         blocks = self._blocks[order]
         return self.__class__(blocks,
@@ -4126,7 +4364,7 @@ class Frame(ContainerOperand):
     def sort_values(self,
             key: KeyOrKeys,
             *,
-            ascending: bool = True,
+            ascending: tp.Union[bool, tp.Iterable[bool]] = True,
             axis: int = 1,
             kind: str = DEFAULT_SORT_KIND) -> 'Frame':
         '''
@@ -4134,36 +4372,32 @@ class Frame(ContainerOperand):
 
         Args:
             key: a key or iterable of keys.
+            ascending: a Boolean, or an iterable of Booleans, one for each key, specifying the direction of each key. Sorting is stable in either direction.
         '''
-        # argsort lets us do the sort once and reuse the results
         if axis == 0: # get a column ordering based on one or more rows
-            col_count = self._columns.__len__()
-            if is_hashable(key) and key in self._index:
-                iloc_key = self._index.loc_to_iloc(key)
-                sort_array = self._blocks._extract_array(row_key=iloc_key)
-                order = np.argsort(sort_array, kind=kind)
-            else: # assume an iterable of keys
-                # order so that highest priority is last
-                iloc_keys = (self._index.loc_to_iloc(k) for k in reversed_iter(key))
-                sort_array = [self._blocks._extract_array(row_key=key)
-                        for key in iloc_keys]
-                order = np.lexsort(sort_array)
+            labels = self._index
+            extract = lambda iloc_key: self._blocks._extract_array(row_key=iloc_key)
         elif axis == 1: # get a row ordering based on one or more columns
-            if is_hashable(key) and key in self._columns:
-                iloc_key = self._columns.loc_to_iloc(key)
-                sort_array = self._blocks._extract_array(column_key=iloc_key)
-                order = np.argsort(sort_array, kind=kind)
-            else: # assume an iterable of keys
-                # order so that highest priority is last
-                iloc_keys = (self._columns.loc_to_iloc(k) for k in reversed_iter(key))
-                sort_array = [self._blocks._extract_array(column_key=key)
-                        for key in iloc_keys]
-                order = np.lexsort(sort_array)
+            labels = self._columns
+            extract = lambda iloc_key: self._blocks._extract_array(column_key=iloc_key)
         else:
             raise AxisInvalid(f'invalid axis: {axis}')
 
-        if not ascending:
-            order = order[::-1]
+        if is_hashable(key) and key in labels:
+            keys: tp.Sequence[tp.Hashable] = (key,)
+        else: # assume an iterable of keys
+            keys = tuple(key)
+
+        if isinstance(ascending, (bool, np.bool_)):
+            asc: tp.Sequence[bool] = (ascending,) * len(keys)
+        else:
+            asc = tuple(ascending)
+            if len(asc) != len(keys):
+                raise RuntimeError(f'number of ascending values ({len(asc)}) does not match number of keys ({len(keys)})')
+
+        # argsort lets us do the sort once and reuse the results for the index and the blocks
+        sort_arrays = [extract(labels.loc_to_iloc(k)) for k in keys]
+        order = argsort_keys(sort_arrays, asc, kind=kind)
 
         if axis == 0:
             column_values = self._columns.values[order]
@@ -4196,6 +4430,57 @@ class Frame(ContainerOperand):
                 own_index=True
                 )
 
+    def _key_to_sort_arrays(self, key: KeyOrKeys) -> tp.List[np.ndarray]:
+        '''
+        Given a column label or iterable of column labels, return the column arrays in order of priority.
+        '''
+        if is_hashable(key) and key in self._columns:
+            keys: tp.Iterable[tp.Hashable] = (key,)
+        else:
+            keys = key
+        return [self._blocks._extract_array(column_key=self._columns.loc_to_iloc(k))
+                for k in keys]
+
+    def iloc_nlargest(self, key: KeyOrKeys, *, count: int = 5) -> np.ndarray:
+        '''
+        Return the integer positions of the ``count`` rows with the largest values, ordered from largest, where values are given by a column or an iterable of columns (in order of priority). Rows with missing values in those columns are excluded; ties are selected and ordered by position.
+
+        Args:
+            key: a key or iterable of keys.
+            count: the number of rows to select.
+        '''
+        return argnlargest(self._key_to_sort_arrays(key), count)
+
+    def iloc_nsmallest(self, key: KeyOrKeys, *, count: int = 5) -> np.ndarray:
+        '''
+        Return the integer positions of the ``count`` rows with the smallest values, ordered from smallest, where values are given by a column or an iterable of columns (in order of priority). Rows with missing values in those columns are excluded; ties are selected and ordered by position.
+
+        Args:
+            key: a key or iterable of keys.
+            count: the number of rows to select.
+        '''
+        return argnsmallest(self._key_to_sort_arrays(key), count)
+
+    def nlargest(self, key: KeyOrKeys, *, count: int = 5) -> 'Frame':
+        '''
+        Return a new :obj:`Frame` of the ``count`` rows with the largest values, ordered from largest, where values are given by a column or an iterable of columns. Unlike ``sort_values``, only the selected rows are sorted.
+
+        Args:
+            key: a key or iterable of keys.
+            count: the number of rows to select.
+        '''
+        return self._extract(row_key=self.iloc_nlargest(key, count=count))
+
+    def nsmallest(self, key: KeyOrKeys, *, count: int = 5) -> 'Frame':
+        '''
+        Return a new :obj:`Frame` of the ``count`` rows with the smallest values, ordered from smallest, where values are given by a column or an iterable of columns. Unlike ``sort_values``, only the selected rows are sorted.
+
+        Args:
+            key: a key or iterable of keys.
+            count: the number of rows to select.
+        '''
+        return self._extract(row_key=self.iloc_nsmallest(key, count=count))
+
     def isin(self, other: tp.Any) -> 'Frame':
         '''
         Return a same-sized Boolean :obj:`Frame` that shows if the same-positioned element is in the passed iterable.
@@ -6212,6 +6497,9 @@ class FrameGO(Frame):
     _COLUMNS_CONSTRUCTOR = IndexGO
     _COLUMNS_HIERARCHY_CONSTRUCTOR = IndexHierarchyGO
 
+    # number of trailing 1D blocks of the same dtype consolidated as columns are added; if less than 2, no consolidation is done until calling to_frame() or to_frame_go()
+    CONSOLIDATE_COUNT = 64
+
 
     def __setitem__(self,
             key: tp.Hashable,
@@ -6254,6 +6542,7 @@ class FrameGO(Frame):
         # Wait until after extracting block from value before updating _columns, as value evaluation might fail.
         self._columns.append(key)
         self._blocks.append(block)
+        self._blocks.consolidate_trailing(self.CONSOLIDATE_COUNT)
 
 
     def extend_items(self,
@@ -6298,6 +6587,7 @@ class FrameGO(Frame):
         elif isinstance(container, Series):
             self._columns.append(container.name)
             self._blocks.append(container.values)
+            self._blocks.consolidate_trailing(self.CONSOLIDATE_COUNT)
 
         # this should never happen, and is hard to test!
         assert len(self._columns) == self._blocks._shape[1] #pragma: no cover
@@ -6307,7 +6597,8 @@ class FrameGO(Frame):
     def _to_frame(self,
             constructor: tp.Type[ContainerOperand]
             ) -> Frame:
-        return constructor(self._blocks.copy(),
+        # adjacent blocks of the same dtype are consolidated, such that a Frame built by adding many columns does not retain many 1D blocks
+        return constructor(self._blocks.consolidate(),
                 index=self.index,
                 columns=self.columns.values,
                 name=self._name,
@@ -0,0 +1,291 @@
+
+import typing as tp
+
+import numpy as np
+
+from static_frame.core.container_util import get_col_dtype_factory
+from static_frame.core.container_util import index_from_optional_constructor
+from static_frame.core.frame import Frame
+from static_frame.core.index import Index
+from static_frame.core.index import PositionsAllocator
+from static_frame.core.index_base import IndexBase
+from static_frame.core.node_selector import InterfaceSetItem
+from static_frame.core.series import Series
+from static_frame.core.type_blocks import TypeBlocks
+from static_frame.core.util import DTYPE_BOOL_KIND
+from static_frame.core.util import DTYPE_COMPLEX_KIND
+from static_frame.core.util import DTYPE_FLOAT_DEFAULT
+from static_frame.core.util import DTYPE_FLOAT_KIND
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_INT_KINDS
+from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import DTYPE_OBJECT_KIND
+from static_frame.core.util import DTYPE_STR_KINDS
+from static_frame.core.util import DtypesSpecifier
+from static_frame.core.util import FILL_VALUE_DEFAULT
+from static_frame.core.util import GetItemKeyType
+from static_frame.core.util import IndexConstructor
+from static_frame.core.util import IndexInitializer
+from static_frame.core.util import NameType
+from static_frame.core.util import NULL_SLICE
+
+# kinds for which assigned values must be safely cast, or, if of a wider dtype, be within the range of the column dtype
+DTYPE_BUILDER_NUMERIC_KINDS = (DTYPE_BOOL_KIND, *DTYPE_INT_KINDS, DTYPE_FLOAT_KIND, DTYPE_COMPLEX_KIND)
+# flexible kinds that, if given without an itemsize, are stored as objects until the Frame is produced
+DTYPE_BUILDER_FLEXIBLE_KINDS = (*DTYPE_STR_KINDS, 'V')
+
+
+class FrameBuilder:
+    '''
+    Build a :obj:`Frame` of known index, columns, and column dtypes by assigning, in place, to preallocated blocks, one for each contiguous run of columns of the same dtype. The :obj:`Frame` is produced from those blocks without a copy, except for flexible dtypes (such as ``str``) given without an itemsize: these are stored as objects and sized to the assigned values when the :obj:`Frame` is produced.
+    '''
+
+    __slots__ = (
+            '_index',
+            '_columns',
+            '_name',
+            '_blocks',
+            '_block_dtypes',
+            '_block_of_column',
+            '_column_in_block',
+            '_frozen',
+            )
+
+    _index: IndexBase
+    _columns: IndexBase
+    _name: NameType
+    _blocks: tp.List[np.ndarray]
+    _block_dtypes: tp.List[np.dtype]
+    _block_of_column: np.ndarray
+    _column_in_block: np.ndarray
+    _frozen: bool
+
+    def __init__(self, *,
+            index: IndexInitializer,
+            columns: IndexInitializer,
+            dtypes: tp.Union[DtypesSpecifier, np.dtype, type, str] = None,
+            fill_value: object = FILL_VALUE_DEFAULT,
+            name: NameType = None,
+            index_constructor: tp.Optional[IndexConstructor] = None,
+            columns_constructor: tp.Optional[IndexConstructor] = None,
+            ) -> None:
+        '''
+        Args:
+            index: An :obj:`Index` or index initializer.
+            columns: An :obj:`Index` or columns initializer.
+            dtypes: A single dtype for all columns, or an iterable or mapping of dtypes per column; columns without a dtype are float.
+            fill_value: A value with which to initialize all blocks; if not provided, values not assigned are undefined.
+            name: A name for the :obj:`Frame`.
+        '''
+        self._index = index_from_optional_constructor(index,
+                default_constructor=Index,
+                explicit_constructor=index_constructor,
+                )
+        self._columns = index_from_optional_constructor(columns,
+                default_constructor=Frame._COLUMNS_CONSTRUCTOR,
+                explicit_constructor=columns_constructor,
+                )
+        self._name = name
+        self._frozen = False
+
+        column_count = len(self._columns)
+        if dtypes is None or isinstance(dtypes, (np.dtype, type, str)):
+            dtype = DTYPE_FLOAT_DEFAULT if dtypes is None else np.dtype(dtypes)
+            column_dtypes = [dtype] * column_count
+        else:
+            get_col_dtype = get_col_dtype_factory(dtypes, self._columns) #type: ignore
+            column_dtypes = []
+            for i in range(column_count):
+                dtype = get_col_dtype(i)
+                column_dtypes.append(DTYPE_FLOAT_DEFAULT if dtype is None else np.dtype(dtype))
+
+        # allocate one block per contiguous run of columns of the same dtype
+        row_count = len(self._index)
+        self._blocks = []
+        self._block_dtypes = []
+        self._block_of_column = np.empty(column_count, dtype=DTYPE_INT_DEFAULT)
+        self._column_in_block = np.empty(column_count, dtype=DTYPE_INT_DEFAULT)
+        start = 0
+        while start < column_count:
+            dtype = column_dtypes[start]
+            stop = start + 1
+            while stop < column_count and column_dtypes[stop] == dtype:
+                stop += 1
+            shape = (row_count, stop - start)
+            if dtype.kind in DTYPE_BUILDER_FLEXIBLE_KINDS and dtype.itemsize == 0:
+                dtype_storage = DTYPE_OBJECT
+            else:
+                dtype_storage = dtype
+            if fill_value is FILL_VALUE_DEFAULT:
+                block = np.empty(shape, dtype=dtype_storage)
+            else:
+                block = np.full(shape, fill_value, dtype=dtype_storage)
+            self._block_of_column[start: stop] = len(self._blocks)
+            self._column_in_block[start: stop] = PositionsAllocator.get(stop - start)
+            self._blocks.append(block)
+            self._block_dtypes.append(dtype)
+            start = stop
+
+    #---------------------------------------------------------------------------
+    @property
+    def shape(self) -> tp.Tuple[int, int]:
+        '''
+        Return a tuple describing the shape of the :obj:`Frame` to be built.
+        '''
+        return len(self._index), len(self._columns)
+
+    @property
+    def index(self) -> IndexBase:
+        '''
+        The index of the :obj:`Frame` to be built.
+        '''
+        return self._index
+
+    @property
+    def columns(self) -> IndexBase:
+        '''
+        The columns of the :obj:`Frame` to be built.
+        '''
+        return self._columns
+
+    #---------------------------------------------------------------------------
+    # assignment
+
+    @staticmethod
+    def _validate_value(dtype: np.dtype, value: tp.Any) -> None:
+        '''
+        Raise if assigning ``value`` to a block of ``dtype`` would lose information, such as by truncating a float assigned to an integer, an integer out of the range of a narrower integer, or a string longer than the itemsize. Values of a wider numeric dtype are accepted if within the range of ``dtype``.
+        '''
+        if dtype.kind == DTYPE_OBJECT_KIND:
+            return
+        is_numeric = dtype.kind in DTYPE_BUILDER_NUMERIC_KINDS
+        if not is_numeric and dtype.kind not in DTYPE_STR_KINDS:
+            return
+
+        array = value if isinstance(value, np.ndarray) else np.asarray(value)
+        if array.dtype == DTYPE_OBJECT:
+            # discover the type of the elements
+            array = np.array(array.tolist())
+
+        if is_numeric:
+            if np.can_cast(array.dtype, dtype, 'safe'):
+                return
+            kind = array.dtype.kind
+            if kind in DTYPE_INT_KINDS and dtype.kind in DTYPE_INT_KINDS:
+                info = np.iinfo(dtype)
+                values = array
+            elif kind in DTYPE_INT_KINDS + (DTYPE_FLOAT_KIND,) and dtype.kind == DTYPE_FLOAT_KIND:
+                # NaN and infinite values can be represented at any precision
+                info = np.finfo(dtype)
+                values = array[np.isfinite(array)] if kind == DTYPE_FLOAT_KIND else array
+            else:
+                raise RuntimeError(f'cannot assign values of dtype {array.dtype} to a column of dtype {dtype} without loss')
+            if values.size and (values.min() < info.min or values.max() > info.max):
+                raise RuntimeError(f'cannot assign values of dtype {array.dtype} to a column of dtype {dtype}: values out of range')
+        elif np.asarray(array, dtype=dtype.char).dtype.itemsize > dtype.itemsize:
+            raise RuntimeError(f'cannot assign values of dtype {array.dtype} to a column of dtype {dtype} without truncation')
+
+    def _assign_iloc(self, key: GetItemKeyType, value: tp.Any) -> None:
+        '''
+        Assign ``value`` in place, where ``key`` is a row key or a pair of row and column keys. Values are cast to the dtype of each column. A ``value`` spanning multiple columns of different dtypes is split by column.
+        '''
+        if self._frozen:
+            raise RuntimeError('cannot assign after a Frame has been produced')
+
+        if isinstance(key, tuple):
+            row_key, column_key = key
+        else:
+            row_key, column_key = key, NULL_SLICE
+
+        if isinstance(value, Series):
+            value = value.values
+
+        if isinstance(column_key, (int, np.integer)):
+            block = self._blocks[self._block_of_column[column_key]]
+            self._validate_value(block.dtype, value)
+            block[row_key, self._column_in_block[column_key]] = value
+            return
+
+        columns = PositionsAllocator.get(len(self._columns))[column_key]
+        if not len(columns):
+            return
+        blocks = self._block_of_column[columns]
+
+        if blocks[0] == blocks[-1] and (blocks == blocks[0]).all():
+            parts: tp.Iterable[tp.Tuple[int, np.ndarray, tp.Any]] = ((blocks[0], columns, value),)
+        else:
+            if not isinstance(value, np.ndarray) and hasattr(value, '__len__'):
+                value = np.array(value, dtype=object)
+            # a value with a dimension for columns is split by column
+            split = isinstance(value, np.ndarray) and value.ndim > 0
+            split_2d = split and value.ndim == 2
+            parts = ((block_idx,
+                    columns[blocks == block_idx],
+                    (value[:, blocks == block_idx] if split_2d
+                            else value[blocks == block_idx] if split
+                            else value),
+                    ) for block_idx in np.unique(blocks))
+
+        for block_idx, columns_part, value_part in parts:
+            self._validate_value(self._blocks[block_idx].dtype, value_part)
+            columns_in_block = self._column_in_block[columns_part]
+            start = columns_in_block[0]
+            if len(columns_in_block) == 1 or (np.diff(columns_in_block) == 1).all():
+                # contiguous columns can be assigned with a slice
+                self._blocks[block_idx][row_key, start: start + len(columns_in_block)] = value_part
+            else:
+                self._blocks[block_idx][row_key, columns_in_block] = value_part
+
+    def _assign_loc(self, key: GetItemKeyType, value: tp.Any) -> None:
+        if isinstance(key, tuple):
+            row_key, column_key = key
+            key = (self._index.loc_to_iloc(row_key),
+                    self._columns.loc_to_iloc(column_key))
+        else:
+            key = self._index.loc_to_iloc(key)
+        self._assign_iloc(key, value)
+
+    def __setitem__(self, key: GetItemKeyType, value: tp.Any) -> None:
+        '''
+        Assign ``value`` in place to all rows of the columns selected by label.
+        '''
+        self._assign_iloc((NULL_SLICE, self._columns.loc_to_iloc(key)), value)
+
+    @property
+    def loc(self) -> InterfaceSetItem['Frame']:
+        return InterfaceSetItem(self._assign_loc)
+
+    @property
+    def iloc(self) -> InterfaceSetItem['Frame']:
+        return InterfaceSetItem(self._assign_iloc)
+
+    #---------------------------------------------------------------------------
+    # export
+
+    def to_frame(self) -> Frame:
+        '''
+        Return a :obj:`Frame` that owns the assigned blocks. After calling this, no further assignment is permitted.
+        '''
+        self._frozen = True
+        row_count = len(self._index)
+
+        def blocks() -> tp.Iterator[np.ndarray]:
+            for block, dtype in zip(self._blocks, self._block_dtypes):
+                if block.dtype != dtype:
+                    # objects stored for a flexible dtype are sized to the values; void is derived from bytes
+                    if dtype.kind == 'V':
+                        block = block.astype(np.bytes_)
+                    block = block.astype(dtype)
+                if block.shape[1] == 1:
+                    block = block.reshape(row_count)
+                block.flags.writeable = False
+                yield block
+
+        return Frame(TypeBlocks.from_blocks(blocks()),
+                index=self._index,
+                columns=self._columns,
+                name=self._name,
+                own_data=True,
+                own_index=True,
+                own_columns=True,
+                )
@@ -55,6 +55,7 @@ from static_frame.core.util import INT_TYPES
 from static_frame.core.util import intersect1d
 from static_frame.core.util import isin
 from static_frame.core.util import isna_array
+from static_frame.core.util import monotonic_1d
 from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import KEY_ITERABLE_TYPES
 from static_frame.core.util import KeyIterableTypes
@@ -64,6 +65,7 @@ from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import name_filter
 from static_frame.core.util import NameType
 from static_frame.core.util import NULL_SLICE
+from static_frame.core.util import positions_unique
 from static_frame.core.util import resolve_dtype
 from static_frame.core.util import setdiff1d
 from static_frame.core.util import SLICE_ATTRS
@@ -296,11 +298,15 @@ class PositionsAllocator:
 
 #-------------------------------------------------------------------------------
 _INDEX_SLOTS = (
-        '_map',
+        '_map_store',
+        '_map_deferred',
         '_labels',
         '_positions',
         '_recache',
-        '_name'
+        '_name',
+        '_monotonic_cache',
+        '_has_na_cache',
+        '_argsort_cache',
         )
 
 class Index(IndexBase):
@@ -320,11 +326,15 @@ class Index(IndexBase):
     # for compatability with IndexHierarchy, where this is implemented as a property method
     depth: int = 1
 
-    _map: tp.Optional[FrozenAutoMap]
+    _map_store: tp.Optional[FrozenAutoMap]
+    _map_deferred: bool
     _labels: np.ndarray
     _positions: np.ndarray
     _recache: bool
     _name: NameType
+    _monotonic_cache: tp.Tuple[tp.Optional[bool], tp.Optional[bool]]
+    _has_na_cache: tp.Optional[bool]
+    _argsort_cache: tp.Optional[np.ndarray]
 
     #---------------------------------------------------------------------------
     # methods used in __init__ that are customized in dervied classes; there, we need to mutate instance state, this these are instance methods
@@ -388,6 +398,27 @@ class Index(IndexBase):
         '''
         return cls(labels, name=name)
 
+    @classmethod
+    def _from_unique_labels(cls: tp.Type[I],
+            labels: np.ndarray,
+            *,
+            name: NameType = None
+            ) -> I:
+        '''
+        Construct a static ``Index`` from an immutable array of labels already known to be unique and of an appropriate dtype, such as a selection from an existing ``Index``. Creation of the mapping is deferred until first needed.
+        '''
+        index = cls.__new__(cls)
+        index._recache = False
+        index._map_store = None
+        index._map_deferred = True
+        index._labels = immutable_filter(labels)
+        index._positions = PositionsAllocator.get(len(labels))
+        index._name = name
+        index._monotonic_cache = (None, None)
+        index._has_na_cache = None
+        index._argsort_cache = None
+        return index
+
     #---------------------------------------------------------------------------
     @doc_inject(selector='index_init')
     def __init__(self,
@@ -402,7 +433,11 @@ class Index(IndexBase):
         {args}
         '''
         self._recache: bool = False
-        self._map: tp.Optional[FrozenAutoMap] = None
+        self._map_store: tp.Optional[FrozenAutoMap] = None
+        self._map_deferred: bool = False
+        self._monotonic_cache = (None, None)
+        self._has_na_cache = None
+        self._argsort_cache = None
 
         positions = None
         is_typed = self._DTYPE is not None # only True for datetime64 indices
@@ -427,11 +462,12 @@ class Index(IndexBase):
             if isinstance(labels, Index): # not an IndexHierarchy
                 if (labels.STATIC and self.STATIC and dtype is None):
                     if not is_typed or (is_typed and self._DTYPE == labels.dtype):
-                        # can take the map if static and if types in the dict are the same as those in the labels (or to become the labels after conversion)
-                        self._map = labels._map
+                        # can take the map if static and if types in the dict are the same as those in the labels (or to become the labels after conversion); if the map has not yet been created, creation remains deferred
+                        self._map_store = labels._map_store
+                        self._map_deferred = labels._map_deferred
                 # get a reference to the immutable arrays, even if this is an IndexGO index, we can take the cached arrays, assuming they are up to date; for datetime64 indices, we might need to translate to a different type
                 positions = labels._positions
-                loc_is_iloc = labels._map is None
+                loc_is_iloc = labels._map_store is None and not labels._map_deferred
                 labels = labels._labels
             else: # IndexHierarchy
                 # will be a generator of tuples; already updated caches
@@ -458,7 +494,9 @@ class Index(IndexBase):
 
         self._name = None if name is NAME_DEFAULT else name_filter(name)
 
-        if self._map is None: # if _map not shared from another Index
+        if self._map_deferred: # deferred map shared from another Index
+            size = len(labels) #type: ignore
+        elif self._map_store is None: # if _map not shared from another Index
             if not loc_is_iloc:
                 try:
                     self._map = FrozenAutoMap(labels) if self.STATIC else AutoMap(labels)
@@ -475,10 +513,10 @@ class Index(IndexBase):
                 if positions is None:
                     positions = PositionsAllocator.get(size)
         else: # map shared from another Index
-            size = len(self._map)
+            size = len(self._map_store)
 
         # this might be NP array, or a list, depending on if static or grow only; if an array, dtype will be compared with passed dtype_extract
-        self._labels = self._extract_labels(self._map, labels, dtype_extract)
+        self._labels = self._extract_labels(self._map_store, labels, dtype_extract)
         self._positions = self._extract_positions(size, positions)
 
         if self._DTYPE and self._labels.dtype != self._DTYPE:
@@ -486,6 +524,21 @@ class Index(IndexBase):
                     self._labels.dtype, self._DTYPE)
 
 
+    #---------------------------------------------------------------------------
+    @property
+    def _map(self) -> tp.Optional[FrozenAutoMap]:
+        '''The mapping of labels to positions, or None if loc_is_iloc. If creation of the mapping was deferred, it is created on first access.
+        '''
+        if self._map_deferred:
+            self._map_store = FrozenAutoMap(self._labels)
+            self._map_deferred = False
+        return self._map_store
+
+    @_map.setter
+    def _map(self, value: tp.Optional[FrozenAutoMap]) -> None:
+        self._map_store = value
+        self._map_deferred = False
+
     #---------------------------------------------------------------------------
     def __setstate__(self, state: tp.Tuple[None, tp.Dict[str, tp.Any]]) -> None:
         '''
@@ -954,22 +1007,42 @@ class Index(IndexBase):
         if self._recache:
             self._update_array_cache()
 
+        # a selection that cannot repeat positions retains uniqueness; if static and not loc_is_iloc, map creation can be deferred
+        unique = False
+        ordered = False # if the selection retains the order of labels
         if key is None:
             labels = self._labels
+            ordered = True
         elif isinstance(key, slice):
             if key == NULL_SLICE:
                 labels = self._labels
             else:
                 # if labels is an np array, this will be a view; if a list, a copy
                 labels = self._labels[key]
+                unique = True
+            ordered = key.step is None or key.step > 0
         elif isinstance(key, KEY_ITERABLE_TYPES):
             # we assume Booleans have been normalized to integers here
             # can select directly from _labels[key] if if key is a list
             labels = self._labels[key]
+            if isinstance(key, np.ndarray):
+                unique = key.dtype == DTYPE_BOOL or positions_unique(key)
         else: # select a single label value
             return self._labels[key] #type: ignore
 
-        return self.__class__(labels=labels, name=self._name)
+        if (unique
+                and self.STATIC
+                and (self._map_deferred or self._map_store is not None)):
+            index = self._from_unique_labels(labels, name=self._name)
+        else:
+            index = self.__class__(labels=labels, name=self._name)
+
+        # sortedness, and the absence of missing values, are retained by ordered selections
+        if ordered:
+            index._monotonic_cache = tuple(m or None for m in self._monotonic_cache) #type: ignore
+        if self._has_na_cache is False:
+            index._has_na_cache = False
+        return index
 
     def _extract_loc(self: I,
             key: GetItemKeyType
@@ -1130,6 +1203,11 @@ class Index(IndexBase):
         if compare_dtype and self.dtype != other.dtype:
             return False
 
+        # static indices sharing labels, or an immutable mapping of labels, have the same labels
+        if self.STATIC and other.STATIC and (self._labels is other._labels
+                or (self._map_store is not None and self._map_store is other._map_store)):
+            return True
+
         eq = self.values == other.values
 
         # NOTE: will only be False, or an array
@@ -1145,6 +1223,57 @@ class Index(IndexBase):
             return False
         return True
 
+    #---------------------------------------------------------------------------
+    # sortedness and missing values; as labels are immutable, these are computed once and cached
+
+    def _update_monotonic_cache(self) -> None:
+        if self._recache:
+            self._update_array_cache()
+        if None in self._monotonic_cache:
+            self._monotonic_cache = monotonic_1d(self._labels)
+
+    @property
+    def is_monotonic_increasing(self) -> bool:
+        '''
+        True if labels are increasing.
+        '''
+        self._update_monotonic_cache()
+        return self._monotonic_cache[0] #type: ignore
+
+    @property
+    def is_monotonic_decreasing(self) -> bool:
+        '''
+        True if labels are decreasing.
+        '''
+        self._update_monotonic_cache()
+        return self._monotonic_cache[1] #type: ignore
+
+    @property
+    def has_na(self) -> bool:
+        '''
+        True if any labels are NaN, NaT, or None.
+        '''
+        if self._recache:
+            self._update_array_cache()
+        if self._has_na_cache is None:
+            self._has_na_cache = bool(isna_array(self._labels).any())
+        return self._has_na_cache
+
+    def _argsort(self) -> np.ndarray:
+        '''
+        Return the positions that sort the labels ascending. As labels are unique, the order is the same for every sort algorithm.
+        '''
+        if self._recache:
+            self._update_array_cache()
+        if self._argsort_cache is None:
+            if self.is_monotonic_increasing:
+                self._argsort_cache = self._positions
+            else:
+                order = np.argsort(self._labels, kind=DEFAULT_SORT_KIND)
+                order.flags.writeable = False
+                self._argsort_cache = order
+        return self._argsort_cache
+
     def sort(self,
             ascending: bool = True,
             kind: str = DEFAULT_SORT_KIND) -> 'Index':
@@ -1153,13 +1282,22 @@ class Index(IndexBase):
         Args:
             kind: Sort algorithm passed to NumPy.
         '''
-        # force usage of property for caching
-        v = np.sort(self.values, kind=kind)
+        if ascending and self.is_monotonic_increasing:
+            return self if self.STATIC else self.copy()
+        if not ascending and self.is_monotonic_decreasing:
+            return self if self.STATIC else self.copy()
+
+        order = self._argsort()
         if not ascending:
-            v = v[::-1]
+            order = order[::-1]
 
+        v = self._labels[order]
         v.flags.writeable = False
-        return self.__class__(v, name=self._name)
+        index = self.__class__(v, name=self._name)
+        if not self.has_na: # missing values are not ordered
+            index._monotonic_cache = (True, None) if ascending else (None, True)
+            index._has_na_cache = False
+        return index
 
     def isin(self, other: tp.Iterable[tp.Any]) -> np.ndarray:
         '''
@@ -1237,11 +1375,15 @@ class Index(IndexBase):
 
 #-------------------------------------------------------------------------------
 _INDEX_GO_SLOTS = (
-        '_map',
+        '_map_store',
+        '_map_deferred',
         '_labels',
         '_positions',
         '_recache',
         '_name',
+        '_monotonic_cache',
+        '_has_na_cache',
+        '_argsort_cache',
         '_labels_mutable',
         '_labels_mutable_dtype',
         '_positions_mutable_count',
@@ -1300,6 +1442,9 @@ class _IndexGOMixin:
                 dtype=self._labels_mutable_dtype)
         self._positions = PositionsAllocator.get(self._positions_mutable_count)
         self._recache = False
+        self._monotonic_cache = (None, None)
+        self._has_na_cache = None
+        self._argsort_cache = None
 
     #---------------------------------------------------------------------------
     # grow only mutation
@@ -5,6 +5,8 @@ import numpy as np
 
 from static_frame.core.util import array2d_to_tuples
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import full_for_fill
 from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import intersect1d
 from static_frame.core.util import intersect2d
@@ -12,6 +14,7 @@ from static_frame.core.util import intersect2d
 if tp.TYPE_CHECKING:
 
     from static_frame.core.index import Index  # pylint: disable = W0611 #pragma: no cover
+    from static_frame.core.index_base import IndexBase  # pylint: disable = W0611 #pragma: no cover
 
 
 class IndexCorrespondence:
@@ -117,6 +120,42 @@ class IndexCorrespondence:
                 size=size)
 
 
+    @classmethod
+    def from_union(cls,
+            src_index: 'IndexBase',
+            dst_index: 'IndexBase') -> 'IndexCorrespondence':
+        '''
+        Return an IndexCorrespondence instance where ``dst_index`` is known to contain all labels in ``src_index``, as when ``dst_index`` is a union including ``src_index``. This avoids finding common labels: all source positions are transferred, and only the source labels are looked up in the destination.
+        '''
+        if (src_index.depth != 1
+                or dst_index.depth != 1
+                # NaN labels cannot be found with loc_to_iloc
+                or src_index.has_na #type: ignore
+                or dst_index.has_na #type: ignore
+                ):
+            return cls.from_correspondence(src_index, dst_index) #type: ignore
+
+        size = len(dst_index)
+        if not len(src_index):
+            return cls(has_common=False,
+                    is_subset=False,
+                    iloc_src=None,
+                    iloc_dst=None,
+                    size=size)
+
+        values_src = src_index.values
+        if values_src.dtype == DTYPE_BOOL:
+            # avoid a Boolean selection with loc_to_iloc
+            iloc_dst = dst_index.loc_to_iloc(values_src.tolist())
+        else:
+            iloc_dst = dst_index.loc_to_iloc(values_src)
+
+        return cls(has_common=True,
+                is_subset=False,
+                iloc_src=np.arange(len(src_index), dtype=DTYPE_INT_DEFAULT),
+                iloc_dst=iloc_dst,
+                size=size)
+
     def __init__(self,
             has_common: bool,
             is_subset: bool,
@@ -142,3 +181,37 @@ class IndexCorrespondence:
         Convert an iloc iterable of integers into one that is combitable with fancy indexing.
         '''
         return [[x] for x in self.iloc_src] #type: ignore
+
+    def resize_array(self,
+            array: np.ndarray,
+            fill_value: object,
+            ) -> np.ndarray:
+        '''
+        Return an immutable array, of one or two dimensions, with rows of ``array`` (aligned to the source) moved to their positions in the destination, filling others with ``fill_value``.
+        '''
+        if self.is_subset: # must have some common
+            values = array[self.iloc_src]
+        else:
+            shape = self.size if array.ndim == 1 else (self.size, array.shape[1])
+            values = full_for_fill(array.dtype, shape, fill_value)
+            # if some intersection of values
+            if self.has_common:
+                values[self.iloc_dst] = array[self.iloc_src]
+        values.flags.writeable = False
+        return values
+
+
+def union_correspondence(
+        index: 'IndexBase',
+        other: 'IndexBase',
+        ) -> tp.Tuple['IndexBase', tp.Optional[IndexCorrespondence], tp.Optional[IndexCorrespondence]]:
+    '''
+    Return the union of two indices and, for each index, an IndexCorrespondence to the union, or None if the index already has the labels of the union. Identical or equal indices are detected without forming a union.
+    '''
+    if index is other or index.equals(other, compare_dtype=True):
+        return index, None, None
+
+    union = index.union(other)
+    index_ic = None if union.equals(index) else IndexCorrespondence.from_union(index, union)
+    other_ic = None if union.equals(other) else IndexCorrespondence.from_union(other, union)
+    return union, index_ic, other_ic
@@ -3,6 +3,7 @@ from itertools import chain
 from ast import literal_eval
 
 import numpy as np
+from automap import FrozenAutoMap
 
 
 from static_frame.core.array_go import ArrayGO
@@ -43,8 +44,10 @@ from static_frame.core.node_str import InterfaceString
 
 from static_frame.core.type_blocks import TypeBlocks
 
+from static_frame.core.util import array_factorize
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DepthLevelSpecifier
+from static_frame.core.util import DTYPE_DATETIME_KIND
 from static_frame.core.util import DtypeSpecifier
 from static_frame.core.util import EMPTY_TUPLE
 
@@ -54,11 +57,15 @@ from static_frame.core.util import IndexConstructors
 from static_frame.core.util import IndexInitializer
 from static_frame.core.util import INT_TYPES
 from static_frame.core.util import intersect2d
+from static_frame.core.util import is_hashable
 from static_frame.core.util import isin
+from static_frame.core.util import isna_element
+from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import NAME_DEFAULT
 from static_frame.core.util import name_filter
 from static_frame.core.util import NameType
 from static_frame.core.util import NULL_SLICE
+from static_frame.core.util import positions_to_slice
 from static_frame.core.util import setdiff2d
 from static_frame.core.util import UFunc
 from static_frame.core.util import union2d
@@ -82,11 +89,13 @@ class IndexHierarchy(IndexBase):
             '_blocks',
             '_recache',
             '_name',
+            '_depth_codes',
             )
     _levels: IndexLevel
     _blocks: TypeBlocks # should be tp.Optional[TypeBlocks] but many typing changes required
     _recache: bool
     _name: NameType
+    _depth_codes: tp.Optional[tp.List[tp.Optional[tp.Tuple[FrozenAutoMap, np.ndarray]]]]
 
     # Temporary type overrides, until indices are generic.
     # __getitem__: tp.Callable[['IndexHierarchy', tp.Hashable], tp.Tuple[tp.Hashable, ...]]
@@ -290,6 +299,37 @@ class IndexHierarchy(IndexBase):
                 )
         return cls(levels=levels, name=name)
 
+    @classmethod
+    def from_arrays(cls: tp.Type[IH],
+            arrays: tp.Iterable[tp.Iterable[tp.Hashable]],
+            *,
+            name: NameType = None,
+            index_constructors: tp.Optional[IndexConstructors] = None,
+            ) -> IH:
+        '''
+        Construct an ``IndexHierarchy`` from an iterable of arrays (or iterables) of equal length, one per depth, where the first array is the outermost depth. Each row position defines a label; per-row labels are never created.
+
+        Args:
+            arrays: an iterable of 1D arrays or iterables.
+            index_constructors: Optionally provide a sequence of ``Index`` constructors, of length equal to depth.
+
+        Returns:
+            :obj:`static_frame.IndexHierarchy`
+        '''
+        def blocks() -> tp.Iterator[np.ndarray]:
+            for array in arrays:
+                if not isinstance(array, np.ndarray):
+                    array, _ = iterable_to_array_1d(array)
+                elif array.ndim != 1:
+                    raise ErrorInitIndex('arrays must be one-dimensional.')
+                yield array
+
+        return cls._from_type_blocks(TypeBlocks.from_blocks(blocks()),
+                name=name,
+                index_constructors=index_constructors,
+                own_blocks=True,
+                )
+
     @classmethod
     def from_index_items(cls: tp.Type[IH],
             items: tp.Iterable[tp.Tuple[tp.Hashable, Index]],
@@ -415,50 +455,9 @@ class IndexHierarchy(IndexBase):
         if index_constructors is not None and len(index_constructors) != depth:
             raise ErrorInitIndex('if providing index constructors, number of index constructors must equal depth of IndexHierarchy.')
 
-        depth_max = depth - 1
-        depth_pre_max = depth - 2
-
-        token = object()
-        observed_last = [token for _ in range(depth)]
-
-        tree: tp.Any = dict() # order assumed and necessary
-
-        idx_row_last = -1
-        for (idx_row, d), v in blocks.element_items():
-            if idx_row_last != idx_row:
-                # for each row, we re-set current to the outermost reference
-                current = tree
-                idx_row_last = idx_row
-
-            # shared implementation with from_labels ---------------------------
-            if d < depth_pre_max:
-                if v not in current:
-                    current[v] = dict() # order necessary
-                else: # can only fetch this node (and not create a new node) if this is the sequential predecessor
-                    if v != observed_last[d]:
-                        raise ErrorInitIndex(f'invalid tree-form for IndexHierarchy: {v} cannot follow {observed_last[d]} when {v} has already been defined.')
-                current = current[v]
-                observed_last[d] = v
-            elif d < depth_max: # premax means inner values are a list
-                if v not in current:
-                    current[v] = list()
-                else: # cannot just fetch this list if it is not the predecessor
-                    if v != observed_last[d]:
-                        raise ErrorInitIndex(f'invalid tree-form for IndexHierarchy: {v} cannot follow {observed_last[d]} when {v} has already been defined.')
-                current = current[v]
-                observed_last[d] = v
-            elif d == depth_max:
-                # if there are redundancies here they will be caught in index creation
-                current.append(v)
-            else:
-                # cannot happen with TypeBlocks
-                raise ErrorInitIndex('label exceeded expected depth', v) #pragma: no cover
-            # shared implementation with from_labels ---------------------------
-
-        levels = cls._LEVEL_CONSTRUCTOR.from_tree(
-                tree,
+        levels = cls._LEVEL_CONSTRUCTOR.from_arrays(
+                tuple(blocks.axis_values(0)),
                 index_constructors=index_constructors,
-                depth_reference=depth,
                 )
 
         if index_constructors is not None:
@@ -486,6 +485,7 @@ class IndexHierarchy(IndexBase):
         '''
 
         self._blocks = None #type: ignore
+        self._depth_codes = None
 
         if isinstance(levels, IndexHierarchy):
             if not blocks is None:
@@ -613,8 +613,30 @@ class IndexHierarchy(IndexBase):
 
     def _update_array_cache(self) -> None:
         self._blocks = self._levels.to_type_blocks()
+        self._depth_codes = None
         self._recache = False
 
+    def _get_depth_codes(self,
+            depth_level: int
+            ) -> tp.Tuple[FrozenAutoMap, np.ndarray]:
+        '''
+        Return, for the depth, a mapping of unique labels to integer codes, and an array of codes for every row. These are derived from the cached blocks and retained until the blocks are updated.
+        '''
+        if self._recache:
+            self._update_array_cache()
+
+        if self._depth_codes is None:
+            self._depth_codes = [None] * self.depth
+
+        depth_codes = self._depth_codes[depth_level]
+        if depth_codes is None:
+            uniques, codes = array_factorize(
+                    self._blocks._extract_array(column_key=depth_level))
+            codes.flags.writeable = False
+            depth_codes = (FrozenAutoMap(uniques), codes)
+            self._depth_codes[depth_level] = depth_codes
+        return depth_codes
+
     #---------------------------------------------------------------------------
 
     @property # type: ignore
@@ -1011,9 +1033,69 @@ class IndexHierarchy(IndexBase):
             key = HLoc(tuple(
                     key_from_container_key(self, k, expand_iloc=True)
                     for k in key))
+            iloc = self._loc_to_iloc_hloc_labels(key)
+            if iloc is not None:
+                return iloc
 
         return self._levels.loc_to_iloc(key)
 
+    def _loc_to_iloc_hloc_labels(self,
+            key: HLoc
+            ) -> tp.Optional[GetItemKeyType]:
+        '''
+        Vectorized selection for an ``HLoc`` of single labels and null slices, where a label follows a null slice (a selection that spans many nodes). Each label is mapped to a code at its depth, and rows are selected by comparing per-depth code arrays. Returns None if the key is not of this form, in which case nodes must be traversed.
+        '''
+        if len(key) > self.depth:
+            return None
+
+        labelled = []
+        for depth_level, k in enumerate(key):
+            if isinstance(k, slice):
+                if k != NULL_SLICE:
+                    return None
+            elif (isinstance(k, (list, np.ndarray, tuple, ILoc, np.datetime64))
+                    or not is_hashable(k)
+                    # NaN labels cannot be found in the mapping of unique labels
+                    or isna_element(k)):
+                return None
+            else:
+                labelled.append(depth_level)
+
+        if not labelled or labelled[-1] == len(labelled) - 1:
+            # selections of only outer depths are a single traversal
+            return None
+
+        if self._recache:
+            self._update_array_cache()
+
+        dtypes = self._blocks.dtypes
+        index_types = tuple(self._levels.index_types())
+
+        mask = None
+        for depth_level in labelled:
+            # specialized indices, such as those of datetime64, transform keys and must be traversed
+            if (index_types[depth_level]._DTYPE is not None
+                    or dtypes[depth_level].kind == DTYPE_DATETIME_KIND):
+                return None
+            label_to_code, codes = self._get_depth_codes(depth_level)
+            code = label_to_code.get(key[depth_level])
+            if code is None:
+                raise KeyError('no matching keys across all levels')
+            if mask is None:
+                mask = codes == code
+            else:
+                mask &= codes == code
+
+        positions = np.flatnonzero(mask)
+        if not len(positions):
+            raise KeyError('no matching keys across all levels')
+
+        iloc = positions_to_slice(positions)
+        if iloc is not None:
+            return iloc
+        positions.flags.writeable = False
+        return positions
+
     def _extract_iloc(self,
             key: GetItemKeyType,
             ) -> tp.Union['IndexHierarchy', tp.Tuple[tp.Hashable]]:
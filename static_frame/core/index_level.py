@@ -10,15 +10,19 @@ import numpy as np
 from static_frame.core.array_go import ArrayGO
 from static_frame.core.container_util import index_from_optional_constructor
 from static_frame.core.doc_str import doc_inject
+from static_frame.core.exception import ErrorInitIndex
 from static_frame.core.exception import ErrorInitIndexLevel
+from static_frame.core.exception import ErrorInitIndexNonUnique
 from static_frame.core.hloc import HLoc
 from static_frame.core.index import ILoc
 from static_frame.core.index import Index
 from static_frame.core.index import IndexGO
 from static_frame.core.index import LocMap
 from static_frame.core.index import mutable_immutable_index_filter
+from static_frame.core.index import PositionsAllocator
 from static_frame.core.index_base import IndexBase
 from static_frame.core.type_blocks import TypeBlocks
+from static_frame.core.util import array_factorize
 from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import GetItemKeyTypeCompound
 from static_frame.core.util import IndexConstructor
@@ -26,10 +30,14 @@ from static_frame.core.util import IndexConstructors
 from static_frame.core.util import IndexInitializer
 from static_frame.core.util import INT_TYPES
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_INT_DEFAULT
 from static_frame.core.util import KEY_ITERABLE_TYPES
 from static_frame.core.util import KEY_MULTIPLE_TYPES
+from static_frame.core.util import positions_to_slice
 from static_frame.core.util import resolve_dtype_iter
 from static_frame.core.util import EMPTY_TUPLE
+from static_frame.core.util import immutable_filter
+from static_frame.core.util import ufunc_unique
 
 
 # if tp.TYPE_CHECKING:
@@ -126,6 +134,106 @@ class IndexLevel:
         return cls.from_level_data(tree, get_index)
 
 
+    @classmethod
+    def from_arrays(cls,
+            arrays: tp.Sequence[np.ndarray],
+            index_constructors: tp.Optional[IndexConstructors] = None,
+            ) -> 'IndexLevel':
+        '''
+        Create an IndexLevel from a sequence of immutable 1D arrays of equal length, one per depth, where each row position defines a leaf. Nodes are found by factorizing each depth and identifying where labels change; per-row labels are never created. As with ``from_tree``, a label at an outer depth cannot recur after a different label under the same outer labels.
+        '''
+        depth = len(arrays)
+        count = len(arrays[0])
+
+        if count == 0:
+            return cls(cls._INDEX_CONSTRUCTOR(EMPTY_TUPLE),
+                    own_index=True,
+                    depth_reference=depth,
+                    )
+
+        depth_max = depth - 1
+
+        # for each depth, the row positions where nodes start, and the position of each node's parent node in the next-outer depth; leaves have a node for every row
+        starts: tp.List[np.ndarray] = []
+        parents: tp.List[np.ndarray] = []
+
+        starts_outer = PositionsAllocator.get(1)
+        transition = np.full(count - 1, False, dtype=DTYPE_BOOL)
+
+        for d, array in enumerate(arrays):
+            _, codes = array_factorize(array)
+            if d < depth_max:
+                # a node starts wherever a label at this depth or any outer depth changes
+                transition |= codes[1:] != codes[:-1]
+                starts_depth = np.concatenate(
+                        (starts_outer[:1], np.flatnonzero(transition) + 1))
+            else:
+                starts_depth = PositionsAllocator.get(count)
+
+            parents_depth = np.searchsorted(starts_outer, starts_depth, side='right') - 1
+
+            # labels must be unique within their parent; at outer depths, a repeated label is a label that is not contiguous
+            key = parents_depth * (codes.max() + 1) + codes[starts_depth]
+            if len(ufunc_unique(key)) != len(key):
+                if d < depth_max:
+                    raise ErrorInitIndex(f'invalid tree-form for IndexHierarchy: labels at depth {d} are not contiguous.')
+                raise ErrorInitIndexNonUnique(f'invalid tree-form for IndexHierarchy: labels at depth {d} are not unique.')
+
+            starts.append(starts_depth)
+            parents.append(parents_depth)
+            starts_outer = starts_depth
+
+        def get_index(labels: np.ndarray, depth: int) -> Index:
+            if index_constructors is not None:
+                constructor = index_constructors[depth]
+                if constructor is not None and constructor is not cls._INDEX_CONSTRUCTOR:
+                    return constructor(labels) #type: ignore
+            if cls.STATIC: # labels have been validated as unique
+                return cls._INDEX_CONSTRUCTOR._from_unique_labels(labels)
+            return cls._INDEX_CONSTRUCTOR(labels)
+
+        # build from the inside out: a level for each node at depth d has an index of the labels at depth d + 1
+        targets_inner: tp.Optional[np.ndarray] = None
+
+        for d in range(depth_max - 1, -1, -1):
+            starts_depth = starts[d]
+            starts_inner = starts[d + 1]
+            if d + 1 < depth_max:
+                labels_inner = arrays[d + 1][starts_inner]
+                labels_inner.flags.writeable = False
+            else: # leaves have a node for every row
+                labels_inner = immutable_filter(arrays[d + 1])
+
+            bounds = np.searchsorted(starts_inner, starts_depth).tolist()
+            bounds.append(len(starts_inner))
+
+            # offsets are relative to the start of the parent node
+            if d > 0:
+                offsets = (starts_depth - starts[d - 1][parents[d]]).tolist()
+            else:
+                offsets = starts_depth.tolist()
+
+            targets = np.empty(len(starts_depth), dtype=object)
+            for i, offset in enumerate(offsets):
+                start, stop = bounds[i], bounds[i + 1]
+                targets[i] = cls(
+                        index=get_index(labels_inner[start: stop], d + 1),
+                        targets=(None if targets_inner is None
+                                else ArrayGO(targets_inner[start: stop], own_iterable=True)),
+                        offset=offset,
+                        own_index=True,
+                        )
+            targets_inner = targets
+
+        labels_outer = arrays[0][starts[0]]
+        labels_outer.flags.writeable = False
+
+        return cls(
+                index=get_index(labels_outer, 0),
+                targets=ArrayGO(targets_inner, own_iterable=True),
+                own_index=True,
+                )
+
     @classmethod
     def from_depth(cls, depth: int) -> 'IndexLevel':
         '''
@@ -504,7 +612,6 @@ class IndexLevel:
         if iloc_count == 1 and not key.has_key_multiple():
             return ilocs[0] # drop to a single iloc selection
 
-        # NOTE: might be able to combine contiguous ilocs into a single slice
         iloc_flat: tp.List[GetItemKeyType] = [] # combine into one flat iloc
         length = self.__len__()
         for part in ilocs:
@@ -514,6 +621,11 @@ class IndexLevel:
                 iloc_flat.append(part)
             else: # assume it is an iterable
                 iloc_flat.extend(part) #type: ignore
+
+        # combine contiguous ilocs into a single slice
+        iloc_slice = positions_to_slice(np.array(iloc_flat, dtype=DTYPE_INT_DEFAULT))
+        if iloc_slice is not None:
+            return iloc_slice
         return iloc_flat
 
     #---------------------------------------------------------------------------
@@ -52,6 +52,11 @@ class InterfaceDatetime(Interface[TContainer]):
             'year',
             'month',
             'day',
+            'hour',
+            'minute',
+            'second',
+            'quarter',
+            'day_of_year',
             'weekday',
             'timetuple',
             'fromisoformat',
@@ -61,6 +66,7 @@ class InterfaceDatetime(Interface[TContainer]):
 
     DT64_EXCLUDE_YEAR = (DT64_YEAR,)
     DT64_EXCLUDE_YEAR_MONTH = (DT64_YEAR, DT64_MONTH)
+    DT64_EXCLUDE_YEAR_MONTH_DAY = (DT64_YEAR, DT64_MONTH, DT64_DAY)
     DT64_TIME = frozenset((
             DT64_H,
             DT64_M,
@@ -82,6 +88,15 @@ class InterfaceDatetime(Interface[TContainer]):
             DT64_AS,
             ))
 
+    # map of Python isoformat timespec arguments to NumPy datetime units
+    TIMESPEC_TO_UNIT = {
+            'hours': 'h',
+            'minutes': 'm',
+            'seconds': 's',
+            'milliseconds': 'ms',
+            'microseconds': 'us',
+            }
+
     def __init__(self,
             blocks: BlocksType,
             blocks_to_container: ToContainerType[TContainer]
@@ -192,6 +207,125 @@ class InterfaceDatetime(Interface[TContainer]):
 
 
 
+    @property
+    def hour(self) -> TContainer:
+        '''
+        Return the hour of each element, between 0 and 23 inclusive.
+        '''
+
+        def blocks() -> tp.Iterator[np.ndarray]:
+            for block in self._blocks:
+                self._validate_dtype_non_str(block.dtype,
+                        exclude=self.DT64_EXCLUDE_YEAR_MONTH_DAY)
+
+                if block.dtype.kind == DTYPE_DATETIME_KIND:
+                    array = block.astype(DT64_H).astype(DTYPE_INT_DEFAULT) % 24
+                    array.flags.writeable = False
+                else: # must be object type
+                    array = array_from_element_attr(
+                            array=block,
+                            attr_name='hour',
+                            dtype=DTYPE_INT_DEFAULT)
+                yield array
+
+        return self._blocks_to_container(blocks())
+
+    @property
+    def minute(self) -> TContainer:
+        '''
+        Return the minute of each element, between 0 and 59 inclusive.
+        '''
+
+        def blocks() -> tp.Iterator[np.ndarray]:
+            for block in self._blocks:
+                self._validate_dtype_non_str(block.dtype,
+                        exclude=self.DT64_EXCLUDE_YEAR_MONTH_DAY)
+
+                if block.dtype.kind == DTYPE_DATETIME_KIND:
+                    array = block.astype(DT64_M).astype(DTYPE_INT_DEFAULT) % 60
+                    array.flags.writeable = False
+                else: # must be object type
+                    array = array_from_element_attr(
+                            array=block,
+                            attr_name='minute',
+                            dtype=DTYPE_INT_DEFAULT)
+                yield array
+
+        return self._blocks_to_container(blocks())
+
+    @property
+    def second(self) -> TContainer:
+        '''
+        Return the second of each element, between 0 and 59 inclusive.
+        '''
+
+        def blocks() -> tp.Iterator[np.ndarray]:
+            for block in self._blocks:
+                self._validate_dtype_non_str(block.dtype,
+                        exclude=self.DT64_EXCLUDE_YEAR_MONTH_DAY)
+
+                if block.dtype.kind == DTYPE_DATETIME_KIND:
+                    array = block.astype(DT64_S).astype(DTYPE_INT_DEFAULT) % 60
+                    array.flags.writeable = False
+                else: # must be object type
+                    array = array_from_element_attr(
+                            array=block,
+                            attr_name='second',
+                            dtype=DTYPE_INT_DEFAULT)
+                yield array
+
+        return self._blocks_to_container(blocks())
+
+    @property
+    def quarter(self) -> TContainer:
+        '''
+        Return the quarter of the year of each element, between 1 and 4 inclusive.
+        '''
+
+        def blocks() -> tp.Iterator[np.ndarray]:
+            for block in self._blocks:
+                self._validate_dtype_non_str(block.dtype, exclude=self.DT64_EXCLUDE_YEAR)
+
+                if block.dtype.kind == DTYPE_DATETIME_KIND:
+                    array = block.astype(DT64_MONTH).astype(DTYPE_INT_DEFAULT) % 12 // 3 + 1
+                else: # must be object type
+                    array = (array_from_element_attr(
+                            array=block,
+                            attr_name='month',
+                            dtype=DTYPE_INT_DEFAULT) - 1) // 3 + 1
+                array.flags.writeable = False
+                yield array
+
+        return self._blocks_to_container(blocks())
+
+    @property
+    def day_of_year(self) -> TContainer:
+        '''
+        Return the day of the year of each element, between 1 and 366 inclusive.
+        '''
+
+        def blocks() -> tp.Iterator[np.ndarray]:
+            for block in self._blocks:
+                self._validate_dtype_non_str(block.dtype, exclude=self.DT64_EXCLUDE_YEAR_MONTH)
+
+                if block.dtype.kind == DTYPE_DATETIME_KIND:
+                    if block.dtype != DT64_DAY:
+                        block = block.astype(DT64_DAY)
+                    # subtract the first of the year, then shift
+                    array = (block - block.astype(DT64_YEAR)).astype(DTYPE_INT_DEFAULT) + 1
+                    array.flags.writeable = False
+                else: # must be object type
+                    array = array_from_element_method(
+                            array=block,
+                            method_name='timetuple',
+                            args=EMPTY_TUPLE,
+                            dtype=DTYPE_INT_DEFAULT,
+                            pre_insert=lambda t: t.tm_yday,
+                            )
+                yield array
+
+        return self._blocks_to_container(blocks())
+
     #---------------------------------------------------------------------------
 
     # replace: akward to implement, as cannot provide None for the parameters that you do not want to set
@@ -206,18 +340,19 @@ class InterfaceDatetime(Interface[TContainer]):
                 self._validate_dtype_non_str(block.dtype, exclude=self.DT64_EXCLUDE_YEAR_MONTH)
 
                 if block.dtype.kind == DTYPE_DATETIME_KIND:
-                    if block.dtype != DT64_DAY: # go to day first, then object
+                    if block.dtype != DT64_DAY:
                         block = block.astype(DT64_DAY)
-                    block = block.astype(DTYPE_OBJECT)
-                # all object arrays by this point
-
-                # returns an immutable array
-                array = array_from_element_method(
-                        array=block,
-                        method_name='weekday',
-                        args=EMPTY_TUPLE,
-                        dtype=DTYPE_INT_DEFAULT
-                        )
+                    # the epoch, 1970-01-01, is a Thursday (3)
+                    array = (block.astype(DTYPE_INT_DEFAULT) + 3) % 7
+                    array.flags.writeable = False
+                else: # must be object type
+                    # returns an immutable array
+                    array = array_from_element_method(
+                            array=block,
+                            method_name='weekday',
+                            args=EMPTY_TUPLE,
+                            dtype=DTYPE_INT_DEFAULT
+                            )
                 yield array
 
         return self._blocks_to_container(blocks())
@@ -253,6 +388,42 @@ class InterfaceDatetime(Interface[TContainer]):
 
         return self._blocks_to_container(blocks())
 
+    @classmethod
+    def _isoformat_dt64(cls,
+            block: np.ndarray,
+            sep: str,
+            timespec: str,
+            ) -> np.ndarray:
+        '''
+        Produce ISO 8601 strings from a datetime64 array with ``np.datetime_as_string``, matching the output of ``isoformat`` on the corresponding Python date or datetime objects.
+        '''
+        if block.dtype not in cls.DT64_TIME:
+            # date units convert to datetime.date, which takes no arguments
+            array = np.datetime_as_string(block.astype(DT64_DAY))
+        else:
+            if timespec == 'auto':
+                # show microseconds only for elements that have a sub-second component
+                array = np.datetime_as_string(block, unit='s')
+                if block.dtype not in (DT64_H, DT64_M, DT64_S):
+                    fractional = block != block.astype(DT64_S)
+                    if fractional.any():
+                        array = np.where(fractional,
+                                np.datetime_as_string(block, unit='us'),
+                                array,
+                                )
+            elif timespec in cls.TIMESPEC_TO_UNIT:
+                array = np.datetime_as_string(block, unit=cls.TIMESPEC_TO_UNIT[timespec])
+            else:
+                raise ValueError(f'Unknown timespec value: {timespec}')
+            if sep != 'T':
+                array = np.char.replace(array, 'T', sep, count=1)
+
+        # np.datetime_as_string sizes the dtype for the widest possible string; narrow to the widest observed
+        if len(array):
+            array = array.astype(f'<U{np.char.str_len(array).max()}')
+        array.flags.writeable = False
+        return array
+
     def isoformat(self, sep: str = 'T', timespec: str = 'auto') -> TContainer:
         '''
         Return a string representing the date in ISO 8601 format, YYYY-MM-DD.
@@ -264,21 +435,17 @@ class InterfaceDatetime(Interface[TContainer]):
                 self._validate_dtype_non_str(block.dtype,
                         exclude=self.DT64_EXCLUDE_YEAR_MONTH_SUB_MICRO)
 
-                args = EMPTY_TUPLE
                 if block.dtype.kind == DTYPE_DATETIME_KIND:
-                    if block.dtype in self.DT64_TIME:
-                        # if we know this is a time type, we can pass args
-                        args = (sep, timespec) #type: ignore
-                    block = block.astype(DTYPE_OBJECT)
+                    yield self._isoformat_dt64(block, sep, timespec)
+                    continue
 
-                # all object arrays by this point
                 # NOTE: we cannot determine if an Object array has date or datetime objects with a full iteration, so we cannot be sure if we need to pass args or not.
 
                 # returns an immutable array
                 array = array_from_element_method(
                         array=block,
                         method_name='isoformat',
-                        args=args,
+                        args=EMPTY_TUPLE,
                         dtype=DTYPE_STR,
                         )
                 yield array
@@ -2,21 +2,30 @@
 Tools for iterators in Series and Frame. These components are imported by both series.py and frame.py; these components also need to be able to return Series and Frame, and thus use deferred, function-based imports.
 '''
 
+import os
 import typing as tp
 from enum import Enum
 from functools import partial
+from concurrent.futures import as_completed
+from concurrent.futures import Executor
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
 from static_frame.core.doc_str import doc_inject
+from static_frame.core.shared_blocks import shared_memory_validate
 from static_frame.core.util import AnyCallable
+from static_frame.core.util import array_factorize
+from static_frame.core.util import chunks_from_sizes
 from static_frame.core.util import DepthLevelSpecifier
+from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DtypeSpecifier
+from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import KEY_ITERABLE_TYPES
 from static_frame.core.util import Mapping
 from static_frame.core.util import NameType
+from static_frame.core.util import POOL_CHUNKS_PER_WORKER
 
 
 if tp.TYPE_CHECKING:
@@ -26,6 +35,112 @@ if tp.TYPE_CHECKING:
 
 
 FrameOrSeries = tp.TypeVar('FrameOrSeries', 'Frame', 'Series')
+# positions ordered by group, and each group with the start and stop of its positions
+GroupPositions = tp.Tuple[np.ndarray, tp.List[tp.Tuple[tp.Hashable, int, int]]]
+
+CHUNKSIZE_AUTO = 'auto'
+ChunkSize = tp.Union[int, str]
+
+
+def len_container(value: tp.Any) -> int:
+    '''Return the length of a container, or 1 if given an element.
+    '''
+    shape = getattr(value, 'shape', None)
+    if shape: # not None or an empty tuple
+        return shape[0] # type: ignore
+    return 1
+
+def apply_chunk(func: AnyCallable, args: tp.Sequence[tp.Any]) -> tp.List[tp.Any]:
+    # process pool requires a module-level function
+    return [func(arg) for arg in args]
+
+def chunksize_validate(chunksize: ChunkSize) -> None:
+    '''Raise if ``chunksize`` is a string other than 'auto'.
+    '''
+    if isinstance(chunksize, str) and chunksize != CHUNKSIZE_AUTO:
+        raise RuntimeError(f"chunksize must be an integer or '{CHUNKSIZE_AUTO}', not {chunksize!r}")
+
+def chunks_auto(
+        sizes: tp.Sequence[int],
+        max_workers: tp.Optional[int],
+        ) -> tp.List[slice]:
+    '''Partition items of ``sizes`` into chunks of similar total size, forming ``POOL_CHUNKS_PER_WORKER`` chunks for each worker, where ``max_workers`` of None is taken as the count of processors.
+    '''
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    return chunks_from_sizes(sizes, workers * POOL_CHUNKS_PER_WORKER)
+
+def pool_map_chunks(
+        executor: Executor,
+        func: AnyCallable,
+        args: tp.Sequence[tp.Any],
+        chunks: tp.Sequence[slice],
+        sizes: tp.Sequence[int],
+        ordered: bool,
+        ) -> tp.Iterator[tp.Tuple[int, tp.Any]]:
+    '''
+    Submit each chunk of ``args`` as a task, yielding pairs of the position of each arg and the result of ``func``. Chunks are submitted in descending order of the total of ``sizes``, such that the largest tasks do not start last. If ``ordered``, results are yielded in the order of ``args``; otherwise, chunks are yielded as they complete.
+    '''
+    totals = [sum(sizes[chunk]) for chunk in chunks]
+    futures: tp.List[tp.Any] = [None] * len(chunks)
+    for i in sorted(range(len(chunks)), key=totals.__getitem__, reverse=True):
+        futures[i] = executor.submit(apply_chunk, func, args[chunks[i]])
+
+    if ordered:
+        for chunk, future in zip(chunks, futures):
+            yield from zip(range(chunk.start, chunk.stop), future.result())
+    else:
+        future_to_chunk = dict(zip(futures, chunks))
+        for future in as_completed(future_to_chunk):
+            chunk = future_to_chunk[future]
+            yield from zip(range(chunk.start, chunk.stop), future.result())
+
+def array_from_vectorized(
+        post: tp.Any,
+        count: int,
+        dtype: DtypeSpecifier = None,
+        ) -> np.ndarray:
+    '''Validate the result of a function given to ``apply_vectorized``, which must be a 1D array (or iterable) of ``count`` values.
+    '''
+    array = np.asarray(post) if dtype is None else np.asarray(post, dtype=dtype)
+    if array.shape != (count,):
+        raise RuntimeError(f'function must return an array of {count} values, not an array of shape {array.shape}')
+    return array
+
+# returned by a lookup given to map_factorized to retain the original value
+MAP_MISSING = object()
+
+def map_factorized(
+        array: np.ndarray,
+        lookup: AnyCallable,
+        ) -> np.ndarray:
+    '''
+    Call ``lookup`` once for each unique value in ``array``, and return an array of the results taken for each position. Where ``lookup`` returns ``MAP_MISSING``, original values are retained.
+    '''
+    uniques, codes = array_factorize(array)
+    mapped = [lookup(u) for u in uniques]
+    missing = [v is MAP_MISSING for v in mapped]
+
+    if not any(missing):
+        values, _ = iterable_to_array_1d(mapped)
+        return values[codes]
+
+    if array.dtype != DTYPE_OBJECT:
+        if all(missing):
+            return array
+        values, _ = iterable_to_array_1d(
+                [u if m else v for u, v, m in zip(uniques, mapped, missing)])
+        return values[codes]
+
+    # a unique value might stand for equal values of other types (i.e., 1 and True); restore the originals, and resolve the dtype from all values
+    values = np.empty(len(mapped), dtype=DTYPE_OBJECT)
+    for i, v in enumerate(mapped):
+        values[i] = v
+    post = values[codes]
+    mask = np.array(missing)[codes]
+    post[mask] = array[mask]
+    post, _ = iterable_to_array_1d(post.tolist())
+    return post
+
 # FrameSeriesIndex = tp.TypeVar('FrameSeriesIndex', 'Frame', 'Series', 'Index')
 
 
@@ -50,7 +165,12 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             '_func_values',
             '_func_items',
             '_yield_type',
-            '_apply_constructor'
+            '_apply_constructor',
+            '_func_positions',
+            '_func_vectorized',
+            '_func_map',
+            '_container',
+            '_axis',
             )
 
     INTERFACE = (
@@ -58,6 +178,8 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             'apply_iter',
             'apply_iter_items',
             'apply_pool',
+            'apply_pool_iter_unordered',
+            'apply_vectorized',
             'map_all',
             'map_all_iter',
             'map_all_iter_items',
@@ -73,33 +195,56 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             func_values: tp.Callable[..., tp.Iterable[tp.Any]],
             func_items: tp.Callable[..., tp.Iterable[tp.Tuple[tp.Any, tp.Any]]],
             yield_type: IterNodeType,
-            apply_constructor: tp.Callable[..., FrameOrSeries]
+            apply_constructor: tp.Callable[..., FrameOrSeries],
+            func_positions: tp.Optional[tp.Callable[..., GroupPositions]] = None,
+            func_vectorized: tp.Optional[tp.Callable[..., FrameOrSeries]] = None,
+            func_map: tp.Optional[tp.Callable[..., FrameOrSeries]] = None,
+            container: tp.Optional[FrameOrSeries] = None,
+            axis: int = 0,
         ) -> None:
         '''
         Args:
             apply_constructor: Callable (generally a class) used to construct the object returned from apply(); must take an iterator of items.
+            func_positions: Optional callable returning positions ordered by group, and each group with the start and stop of its positions in ``container`` along ``axis``; required for process pools using shared memory.
+            func_vectorized: Optional callable that takes a function and applies it to whole arrays, returning a new container; required for apply_vectorized().
+            func_map: Optional callable that takes a function and applies it to whole arrays of elements, returning a new container; if provided, map_all(), map_any(), and map_fill() look up each unique element once.
         '''
         self._func_values = func_values
         self._func_items = func_items
         self._yield_type = yield_type
         self._apply_constructor: tp.Callable[..., FrameOrSeries] = apply_constructor
+        self._func_positions = func_positions
+        self._func_vectorized = func_vectorized
+        self._func_map = func_map
+        self._container = container
+        self._axis = axis
 
     #---------------------------------------------------------------------------
 
     def _apply_iter_items_parallel(self,
             func: AnyCallable,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
+            chunksize: ChunkSize = 1,
             use_threads: bool = False,
+            use_shared_memory: bool = False,
+            ordered: bool = True,
             ) -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]:
 
-        pool_executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
-
         yt_is_values = self._yield_type is IterNodeType.VALUES
 
         if not callable(func):
             func = getattr(func, '__getitem__')
 
+        if use_shared_memory and not use_threads:
+            yield from self._apply_iter_items_shared(func=func,
+                    max_workers=max_workers,
+                    chunksize=chunksize,
+                    ordered=ordered,
+                    )
+            return
+
+        pool_executor = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+
         # use side effect list population to create keys when iterating over values
         func_keys = []
 
@@ -117,9 +262,68 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
                     yield k, v
 
         with pool_executor(max_workers=max_workers) as executor:
-            yield from zip(func_keys,
-                    executor.map(func, arg_gen(), chunksize=chunksize)
+            if ordered and chunksize != CHUNKSIZE_AUTO:
+                yield from zip(func_keys,
+                        executor.map(func, arg_gen(), chunksize=chunksize)
+                        )
+                return
+
+            args = list(arg_gen())
+            sizes = [len_container(a if yt_is_values else a[1]) for a in args]
+            if chunksize == CHUNKSIZE_AUTO:
+                chunks = chunks_auto(sizes, max_workers)
+            else:
+                chunks = [slice(i, i + chunksize) for i in range(0, len(args), chunksize)] # type: ignore
+
+            for i, post in pool_map_chunks(executor, func, args, chunks, sizes, ordered):
+                yield func_keys[i], post
+
+    def _apply_iter_items_shared(self,
+            func: AnyCallable,
+            max_workers: tp.Optional[int] = None,
+            chunksize: ChunkSize = 1,
+            ordered: bool = True,
+            ) -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]:
+        '''
+        Apply with a ProcessPoolExecutor, placing the blocks of the source Frame and the positions of each group in shared memory once, and sending to workers only the label and the start and stop of each group's positions.
+        '''
+        if self._func_positions is None:
+            raise NotImplementedError('shared memory is only supported for group iteration on a Frame')
+
+        from static_frame.core.shared_blocks import SharedBlocks
+        from static_frame.core.shared_blocks import group_apply
+        from static_frame.core.shared_blocks import group_init
+
+        positions, items = self._func_positions()
+
+        with SharedBlocks() as shared:
+            initargs = (
+                    shared.share_frame(self._container), # type: ignore
+                    shared.share_array(positions),
+                    self._axis,
+                    func,
+                    self._yield_type is IterNodeType.ITEMS,
                     )
+            with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=group_init,
+                    initargs=initargs,
+                    ) as executor:
+                if ordered and chunksize != CHUNKSIZE_AUTO:
+                    yield from zip((label for label, _, _ in items),
+                            executor.map(group_apply, items, chunksize=chunksize)
+                            )
+                    return
+
+                # group sizes are known from the positions of each group
+                sizes = [stop - start for _, start, stop in items]
+                if chunksize == CHUNKSIZE_AUTO:
+                    chunks = chunks_auto(sizes, max_workers)
+                else:
+                    chunks = [slice(i, i + chunksize) for i in range(0, len(items), chunksize)] # type: ignore
+
+                for i, post in pool_map_chunks(executor, group_apply, items, chunks, sizes, ordered):
+                    yield items[i][0], post
 
     #---------------------------------------------------------------------------
     # public interface
@@ -166,6 +370,13 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             {mapping}
             {dtype}
         '''
+        if self._func_map is not None:
+            get = getattr(mapping, 'get')
+            return self._func_map(
+                    partial(map_factorized, lookup=lambda v: get(v, MAP_MISSING)),
+                    dtype=dtype,
+                    name=name,
+                    )
         return self._apply_constructor(
                 self.map_any_iter_items(mapping),
                 dtype=dtype,
@@ -224,6 +435,13 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             {fill_value}
             {dtype}
         '''
+        if self._func_map is not None:
+            get = getattr(mapping, 'get')
+            return self._func_map(
+                    partial(map_factorized, lookup=lambda v: get(v, fill_value)),
+                    dtype=dtype,
+                    name=name,
+                    )
         return self._apply_constructor(
                 self.map_fill_iter_items(mapping, fill_value=fill_value),
                 dtype=dtype,
@@ -274,6 +492,13 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             {mapping}
             {dtype}
         '''
+        if self._func_map is not None:
+            # want exception to raise if key not found
+            return self._func_map(
+                    partial(map_factorized, lookup=getattr(mapping, '__getitem__')),
+                    dtype=dtype,
+                    name=name,
+                    )
         return self._apply_constructor(
                 self.map_all_iter_items(mapping),
                 dtype=dtype,
@@ -339,8 +564,9 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             dtype: DtypeSpecifier = None,
             name: NameType = None,
             max_workers: tp.Optional[int] = None,
-            chunksize: int = 1,
-            use_threads: bool = False
+            chunksize: ChunkSize = 1,
+            use_threads: bool = False,
+            use_shared_memory: bool = False,
             ) -> FrameOrSeries:
         '''
         {doc} Employ parallel processing with either the ProcessPoolExecutor or ThreadPoolExecutor.
@@ -349,19 +575,73 @@ class IterNodeDelegate(tp.Generic[FrameOrSeries]):
             {func}
             {dtype}
             max_workers: Passed to the pool_executor, where None defaults to the max number of machine processes.
-            chunksize: Passed to the pool executor.
+            chunksize: Passed to the pool executor; if 'auto', items are combined into chunks of similar total size, where size is the count of rows (or elements) of each item.
             use_thread: When True, the ThreadPoolExecutor will be used rather than the default ProcessPoolExecutor.
+            use_shared_memory: When True, and not using threads, the blocks of the source Frame are placed in shared memory once, and workers build groups from views of these blocks rather than receiving pickled groups. Only supported for group iteration on a Frame; requires Python 3.8.
         '''
+        chunksize_validate(chunksize)
+        if use_shared_memory and not use_threads:
+            shared_memory_validate()
         return self._apply_constructor(
                 self._apply_iter_items_parallel(
                         func=func,
                         max_workers=max_workers,
                         chunksize=chunksize,
-                        use_threads=use_threads),
+                        use_threads=use_threads,
+                        use_shared_memory=use_shared_memory,
+                        ),
                 dtype=dtype,
                 name=name,
                 )
 
+    def apply_pool_iter_unordered(self,
+            func: AnyCallable,
+            *,
+            max_workers: tp.Optional[int] = None,
+            chunksize: ChunkSize = 1,
+            use_threads: bool = False,
+            use_shared_memory: bool = False,
+            ) -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]:
+        '''
+        Apply a function to each value with either the ProcessPoolExecutor or ThreadPoolExecutor, returning a generator of resulting key, value pairs in the order in which they are completed.
+
+        Args:
+            func: A function that takes a value.
+            max_workers: Passed to the pool_executor, where None defaults to the max number of machine processes.
+            chunksize: The count of items given to each task; if 'auto', items are combined into chunks of similar total size, where size is the count of rows (or elements) of each item.
+            use_thread: When True, the ThreadPoolExecutor will be used rather than the default ProcessPoolExecutor.
+            use_shared_memory: When True, and not using threads, the blocks of the source Frame are placed in shared memory once; see ``apply_pool``.
+        '''
+        chunksize_validate(chunksize)
+        if use_shared_memory and not use_threads:
+            shared_memory_validate()
+        return self._apply_iter_items_parallel(
+                func=func,
+                max_workers=max_workers,
+                chunksize=chunksize,
+                use_threads=use_threads,
+                use_shared_memory=use_shared_memory,
+                ordered=False,
+                )
+
+    @doc_inject(selector='apply')
+    def apply_vectorized(self,
+            func: AnyCallable,
+            *,
+            dtype: DtypeSpecifier = None,
+            name: NameType = None,
+            ) -> FrameOrSeries:
+        '''
+        Apply a function to arrays of many values at once, rather than to each value, returning a new container. For element iteration, the function is called with each column (or the values of a Series) and must return an array of the same length. For array or Series iteration along an axis, the function is called with 2D arrays, each row of which is one value of the iteration, and must return a 1D array with a value for each row.
+
+        Args:
+            func: A function that takes an array and returns an array.
+            {dtype}
+        '''
+        if self._func_vectorized is None:
+            raise NotImplementedError('apply_vectorized() is only supported for iter_element(), iter_array(), and iter_series()')
+        return self._func_vectorized(func, dtype=dtype, name=name)
+
     def __iter__(self) -> tp.Union[
             tp.Iterator[tp.Any],
             tp.Iterator[tp.Tuple[tp.Any, tp.Any]]
@@ -382,6 +662,9 @@ _ITER_NODE_SLOTS = (
         '_container',
         '_func_values',
         '_func_items',
+        '_func_positions',
+        '_func_vectorized',
+        '_func_map',
         '_yield_type',
         '_apply_type'
         )
@@ -398,16 +681,25 @@ class IterNode(tp.Generic[FrameOrSeries]):
             function_values: tp.Callable[..., tp.Iterable[tp.Any]],
             function_items: tp.Callable[..., tp.Iterable[tp.Tuple[tp.Any, tp.Any]]],
             yield_type: IterNodeType,
-            apply_type: IterNodeApplyType = IterNodeApplyType.SERIES_ITEMS
+            apply_type: IterNodeApplyType = IterNodeApplyType.SERIES_ITEMS,
+            function_positions: tp.Optional[tp.Callable[..., GroupPositions]] = None,
+            function_vectorized: tp.Optional[tp.Callable[..., FrameOrSeries]] = None,
+            function_map: tp.Optional[tp.Callable[..., FrameOrSeries]] = None,
             ) -> None:
         '''
         Args:
             function_values: will be partialed with arguments given with __call__.
             function_items: will be partialed with arguments given with __call__.
+            function_positions: will be partialed with arguments given with __call__.
+            function_vectorized: will be partialed with arguments given with __call__.
+            function_map: will be partialed with arguments given with __call__.
         '''
         self._container: FrameOrSeries = container
         self._func_values = function_values
         self._func_items = function_items
+        self._func_positions = function_positions
+        self._func_vectorized = function_vectorized
+        self._func_map = function_map
         self._yield_type = yield_type
         self._apply_type = apply_type
 
@@ -425,6 +717,12 @@ class IterNode(tp.Generic[FrameOrSeries]):
 
         func_values = partial(self._func_values, **kwargs)
         func_items = partial(self._func_items, **kwargs)
+        func_positions = (None if self._func_positions is None
+                else partial(self._func_positions, **kwargs))
+        func_vectorized = (None if self._func_vectorized is None
+                else partial(self._func_vectorized, **kwargs))
+        func_map = (None if self._func_map is None
+                else partial(self._func_map, **kwargs))
 
         apply_constructor: tp.Callable[..., tp.Union[Frame, Series]]
 
@@ -461,7 +759,12 @@ class IterNode(tp.Generic[FrameOrSeries]):
                 func_values=func_values,
                 func_items=func_items,
                 yield_type=self._yield_type,
-                apply_constructor=tp.cast(tp.Callable[..., FrameOrSeries], apply_constructor)
+                apply_constructor=tp.cast(tp.Callable[..., FrameOrSeries], apply_constructor),
+                func_positions=func_positions,
+                func_vectorized=func_vectorized,
+                func_map=func_map,
+                container=self._container,
+                axis=tp.cast(int, kwargs.get('axis', 0)),
                 )
 
 
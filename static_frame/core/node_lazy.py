@@ -0,0 +1,407 @@
+
+import operator as operator_mod
+import typing as tp
+
+import numpy as np
+
+from static_frame.core.container import ContainerOperand
+from static_frame.core.container_util import apply_binary_operator
+from static_frame.core.index_correspondence import IndexCorrespondence
+from static_frame.core.index_correspondence import union_correspondence
+from static_frame.core.util import DTYPE_BOOL_KIND
+from static_frame.core.util import DTYPE_COMPLEX_KIND
+from static_frame.core.util import DTYPE_FLOAT_KIND
+from static_frame.core.util import DTYPE_INT_KINDS
+from static_frame.core.util import UFunc
+
+if tp.TYPE_CHECKING:
+    from static_frame.core.frame import Frame  #pylint: disable = W0611 #pragma: no cover
+    from static_frame.core.index_base import IndexBase  #pylint: disable = W0611 #pragma: no cover
+    from static_frame.core.series import Series  #pylint: disable = W0611 #pragma: no cover
+
+
+# kinds for which operators can be applied with ufuncs writing into an existing array
+DTYPE_FUSABLE_KINDS = (DTYPE_BOOL_KIND, DTYPE_FLOAT_KIND, DTYPE_COMPLEX_KIND) + DTYPE_INT_KINDS
+
+# ufuncs equivalent to operators, keyed by operator name
+UFUNC_FUSABLE: tp.Dict[str, UFunc] = {
+        'add': np.add,
+        'sub': np.subtract,
+        'mul': np.multiply,
+        'truediv': np.true_divide,
+        'floordiv': np.floor_divide,
+        'mod': np.remainder,
+        'lshift': np.left_shift,
+        'rshift': np.right_shift,
+        'and_': np.bitwise_and,
+        'xor': np.bitwise_xor,
+        'or_': np.bitwise_or,
+        'lt': np.less,
+        'le': np.less_equal,
+        'eq': np.equal,
+        'ne': np.not_equal,
+        'gt': np.greater,
+        'ge': np.greater_equal,
+        'neg': np.negative,
+        'pos': np.positive,
+        'abs': np.absolute,
+        'invert': np.invert,
+        }
+
+Operand = tp.Union['LazyExpression', tp.Any]
+
+
+def _is_fusable(value: tp.Any) -> bool:
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind in DTYPE_FUSABLE_KINDS
+    return isinstance(value, (int, float, complex, np.number, np.bool_))
+
+
+def _sample(value: tp.Any) -> tp.Any:
+    '''Return a zero-length array, of the same dtype, for an array; return other values unchanged.
+    '''
+    if isinstance(value, np.ndarray):
+        return value[:0]
+    return value
+
+
+class LazyExpression:
+    '''
+    A record of operators applied to one or more containers, deferring evaluation until calling :obj:`LazyExpression.evaluate`.
+    '''
+
+    __slots__ = (
+            '_operator',
+            '_operands',
+            )
+
+    _operator: tp.Optional[UFunc]
+    _operands: tp.Tuple[Operand, ...]
+
+    def __init__(self,
+            operator: tp.Optional[UFunc],
+            operands: tp.Tuple[Operand, ...],
+            ) -> None:
+        '''
+        Args:
+            operator: a unary or binary operator; if None, ``operands`` is a tuple of a single container.
+            operands: a tuple of one or two operands, each a :obj:`LazyExpression` or a constant.
+        '''
+        self._operator = operator
+        self._operands = operands
+
+    #---------------------------------------------------------------------------
+    def _unary(self, operator: UFunc) -> 'LazyExpression':
+        return LazyExpression(operator, (self,))
+
+    def _binary(self, operator: UFunc, other: tp.Any) -> 'LazyExpression':
+        if isinstance(other, ContainerOperand):
+            other = LazyExpression(None, (other,))
+        return LazyExpression(operator, (self, other))
+
+    def _binary_reverse(self, operator: UFunc, other: tp.Any) -> 'LazyExpression':
+        if isinstance(other, ContainerOperand):
+            other = LazyExpression(None, (other,))
+        return LazyExpression(operator, (other, self))
+
+    def __getitem__(self, key: tp.Any) -> 'LazyExpression':
+        '''
+        Select from the container; only supported before applying operators.
+        '''
+        if self._operator is not None:
+            raise RuntimeError('selection is only supported on a container, not on an expression')
+        return LazyExpression(None, (self._operands[0][key],))
+
+    def __pos__(self) -> 'LazyExpression':
+        return self._unary(operator_mod.__pos__)
+
+    def __neg__(self) -> 'LazyExpression':
+        return self._unary(operator_mod.__neg__)
+
+    def __abs__(self) -> 'LazyExpression':
+        return self._unary(operator_mod.__abs__)
+
+    def __invert__(self) -> 'LazyExpression':
+        return self._unary(operator_mod.__invert__)
+
+    def __add__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__add__, other)
+
+    def __sub__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__sub__, other)
+
+    def __mul__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__mul__, other)
+
+    def __truediv__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__truediv__, other)
+
+    def __floordiv__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__floordiv__, other)
+
+    def __matmul__(self, other: tp.Any) -> 'LazyExpression':
+        raise NotImplementedError('matrix multiplication cannot be evaluated by column; call evaluate() first')
+
+    def __mod__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__mod__, other)
+
+    def __pow__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__pow__, other)
+
+    def __lshift__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__lshift__, other)
+
+    def __rshift__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__rshift__, other)
+
+    def __and__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__and__, other)
+
+    def __xor__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__xor__, other)
+
+    def __or__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__or__, other)
+
+    def __lt__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__lt__, other)
+
+    def __le__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__le__, other)
+
+    def __eq__(self, other: tp.Any) -> 'LazyExpression': #type: ignore
+        return self._binary(operator_mod.__eq__, other)
+
+    def __ne__(self, other: tp.Any) -> 'LazyExpression': #type: ignore
+        return self._binary(operator_mod.__ne__, other)
+
+    def __gt__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__gt__, other)
+
+    def __ge__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary(operator_mod.__ge__, other)
+
+    __hash__ = None #type: ignore
+
+    def __radd__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__add__, other)
+
+    def __rsub__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__sub__, other)
+
+    def __rmul__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__mul__, other)
+
+    def __rtruediv__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__truediv__, other)
+
+    def __rfloordiv__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__floordiv__, other)
+
+    def __rmatmul__(self, other: tp.Any) -> 'LazyExpression':
+        raise NotImplementedError('matrix multiplication cannot be evaluated by column; call evaluate() first')
+
+    def __rmod__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__mod__, other)
+
+    def __rpow__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__pow__, other)
+
+    def __rlshift__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__lshift__, other)
+
+    def __rrshift__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__rshift__, other)
+
+    def __rand__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__and__, other)
+
+    def __rxor__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__xor__, other)
+
+    def __ror__(self, other: tp.Any) -> 'LazyExpression':
+        return self._binary_reverse(operator_mod.__or__, other)
+
+    #---------------------------------------------------------------------------
+    def _iter_containers(self) -> tp.Iterator['ContainerOperand']:
+        '''Yield each container, depth first from the left; the same container may be yielded more than once.
+        '''
+        if self._operator is None:
+            yield self._operands[0]
+            return
+        for operand in self._operands:
+            if isinstance(operand, LazyExpression):
+                yield from operand._iter_containers()
+
+    def _evaluate(self,
+            container_value: tp.Callable[['ContainerOperand'], tp.Any],
+            constant_value: tp.Callable[[tp.Any], tp.Any],
+            ) -> tp.Tuple[tp.Any, bool]:
+        '''
+        Return the value of this expression, and if that value is an intermediate array that can be written to by a subsequent operator.
+        '''
+        if self._operator is None:
+            return container_value(self._operands[0]), False
+
+        values = []
+        for operand in self._operands:
+            if isinstance(operand, LazyExpression):
+                values.append(operand._evaluate(container_value, constant_value))
+            else:
+                values.append((constant_value(operand), False))
+
+        operator = self._operator
+        ufunc = UFUNC_FUSABLE.get(operator.__name__)
+        fusable = ufunc is not None and all(_is_fusable(v) for v, _ in values)
+
+        if fusable and any(writeable for _, writeable in values):
+            try:
+                # zero-length operands give the result dtype without computation
+                dtype = ufunc(*(_sample(v) for v, _ in values)).dtype
+            except TypeError:
+                dtype = None
+            shape = np.broadcast(*(v for v, _ in values)).shape
+            for value, writeable in values:
+                if writeable and value.dtype == dtype and value.shape == shape:
+                    return ufunc(*(v for v, _ in values), out=value), True
+
+        if len(values) == 1:
+            value = values[0][0]
+            if fusable:
+                return ufunc(value), True
+            return operator(value), False
+
+        (lhs, _), (rhs, _) = values
+        if fusable:
+            return ufunc(lhs, rhs), True
+
+        if isinstance(lhs, np.ndarray):
+            return apply_binary_operator(
+                    values=lhs,
+                    other=rhs,
+                    other_is_array=isinstance(rhs, np.ndarray),
+                    operator=operator,
+                    ), False
+        # a constant on the left: apply as a reverse operator, as done by containers
+        operator_reverse = lambda rhs, lhs: operator(lhs, rhs)
+        operator_reverse.__name__ = 'r' + operator.__name__
+        return apply_binary_operator(
+                values=rhs,
+                other=lhs,
+                other_is_array=False,
+                operator=operator_reverse,
+                ), False
+
+    def evaluate(self) -> 'ContainerOperand':
+        '''
+        Evaluate the recorded operators, returning a new container. All containers are aligned once to the union of their labels; if any container is a :obj:`Frame`, a :obj:`Frame` is returned, and, as with :obj:`Frame` operators, :obj:`Series` are aligned to its columns. Each column is evaluated in turn, with operators on numeric values writing into intermediate arrays rather than allocating new ones.
+        '''
+        from static_frame.core.frame import Frame
+        from static_frame.core.series import Series
+        from static_frame.core.type_blocks import TypeBlocks
+
+        if self._operator is None:
+            return self._operands[0] #type: ignore
+
+        containers: tp.Dict[int, 'ContainerOperand'] = {}
+        for container in self._iter_containers():
+            containers.setdefault(id(container), container)
+
+        frames = [c for c in containers.values() if isinstance(c, Frame)]
+        series = [c for c in containers.values() if isinstance(c, Series)]
+
+        if not frames:
+            index = _union(s._index for s in series)
+            aligned = {id(s): _align(s._index, index, s.values) for s in series}
+
+            array, _ = self._evaluate(
+                    lambda c: aligned[id(c)],
+                    lambda v: v,
+                    )
+            if not isinstance(array, np.ndarray):
+                array = np.full(len(index), array)
+            array.flags.writeable = False
+            return Series(array, index=index, own_index=True)
+
+        index = _union(f._index for f in frames)
+        columns = _union(tuple(f._columns for f in frames) + tuple(s._index for s in series))
+        column_count = len(columns)
+
+        # for each Frame, the column position for each result column, or -1 if not found, and the IndexCorrespondence of rows, or None if already aligned
+        frame_columns: tp.Dict[int, np.ndarray] = {}
+        frame_rows: tp.Dict[int, tp.Optional[IndexCorrespondence]] = {}
+        for f in frames:
+            if f._index is index or f._index.equals(index):
+                frame_rows[id(f)] = None
+            else:
+                frame_rows[id(f)] = IndexCorrespondence.from_union(f._index, index)
+            if f._columns is columns or f._columns.equals(columns):
+                frame_columns[id(f)] = np.arange(column_count)
+            else:
+                ic = IndexCorrespondence.from_union(f._columns, columns)
+                positions = np.full(column_count, -1)
+                if ic.has_common:
+                    positions[ic.iloc_dst] = ic.iloc_src
+                frame_columns[id(f)] = positions
+        # Series are aligned to columns, providing an element per column
+        series_aligned = {id(s): _align(s._index, columns, s.values) for s in series}
+
+        def blocks() -> tp.Iterator[np.ndarray]:
+            for column in range(column_count):
+                def container_value(c: 'ContainerOperand') -> tp.Any:
+                    if isinstance(c, Series):
+                        # a single-element array, broadcast as an array (not as an element) to match Frame operators
+                        return series_aligned[id(c)][column: column + 1]
+                    position = frame_columns[id(c)][column]
+                    if position < 0:
+                        return np.full(len(index), np.nan)
+                    array = c._blocks._extract_array(column_key=position) #type: ignore
+                    ic = frame_rows[id(c)]
+                    if ic is None:
+                        return array
+                    return ic.resize_array(array, np.nan)
+
+                def constant_value(v: tp.Any) -> tp.Any:
+                    if isinstance(v, np.ndarray) and v.ndim == 2:
+                        return v[:, column]
+                    if isinstance(v, np.ndarray) and v.ndim == 1:
+                        return v[column: column + 1]
+                    return v
+
+                array, _ = self._evaluate(container_value, constant_value)
+                if not isinstance(array, np.ndarray) or len(array) != len(index):
+                    array = np.broadcast_to(array, len(index)).copy()
+                array.flags.writeable = False
+                yield array
+
+        return frames[0].__class__(
+                TypeBlocks.from_blocks(blocks(), shape_reference=(len(index), column_count)),
+                index=index,
+                columns=columns,
+                own_data=True,
+                own_index=True,
+                )
+
+
+def _union(indices: tp.Iterable['IndexBase']) -> 'IndexBase':
+    '''Return the union of all indices, formed without a union when indices are equal.
+    '''
+    union = None
+    for index in indices:
+        if union is None:
+            union = index
+        else:
+            union, _, _ = union_correspondence(union, index)
+    return union #type: ignore
+
+
+def _align(index: 'IndexBase',
+        union: 'IndexBase',
+        array: np.ndarray,
+        ) -> np.ndarray:
+    '''Align an array, of values per label in ``index``, to ``union``, filling with NaN.
+    '''
+    if index is union or index.equals(union):
+        return array
+    ic = IndexCorrespondence.from_union(index, union)
+    return ic.resize_array(array, np.nan)
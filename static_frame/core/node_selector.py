@@ -42,6 +42,19 @@ class InterfaceGetItem(Interface[TContainer]):
     def __getitem__(self, key: GetItemKeyType) -> TContainer:
         return self._func(key)
 
+class InterfaceSetItem(Interface[TContainer]):
+    '''An instance to serve as an interface for in-place assignment with a key.
+    '''
+
+    __slots__ = ('_func',)
+    INTERFACE = ('__setitem__',)
+
+    def __init__(self, func: tp.Callable[[GetItemKeyType, tp.Any], None]) -> None:
+        self._func: tp.Callable[[GetItemKeyType, tp.Any], None] = func
+
+    def __setitem__(self, key: GetItemKeyType, value: tp.Any) -> None:
+        self._func(key, value)
+
 #-------------------------------------------------------------------------------
 
 class InterfaceSelectDuo(Interface[TContainer]):
@@ -1,4 +1,5 @@
 
+import re
 import typing as tp
 import numpy as np
 from numpy import char as npc
@@ -7,8 +8,10 @@ from numpy import char as npc
 from static_frame.core.node_selector import Interface
 from static_frame.core.node_selector import TContainer
 from static_frame.core.util import array_from_element_method
+from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_OBJECT
 from static_frame.core.util import DTYPE_STR
-from static_frame.core.util import DTYPE_STR_KINDS
+from static_frame.core.util import DTYPE_STR_KIND
 from static_frame.core.util import EMPTY_TUPLE
 from static_frame.core.util import UFunc
 
@@ -35,10 +38,12 @@ class InterfaceString(Interface[TContainer]):
     INTERFACE = (
             'capitalize',
             'center',
+            'contains',
             'count',
             'decode',
             'encode',
             'endswith',
+            'extract',
             'find',
             'index',
             'isalnum',
@@ -53,6 +58,7 @@ class InterfaceString(Interface[TContainer]):
             'ljust',
             'lower',
             'lstrip',
+            'match',
             'partition',
             'replace',
             'rfind',
@@ -91,7 +97,8 @@ class InterfaceString(Interface[TContainer]):
         Block-wise processing of blocks after optional string conversion. Non-string conversion is necessary for ``decode``.
         '''
         for block in blocks:
-            if astype_str and block.dtype not in DTYPE_STR_KINDS:
+            # NOTE: unicode blocks, including 2D consolidated blocks, are passed directly to a single np.char call without a copy
+            if astype_str and block.dtype.kind != DTYPE_STR_KIND:
                 block = block.astype(DTYPE_STR)
             array = func(block, *args)
             array.flags.writeable = False
@@ -108,7 +115,7 @@ class InterfaceString(Interface[TContainer]):
         Element-wise processing of a methods on objects in a block, with pre-insert conversion to a tuple.
         '''
         for block in blocks:
-            if block.dtype not in DTYPE_STR_KINDS:
+            if block.dtype.kind != DTYPE_STR_KIND:
                 block = block.astype(DTYPE_STR)
 
             # resultant array is immutable
@@ -121,6 +128,37 @@ class InterfaceString(Interface[TContainer]):
                     )
             yield array
 
+    @staticmethod
+    def _process_regex_blocks(*,
+            blocks: BlocksType,
+            func: tp.Callable[[str], tp.Any],
+            dtype: np.dtype,
+            ) -> tp.Iterator[np.ndarray]:
+        '''
+        Element-wise application of a function of a compiled regular expression to each element of a block, after string conversion.
+        '''
+        for block in blocks:
+            if block.dtype.kind != DTYPE_STR_KIND:
+                block = block.astype(DTYPE_STR)
+
+            flat = block.ravel()
+            if dtype == DTYPE_BOOL:
+                array = np.fromiter(
+                        (func(e) for e in flat),
+                        count=len(flat),
+                        dtype=dtype,
+                        )
+            elif dtype == DTYPE_OBJECT:
+                array = np.empty(len(flat), dtype=dtype)
+                for i, e in enumerate(flat):
+                    array[i] = func(e)
+            else: # build strings into a list to determine size
+                array = np.array([func(e) for e in flat], dtype=dtype)
+
+            array = array.reshape(block.shape)
+            array.flags.writeable = False
+            yield array
+
     #---------------------------------------------------------------------------
     def capitalize(self) -> TContainer:
         '''
@@ -140,6 +178,21 @@ class InterfaceString(Interface[TContainer]):
         block_gen = self._process_blocks(self._blocks, npc.center, (width, fillchar))
         return self._blocks_to_container(block_gen)
 
+    def contains(self,
+            pattern: str,
+            flags: int = 0,
+            ) -> TContainer:
+        '''
+        Return a Boolean container indicating if the regular expression ``pattern`` is found anywhere in each element.
+        '''
+        regex = re.compile(pattern, flags)
+        block_gen = self._process_regex_blocks(
+                blocks=self._blocks,
+                func=lambda e: regex.search(e) is not None,
+                dtype=DTYPE_BOOL,
+                )
+        return self._blocks_to_container(block_gen)
+
     def count(self,
             sub: str,
             start: tp.Optional[int] = None,
@@ -187,6 +240,30 @@ class InterfaceString(Interface[TContainer]):
         block_gen = self._process_blocks(self._blocks, npc.endswith, (suffix, start, end))
         return self._blocks_to_container(block_gen)
 
+    def extract(self,
+            pattern: str,
+            flags: int = 0,
+            ) -> TContainer:
+        '''
+        For each element, return the first match of the regular expression ``pattern``. If ``pattern`` has no groups, the matched string is returned; if ``pattern`` has one group, that group is returned; elements without a match return an empty string. If ``pattern`` has more than one group, a tuple of groups is returned, or None for elements without a match.
+        '''
+        regex = re.compile(pattern, flags)
+
+        def func(e: str) -> tp.Any:
+            m = regex.search(e)
+            if regex.groups > 1:
+                return m.groups() if m else None
+            if m is None:
+                return ''
+            return m.group(regex.groups) or '' # an unmatched group is None
+
+        block_gen = self._process_regex_blocks(
+                blocks=self._blocks,
+                func=func,
+                dtype=DTYPE_OBJECT if regex.groups > 1 else DTYPE_STR,
+                )
+        return self._blocks_to_container(block_gen)
+
     def find(self,
             sub: str,
             start: tp.Optional[int] = None,
@@ -298,6 +375,21 @@ class InterfaceString(Interface[TContainer]):
         block_gen = self._process_blocks(self._blocks, npc.lstrip, (chars,))
         return self._blocks_to_container(block_gen)
 
+    def match(self,
+            pattern: str,
+            flags: int = 0,
+            ) -> TContainer:
+        '''
+        Return a Boolean container indicating if the regular expression ``pattern`` matches at the start of each element.
+        '''
+        regex = re.compile(pattern, flags)
+        block_gen = self._process_regex_blocks(
+                blocks=self._blocks,
+                func=lambda e: regex.match(e) is not None,
+                dtype=DTYPE_BOOL,
+                )
+        return self._blocks_to_container(block_gen)
+
     def partition(self,
             sep: str,
             ) -> TContainer:
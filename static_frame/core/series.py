@@ -33,9 +33,11 @@ from static_frame.core.index_auto import IndexAutoFactoryType
 from static_frame.core.index_base import IndexBase
 from static_frame.core.index_auto import RelabelInput
 from static_frame.core.index_correspondence import IndexCorrespondence
+from static_frame.core.index_correspondence import union_correspondence
 from static_frame.core.index_hierarchy import IndexHierarchy
 
 from static_frame.core.node_dt import InterfaceDatetime
+from static_frame.core.node_iter import array_from_vectorized
 from static_frame.core.node_iter import IterNodeApplyType
 from static_frame.core.node_iter import IterNodeDepthLevel
 from static_frame.core.node_iter import IterNodeGroup
@@ -45,16 +47,21 @@ from static_frame.core.node_iter import IterNodeWindow
 from static_frame.core.node_selector import InterfaceAssignTrio
 from static_frame.core.node_selector import InterfaceGetItem
 from static_frame.core.node_selector import InterfaceSelectTrio
+from static_frame.core.node_lazy import LazyExpression
 from static_frame.core.node_str import InterfaceString
 
 from static_frame.core.util import AnyCallable
 from static_frame.core.util import argmax_1d
 from static_frame.core.util import argmin_1d
+from static_frame.core.util import argnlargest
+from static_frame.core.util import array_fillna_directional
+from static_frame.core.util import argnsmallest
+from static_frame.core.util import argsort_keys
+from static_frame.core.util import monotonic_1d
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_to_duplicated
 from static_frame.core.util import array_to_groups_and_locations
 from static_frame.core.util import array2d_to_tuples
-from static_frame.core.util import binary_transition
 from static_frame.core.util import concat_resolved
 from static_frame.core.util import DEFAULT_SORT_KIND
 from static_frame.core.util import DepthLevelSpecifier
@@ -63,7 +70,6 @@ from static_frame.core.util import dtype_from_element
 from static_frame.core.util import DtypeSpecifier
 from static_frame.core.util import EMPTY_TUPLE
 from static_frame.core.util import FLOAT_TYPES
-from static_frame.core.util import full_for_fill
 from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import immutable_filter
 from static_frame.core.util import IndexConstructor
@@ -82,7 +88,6 @@ from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import PathSpecifierOrFileLike
 from static_frame.core.util import resolve_dtype
 from static_frame.core.util import SeriesInitializer
-from static_frame.core.util import slices_from_targets
 from static_frame.core.util import ufunc_axis_skipna
 from static_frame.core.util import ufunc_unique
 from static_frame.core.util import write_optional_file
@@ -107,12 +112,16 @@ class Series(ContainerOperand):
             'values',
             '_index',
             '_name',
+            '_monotonic_cache',
+            '_has_na_cache',
             )
 
 
     values: np.ndarray
 
     _index: IndexBase
+    _monotonic_cache: tp.Tuple[tp.Optional[bool], tp.Optional[bool]]
+    _has_na_cache: tp.Optional[bool]
 
     _NDIM: int = 1
 
@@ -397,6 +406,9 @@ class Series(ContainerOperand):
         if own_index and index is None:
             raise ErrorInitSeries('cannot own_index if no index is provided.')
 
+        self._monotonic_cache = (None, None)
+        self._has_na_cache = None
+
         #-----------------------------------------------------------------------
         # values assignment
 
@@ -596,6 +608,13 @@ class Series(ContainerOperand):
                 blocks_to_container=blocks_to_container,
                 )
 
+    @property
+    def via_lazy(self) -> LazyExpression:
+        '''
+        Interface for deferring operators applied to this container; call ``evaluate()`` on the resulting expression to align all containers once and apply operators, reusing intermediate arrays.
+        '''
+        return LazyExpression(None, (self,))
+
     @property
     def via_dt(self) -> InterfaceDatetime['Series']:
         '''
@@ -669,7 +688,9 @@ class Series(ContainerOperand):
                 container=self,
                 function_items=self._axis_element_items,
                 function_values=self._axis_element,
-                yield_type=IterNodeType.VALUES
+                yield_type=IterNodeType.VALUES,
+                function_vectorized=self._axis_element_vectorized,
+                function_map=self._axis_element_vectorized,
                 )
 
     @property
@@ -775,21 +796,7 @@ class Series(ContainerOperand):
                     name=self._name)
 
         ic = IndexCorrespondence.from_correspondence(self._index, index) #type: ignore
-
-        if ic.is_subset: # must have some common
-            values = self.values[ic.iloc_src]
-            values.flags.writeable = False
-            return self.__class__(
-                    values,
-                    index=index,
-                    own_index=True,
-                    name=self._name)
-
-        values = full_for_fill(self.values.dtype, len(index), fill_value) #type: ignore
-        # if some intersection of values
-        if ic.has_common:
-            values[ic.iloc_dst] = self.values[ic.iloc_src]
-        values.flags.writeable = False
+        values = ic.resize_array(self.values, fill_value)
 
         return self.__class__(values,
                 index=index,
@@ -985,32 +992,10 @@ class Series(ContainerOperand):
         Args:
             count: Set the limit of nan values to be filled per nan region. A value of 0 is equivalent to no limit.
         '''
-        sel = isna_array(array)
-        if not np.any(sel):
-            return array
-
-        def slice_condition(target_slice: slice) -> bool:
-            # NOTE: start is never None
-            return sel[target_slice.start] #type: ignore
-
-        # type is already compatible, no need for check
-        assigned = array.copy()
-        target_index = binary_transition(sel)
-        target_values = array[target_index]
-        length = len(array)
-
-        for target_slice, value in slices_from_targets(
-                target_index=target_index,
-                target_values=target_values,
-                length=length,
+        return array_fillna_directional(array,
                 directional_forward=directional_forward,
                 limit=limit,
-                slice_condition=slice_condition # isna True in region
-                ):
-            assigned[target_slice] = value
-
-        assigned.flags.writeable = False
-        return assigned
+                )
 
     @doc_inject(selector='fillna')
     def fillna_forward(self, limit: int = 0) -> 'Series':
@@ -1148,14 +1133,14 @@ class Series(ContainerOperand):
         if isinstance(other, Series):
             name = None
             other_is_array = True
-            if not self._index.equals(other._index):
-                # if not equal, create a new Index by forming the union
-                index = self._index.union(other._index)
-                # now need to reindex the Series
-                values = self.reindex(index, own_index=True, check_equals=False).values
-                other = other.reindex(index, own_index=True, check_equals=False).values
-            else:
-                other = other.values
+            # when labels already match, no union or reindexing is done
+            index, index_ic, index_ic_other = union_correspondence(
+                    self._index, other._index)
+            if index_ic is not None:
+                values = index_ic.resize_array(values, np.nan)
+            other = other.values
+            if index_ic_other is not None:
+                other = index_ic_other.resize_array(other, np.nan)
         elif isinstance(other, np.ndarray):
             name = None
             other_is_array = True
@@ -1388,11 +1373,18 @@ class Series(ContainerOperand):
 
         if not isinstance(values, np.ndarray): # if we have a single element
             return values #type: ignore
-        return self.__class__(
+        post = self.__class__(
                 values,
                 index=self._index.iloc[key],
                 name=self._name)
 
+        # sortedness, and the absence of missing values, are retained by ordered selections
+        if key is None or (isinstance(key, slice) and (key.step is None or key.step > 0)):
+            post._monotonic_cache = tuple(m or None for m in self._monotonic_cache) #type: ignore
+        if self._has_na_cache is False:
+            post._has_na_cache = False
+        return post
+
     def _extract_loc(self, key: GetItemKeyType) -> 'Series':
         '''
         Compatibility:
@@ -1517,6 +1509,21 @@ class Series(ContainerOperand):
             ) -> tp.Iterator[tp.Any]:
         yield from self.values
 
+    def _axis_element_vectorized(self,
+            func: AnyCallable,
+            *,
+            dtype: DtypeSpecifier = None,
+            name: NameType = None,
+            ) -> 'Series':
+        '''Call ``func`` with the values array, returning a Series of the result.
+        '''
+        return self.__class__(
+                array_from_vectorized(func(self.values), len(self.values), dtype),
+                index=self._index,
+                name=name,
+                own_index=True,
+                )
+
 
 
     def _axis_group_labels_items(self,
@@ -1683,16 +1690,19 @@ class Series(ContainerOperand):
         if self._index.depth > 1:
             v = self._index.values
             order = np.lexsort([v[:, i] for i in range(v.shape[1]-1, -1, -1)])
+            if not ascending:
+                order = order[::-1]
+            index_values = self._index.values[order]
+            index_values.flags.writeable = False
+            index = self._index.from_labels(index_values, name=self._index._name)
         else:
-            # this technique does not work when values is a 2d array
-            order = np.argsort(self._index.values, kind=kind)
-
-        if not ascending:
-            order = order[::-1]
-
-        index_values = self._index.values[order]
-        index_values.flags.writeable = False
-        index = self._index.from_labels(index_values, name=self._index._name)
+            index = self._index.sort(ascending=ascending)
+            if index is self._index: # already sorted
+                return self
+            # the sort order of an Index is cached
+            order = self._index._argsort()
+            if not ascending:
+                order = order[::-1]
 
         values = self.values[order]
         values.flags.writeable = False
@@ -1714,10 +1724,12 @@ class Series(ContainerOperand):
         Returns:
             :obj:`Series`
         '''
-        # argsort lets us do the sort once and reuse the results
-        order = np.argsort(self.values, kind=kind)
-        if not ascending:
-            order = order[::-1]
+        # values that are already sorted, and thus without missing values, need not be sorted
+        if self.is_monotonic_increasing if ascending else self.is_monotonic_decreasing:
+            return self
+
+        # argsort lets us do the sort once and reuse the results; sorting is stable in either direction
+        order = argsort_keys((self.values,), (ascending,), kind=kind)
 
         index_values = self._index.values[order]
         index_values.flags.writeable = False
@@ -1726,11 +1738,83 @@ class Series(ContainerOperand):
         values = self.values[order]
         values.flags.writeable = False
 
-        return self.__class__(values,
+        post = self.__class__(values,
                 index=index,
                 name=self._name,
                 own_index=True
                 )
+        if self._has_na_cache is False: # missing values are not ordered
+            post._monotonic_cache = (True, None) if ascending else (None, True)
+            post._has_na_cache = False
+        return post
+
+    #---------------------------------------------------------------------------
+    # sortedness and missing values; as values are immutable, these are computed once and cached
+
+    def _update_monotonic_cache(self) -> None:
+        if None in self._monotonic_cache:
+            self._monotonic_cache = monotonic_1d(self.values)
+
+    @property
+    def is_monotonic_increasing(self) -> bool:
+        '''
+        True if values are increasing.
+        '''
+        self._update_monotonic_cache()
+        return self._monotonic_cache[0] #type: ignore
+
+    @property
+    def is_monotonic_decreasing(self) -> bool:
+        '''
+        True if values are decreasing.
+        '''
+        self._update_monotonic_cache()
+        return self._monotonic_cache[1] #type: ignore
+
+    @property
+    def has_na(self) -> bool:
+        '''
+        True if any values are NaN, NaT, or None.
+        '''
+        if self._has_na_cache is None:
+            self._has_na_cache = bool(isna_array(self.values).any())
+        return self._has_na_cache
+
+    def iloc_nlargest(self, count: int = 5) -> np.ndarray:
+        '''
+        Return the integer positions of the ``count`` largest values, ordered from largest. Missing values are excluded; ties are selected and ordered by position.
+
+        Returns:
+            :obj:`numpy.ndarray`
+        '''
+        return argnlargest((self.values,), count)
+
+    def iloc_nsmallest(self, count: int = 5) -> np.ndarray:
+        '''
+        Return the integer positions of the ``count`` smallest values, ordered from smallest. Missing values are excluded; ties are selected and ordered by position.
+
+        Returns:
+            :obj:`numpy.ndarray`
+        '''
+        return argnsmallest((self.values,), count)
+
+    def nlargest(self, count: int = 5) -> 'Series':
+        '''
+        Return a new :obj:`Series` of the ``count`` largest values, ordered from largest. Unlike ``sort_values``, only the selected values are sorted.
+
+        Returns:
+            :obj:`Series`
+        '''
+        return self._extract_iloc(self.iloc_nlargest(count))
+
+    def nsmallest(self, count: int = 5) -> 'Series':
+        '''
+        Return a new :obj:`Series` of the ``count`` smallest values, ordered from smallest. Unlike ``sort_values``, only the selected values are sorted.
+
+        Returns:
+            :obj:`Series`
+        '''
+        return self._extract_iloc(self.iloc_nsmallest(count))
 
     def isin(self, other: tp.Iterable[tp.Any]) -> 'Series':
         '''
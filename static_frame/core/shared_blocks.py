@@ -0,0 +1,153 @@
+'''
+Tools for placing arrays and the blocks of a :obj:`Frame` in shared memory, such that process pool workers can build zero-copy views of them rather than receive pickled copies. ``multiprocessing.shared_memory`` requires Python 3.8 and is imported when needed.
+'''
+
+import sys
+import typing as tp
+
+import numpy as np
+
+from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import AnyCallable
+
+if tp.TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.frame import Frame # pylint: disable=W0611 #pragma: no cover
+    from static_frame.core.index_base import IndexBase # pylint: disable=W0611 #pragma: no cover
+
+
+# an array is described by the name of its shared memory segment, its shape, and its dtype; arrays that cannot be shared (object or empty arrays) are described by the array itself
+ArraySpec = tp.Union[tp.Tuple[str, tp.Tuple[int, ...], np.dtype], np.ndarray]
+# a Frame is described by its class, the specs of its blocks, its index, its columns, and its name
+FrameSpec = tp.Tuple[type, tp.Tuple[ArraySpec, ...], 'IndexBase', 'IndexBase', tp.Hashable]
+
+
+def shared_memory_validate() -> None:
+    '''Raise if shared memory is not available in this version of Python.
+    '''
+    if sys.version_info < (3, 8):
+        raise RuntimeError('use_shared_memory requires Python 3.8 or later')
+
+
+class SharedBlocks:
+    '''
+    Context manager that copies arrays into shared memory segments, returning picklable specs from which views can be built with :obj:`array_from_spec` and :obj:`frame_from_spec`. Segments are unlinked on exit.
+    '''
+
+    __slots__ = ('_segments',)
+
+    def __init__(self) -> None:
+        self._segments: tp.List['SharedMemory'] = []
+
+    def __enter__(self) -> 'SharedBlocks':
+        return self
+
+    def __exit__(self, *args: tp.Any) -> None:
+        for shm in self._segments:
+            shm.close()
+            shm.unlink()
+        self._segments.clear()
+
+    def share_array(self, array: np.ndarray) -> ArraySpec:
+        '''Copy an array into a new shared memory segment and return its spec.
+        '''
+        from multiprocessing.shared_memory import SharedMemory
+
+        if array.dtype == DTYPE_OBJECT or array.size == 0:
+            return array
+
+        shm = SharedMemory(create=True, size=array.nbytes)
+        self._segments.append(shm)
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        view[...] = array
+        return shm.name, array.shape, array.dtype
+
+    def share_frame(self, frame: 'Frame') -> FrameSpec:
+        '''Copy the blocks of a Frame into shared memory segments and return its spec. The index and columns are not shared, and are pickled with the spec.
+        '''
+        blocks = tuple(self.share_array(b) for b in frame._blocks._blocks)
+        return frame.__class__, blocks, frame._index, frame._columns, frame._name
+
+
+#-------------------------------------------------------------------------------
+# worker-side functions
+
+# segments attached in this process; retained so that views remain valid for the life of the process
+_ATTACHED: tp.Dict[str, 'SharedMemory'] = {}
+
+def array_from_spec(spec: ArraySpec) -> np.ndarray:
+    '''Return an immutable array, a view of a shared memory segment if ``spec`` describes one.
+    '''
+    if isinstance(spec, np.ndarray):
+        return spec
+
+    from multiprocessing.shared_memory import SharedMemory
+
+    name, shape, dtype = spec
+    shm = _ATTACHED.get(name)
+    if shm is None:
+        shm = SharedMemory(name=name)
+        _ATTACHED[name] = shm
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    array.flags.writeable = False
+    return array
+
+def frame_from_spec(spec: FrameSpec) -> 'Frame':
+    '''Return a Frame built from views of shared memory segments.
+    '''
+    from static_frame.core.type_blocks import TypeBlocks
+
+    cls, blocks, index, columns, name = spec
+    return cls(TypeBlocks.from_blocks(array_from_spec(b) for b in blocks), # type: ignore
+            index=index,
+            columns=columns,
+            name=name,
+            own_data=True,
+            own_index=True,
+            own_columns=cls.STATIC, # type: ignore
+            )
+
+
+# state set in each worker by the pool initializer, such that the source Frame, positions, and function are transferred once per worker rather than once per group
+_GROUP_STATE: tp.Dict[str, tp.Any] = {}
+
+def group_init(
+        frame_spec: FrameSpec,
+        positions_spec: ArraySpec,
+        axis: int,
+        func: AnyCallable,
+        yield_items: bool,
+        ) -> None:
+    '''Pool initializer for :obj:`group_apply`.
+    '''
+    _GROUP_STATE['frame'] = frame_from_spec(frame_spec)
+    _GROUP_STATE['positions'] = array_from_spec(positions_spec)
+    _GROUP_STATE['axis'] = axis
+    _GROUP_STATE['func'] = func
+    _GROUP_STATE['yield_items'] = yield_items
+
+def group_apply(item: tp.Tuple[tp.Hashable, int, int]) -> tp.Any:
+    '''Extract the group described by the label, start, and stop of its positions from the Frame set by :obj:`group_init`, and apply the function.
+    '''
+    label, start, stop = item
+    frame = _GROUP_STATE['frame']
+    key = _GROUP_STATE['positions'][start: stop]
+
+    if _GROUP_STATE['axis'] == 0:
+        group = frame.__class__(frame._blocks._extract(row_key=key),
+                index=frame._index[key],
+                columns=frame._columns,
+                own_columns=frame.STATIC,
+                own_index=True,
+                own_data=True)
+    else:
+        group = frame.__class__(frame._blocks._extract(column_key=key),
+                index=frame._index,
+                columns=frame._columns[key],
+                own_index=True,
+                own_columns=True,
+                own_data=True)
+
+    if _GROUP_STATE['yield_items']:
+        return _GROUP_STATE['func']((label, group))
+    return _GROUP_STATE['func'](group)
@@ -21,6 +21,9 @@ from static_frame.core.util import path_filter
 from static_frame.core.util import PathSpecifier
 from static_frame.core.util import DepthLevelSpecifier
 
+if tp.TYPE_CHECKING:
+    from concurrent.futures import Executor # pylint: disable=W0611 #pragma: no cover
+
 
 #-------------------------------------------------------------------------------
 class StoreConfig(metaclass=InterfaceMeta):
@@ -345,6 +348,24 @@ class Store:
         '''
         raise NotImplementedError() #pragma: no cover
 
+    async def aread(self,
+            label: str,
+            *,
+            config: tp.Optional[StoreConfig] = None,
+            container_type: tp.Type[Frame] = Frame,
+            executor: tp.Optional['Executor'] = None,
+            ) -> Frame:
+        '''Read a single Frame, given by `label`, from the Store, calling :obj:`read` in an executor such that an asyncio event loop is not blocked. If ``executor`` is None, the event loop's default executor is used; Stores that cannot be read from multiple threads (such as HDF5) should be given an executor with a single worker.
+        '''
+        import asyncio
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(executor, partial(self.read,
+                label,
+                config=config,
+                container_type=container_type,
+                ))
+
     def write(self,
             items: tp.Iterable[tp.Tuple[str, Frame]],
             *,
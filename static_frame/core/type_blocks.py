@@ -9,6 +9,7 @@ from functools import partial
 import numpy as np
 
 
+from static_frame.core.block_executor import map_blocks
 from static_frame.core.container import ContainerOperand
 from static_frame.core.container_util import apply_binary_operator_blocks
 from static_frame.core.display import Display
@@ -22,11 +23,16 @@ from static_frame.core.node_selector import InterfaceGetItem
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_to_groups_and_locations
 from static_frame.core.util import array2d_to_tuples
-from static_frame.core.util import binary_transition
+from static_frame.core.util import array_fillna_directional
 from static_frame.core.util import column_2d_filter
 from static_frame.core.util import DTYPE_BOOL
+from static_frame.core.util import DTYPE_FLOAT_DEFAULT
+from static_frame.core.util import DTYPE_FLOAT_KIND
 from static_frame.core.util import DTYPE_INEXACT_KINDS
+from static_frame.core.util import DTYPE_INT_DEFAULT
+from static_frame.core.util import DTYPE_MOMENTS_KINDS
 from static_frame.core.util import DTYPE_OBJECT
+from static_frame.core.util import DTYPE_STR_KINDS
 from static_frame.core.util import dtype_to_fill_value
 from static_frame.core.util import DtypeSpecifier
 from static_frame.core.util import dtype_from_element
@@ -36,6 +42,7 @@ from static_frame.core.util import GetItemKeyType
 from static_frame.core.util import GetItemKeyTypeCompound
 from static_frame.core.util import immutable_filter
 from static_frame.core.util import INT_TYPES
+from static_frame.core.util import fill_positions_directional
 from static_frame.core.util import isna_array
 from static_frame.core.util import iterable_to_array_nd
 from static_frame.core.util import KEY_ITERABLE_TYPES
@@ -44,12 +51,13 @@ from static_frame.core.util import mloc
 from static_frame.core.util import NULL_SLICE
 from static_frame.core.util import resolve_dtype
 from static_frame.core.util import resolve_dtype_iter
+from static_frame.core.util import ROW_CHUNK_ELEMENTS
 from static_frame.core.util import row_1d_filter
 from static_frame.core.util import shape_filter
 from static_frame.core.util import slice_to_ascending_slice
-from static_frame.core.util import slices_from_targets
 from static_frame.core.util import UFunc
 from static_frame.core.util import ufunc_axis_skipna
+from static_frame.core.util import UFUNC_SHAPE_CARRY
 from static_frame.core.util import UNIT_SLICE
 
 #-------------------------------------------------------------------------------
@@ -61,14 +69,17 @@ class TypeBlocks(ContainerOperand):
     # related to Pandas BlockManager
     __slots__ = (
             '_blocks',
-            '_dtypes',
-            '_index',
+            '_index_cache',
+            '_index_store',
             '_shape',
             '_row_dtype',
             )
 
     STATIC = False
 
+    # non-composable functions that can be accumulated on axis 1 without consolidation
+    _UFUNC_MOMENTS = frozenset((np.mean, np.var, np.std))
+
     #---------------------------------------------------------------------------
     # constructors
 
@@ -88,9 +99,6 @@ class TypeBlocks(ContainerOperand):
 
         '''
         blocks: tp.List[np.ndarray] = [] # ordered blocks
-        dtypes: tp.List[np.dtype] = [] # column position to dtype
-        index: tp.List[tp.Tuple[int, int]] = [] # columns position to blocks key
-        block_count = 0
 
         row_count: tp.Optional[int]
 
@@ -103,14 +111,9 @@ class TypeBlocks(ContainerOperand):
             if column_count == 0:
                 # set shape but do not store array
                 return cls(blocks=blocks,
-                        dtypes=dtypes,
-                        index=index,
                         shape=(row_count, column_count)
                         )
             blocks.append(immutable_filter(raw_blocks))
-            for i in range(column_count):
-                index.append((block_count, i))
-                dtypes.append(raw_blocks.dtype)
 
         else: # an iterable of blocks
             row_count = None
@@ -136,14 +139,7 @@ class TypeBlocks(ContainerOperand):
                     continue
 
                 blocks.append(immutable_filter(block))
-
-                # store position to key of block, block columns
-                for i in range(c):
-                    index.append((block_count, i))
-                    dtypes.append(block.dtype)
-
                 column_count += c
-                block_count += 1
 
         # blocks cam be empty
         if row_count is None:
@@ -155,8 +151,6 @@ class TypeBlocks(ContainerOperand):
 
         return cls(
                 blocks=blocks,
-                dtypes=dtypes,
-                index=index,
                 shape=(row_count, column_count),
                 )
 
@@ -199,28 +193,27 @@ class TypeBlocks(ContainerOperand):
             return cls.from_blocks(a)
 
         # for arrays with no width, favor storing shape alone and not creating an array object; the shape will be binding for future appending
-        return cls(blocks=list(), dtypes=list(), index=list(), shape=shape)
+        return cls(blocks=list(), shape=shape)
 
     #---------------------------------------------------------------------------
 
     def __init__(self, *,
             blocks: tp.List[np.ndarray],
-            dtypes: tp.List[np.dtype],
-            index: tp.List[tp.Tuple[int, int]],
-            shape: tp.Tuple[int, int]
+            shape: tp.Tuple[int, int],
+            index: tp.Optional[np.ndarray] = None,
             ) -> None:
         '''
         Default constructor. We own all lists passed in to this constructor.
 
         Args:
             blocks: A list of one or two-dimensional NumPy arrays
-            dtypes: list of dtypes per external column
-            index: list of pairs, where the first element is the block index, the second elemetns is the intra-block column
             shape: two-element tuple defining row and column count. A (0, 0) shape is permitted for empty TypeBlocks.
+            index: optional, immutable two-column integer array where, for each external column, the first column is the block index and the second column is the intra-block column; if not provided, it is derived from ``blocks`` when first needed.
         '''
         self._blocks = blocks
-        self._dtypes = dtypes
-        self._index = index # list where index, as column, gets block, offset
+        self._index_cache = index
+        # writable storage, owned by this instance, of which the column locator is a view; None if not derived or if shared
+        self._index_store: tp.Optional[np.ndarray] = None
         self._shape = shape
 
         if self._blocks:
@@ -240,15 +233,71 @@ class TypeBlocks(ContainerOperand):
         for b in self._blocks:
             b.flags.writeable = False
 
+        # reanimated storage no longer backs the column locator
+        self._index_store = None
+        if self._index_cache is not None:
+            self._index_cache.flags.writeable = False
+
     def copy(self) -> 'TypeBlocks':
         '''
         Return a new TypeBlocks. Underlying arrays are not copied.
         '''
         return self.__class__(
                 blocks=[b for b in self._blocks],
-                dtypes=self._dtypes.copy(), # list
-                index=self._index.copy(),
-                shape=self._shape)
+                shape=self._shape,
+                index=self._index_share(),
+                )
+
+    #---------------------------------------------------------------------------
+    # column locator
+
+    @property
+    def _index(self) -> np.ndarray:
+        '''
+        A two-column integer array where, for each external column, the first column is the block index and the second column is the intra-block column. Derived from block widths and cached; ``append`` extends the cache.
+        '''
+        if self._index_cache is None:
+            widths = np.fromiter(
+                    (1 if b.ndim == 1 else b.shape[1] for b in self._blocks),
+                    count=len(self._blocks),
+                    dtype=DTYPE_INT_DEFAULT,
+                    )
+            store = np.empty((self._shape[1], 2), dtype=DTYPE_INT_DEFAULT)
+            store[:, 0] = np.repeat(np.arange(len(widths)), widths)
+            # intra-block column is the column position less the start of its block
+            starts = np.cumsum(widths) - widths
+            store[:, 1] = np.arange(self._shape[1]) - np.repeat(starts, widths)
+            index = store[:]
+            index.flags.writeable = False
+            self._index_store = store
+            self._index_cache = index
+        return self._index_cache
+
+    def _index_share(self) -> tp.Optional[np.ndarray]:
+        '''
+        Return the column locator, if derived, for use by another instance. As storage can no longer be written in place, it will be copied when next extended.
+        '''
+        self._index_store = None
+        return self._index_cache
+
+    def _index_update(self, start: int, width: int) -> None:
+        '''
+        If the column locator is derived, assign the columns from ``start`` to ``start + width`` to the last block. Storage grows geometrically, such that appending is amortized constant time.
+        '''
+        if self._index_cache is None:
+            return
+        stop = start + width
+        store = self._index_store
+        if store is None or len(store) < stop:
+            store = np.empty((max(stop, 2 * len(self._index_cache)), 2),
+                    dtype=DTYPE_INT_DEFAULT)
+            store[:start] = self._index_cache[:start]
+            self._index_store = store
+        store[start: stop, 0] = len(self._blocks) - 1
+        store[start: stop, 1] = np.arange(width)
+        index = store[:stop]
+        index.flags.writeable = False
+        self._index_cache = index
 
     #---------------------------------------------------------------------------
     # new properties
@@ -259,7 +308,9 @@ class TypeBlocks(ContainerOperand):
         Return an immutable array that, for each realizable column (not each block), the dtype is given.
         '''
         # this creates a new array every time it is called; could cache
-        a = np.array(self._dtypes, dtype=np.dtype)
+        block_dtypes = np.empty(len(self._blocks), dtype=DTYPE_OBJECT)
+        block_dtypes[:] = [b.dtype for b in self._blocks]
+        a = block_dtypes[self._index[:, 0]]
         a.flags.writeable = False
         return a
 
@@ -389,52 +440,50 @@ class TypeBlocks(ContainerOperand):
             axis: 0 iterates over columns, 1 iterates over rows
         '''
         if axis == 1: # iterate over rows
-            unified = self.unified
-            # iterate over rows; might be faster to create entire values
-            if not reverse:
-                row_idx_iter = range(self._shape[0])
-            else:
-                row_idx_iter = range(self._shape[0] - 1, -1, -1)
-
-            for i in row_idx_iter:
-                if unified:
-                    b = self._blocks[0]
+            row_count = self._shape[0]
+            if len(self._blocks) == 1:
+                b = self._blocks[0]
+                row_idx_iter = range(row_count) if not reverse else range(row_count - 1, -1, -1)
+                for i in row_idx_iter:
                     if b.ndim == 1:
                         # single element slice to force array creation (not an element)
                         yield b[i: i+1]
                     else:
                         # if a 2d array, we can yield rows through simple indexing
                         yield b[i]
+                return
+
+            # convert chunks of rows into a row-major buffer, casting each block once per chunk, and yield row views
+            chunk_size = max(1, ROW_CHUNK_ELEMENTS // max(1, self._shape[1]))
+            starts = range(0, row_count, chunk_size)
+            for start in (starts if not reverse else reversed(starts)):
+                stop = min(start + chunk_size, row_count)
+                buffer = np.empty((stop - start, self._shape[1]), dtype=self._row_dtype)
+                column = 0
+                for b in self._blocks:
+                    if b.ndim == 1:
+                        buffer[:, column] = b[start: stop]
+                        column += 1
+                    else:
+                        width = b.shape[1]
+                        buffer[:, column: column + width] = b[start: stop]
+                        column += width
+                buffer.flags.writeable = False
+                if not reverse:
+                    yield from buffer
                 else:
-                    # cannot use a generator w/ np concat
-                    # use == for type comparisons
-                    parts = []
-                    for b in self._blocks:
-                        if b.ndim == 1:
-                            # get a slice to permit concatenation
-                            key: tp.Union[int, slice] = slice(i, i+1)
-                        else:
-                            key = i
-                        if b.dtype == self._row_dtype:
-                            parts.append(b[key])
-                        else:
-                            parts.append(b[key].astype(self._row_dtype))
-                    part = np.concatenate(parts)
-                    part.flags.writeable = False
-                    yield part
+                    yield from buffer[::-1]
 
         elif axis == 0: # iterate over columns
-            if not reverse:
-                block_column_iter: tp.Iterable[tp.Tuple[int, int]] = self._index
-            else:
-                block_column_iter = reversed(self._index)
-
-            for block_idx, column in block_column_iter:
-                b = self._blocks[block_idx]
+            blocks: tp.Iterable[np.ndarray] = (self._blocks if not reverse
+                    else reversed(self._blocks))
+            for b in blocks:
                 if b.ndim == 1:
                     yield b
                 else:
-                    yield b[:, column] # excpeted to be immutable
+                    columns = range(b.shape[1]) if not reverse else range(b.shape[1] - 1, -1, -1)
+                    for column in columns:
+                        yield b[:, column] # excpeted to be immutable
         else:
             raise AxisInvalid(f'no support for axis: {axis}')
 
@@ -577,7 +626,9 @@ class TypeBlocks(ContainerOperand):
         '''Return a new TypeBlocks that unifies all adjacent types.
         '''
         # note: not sure if we have a single block if we should return a new TypeBlocks instance (as done presently), or simply return self; either way, no new np arrays will be created
-        return self.from_blocks(self.consolidate_blocks(raw_blocks=self._blocks))
+        return self.from_blocks(self.consolidate_blocks(raw_blocks=self._blocks),
+                shape_reference=self._shape,
+                )
 
 
     def resize_blocks(self, *,
@@ -645,7 +696,7 @@ class TypeBlocks(ContainerOperand):
 
         else: # both defined
             assert columns_ic is not None and index_ic is not None
-            if not columns_ic.has_common and not index_ic.has_common:
+            if not columns_ic.has_common or not index_ic.has_common:
                 # just return an empty frame; what type it shold be is not clear
                 shape = index_ic.size, columns_ic.size
                 values = full_for_fill(self._row_dtype, shape, fill_value)
@@ -694,17 +745,16 @@ class TypeBlocks(ContainerOperand):
                             yield values
 
 
-    def group(self,
+    def group_locations(self,
             axis: int,
             key: GetItemKeyTypeCompound,
-            # drop: bool = False,
-            ) -> tp.Iterator[tp.Tuple[np.ndarray, np.ndarray, 'TypeBlocks']]:
+            ) -> tp.Tuple[tp.Iterable[tp.Hashable], np.ndarray]:
         '''
         Args:
             key: iloc selector on opposite axis
 
         Returns:
-            Generator of group, selection pairs, where selection is an np.ndarray. Returned is as an np.ndarray if key is more than one column.
+            An iterable of groups, and an array of the position of the group of each row (axis 0) or column (axis 1). Groups are tuples if key is more than one column.
         '''
         # in worse case this will make a copy of the values extracted; this is probably still cheaper than iterating manually through rows/columns
         unique_axis = None
@@ -734,6 +784,22 @@ class TypeBlocks(ContainerOperand):
             elif axis == 1:
                 groups = array2d_to_tuples(groups.T)
 
+        return groups, locations
+
+    def group(self,
+            axis: int,
+            key: GetItemKeyTypeCompound,
+            # drop: bool = False,
+            ) -> tp.Iterator[tp.Tuple[np.ndarray, np.ndarray, 'TypeBlocks']]:
+        '''
+        Args:
+            key: iloc selector on opposite axis
+
+        Returns:
+            Generator of group, selection pairs, where selection is an np.ndarray. Returned is as an np.ndarray if key is more than one column.
+        '''
+        groups, locations = self.group_locations(axis=axis, key=key)
+
         for idx, g in enumerate(groups):
             selection = locations == idx
             if axis == 0: # return row extractions
@@ -780,10 +846,13 @@ class TypeBlocks(ContainerOperand):
             if axis == 0:
                 # reduce all rows to 1d with column width
                 shape: tp.Union[int, tp.Tuple[int, int]] = self._shape[1]
-                pos = 0
             elif composable: # axis 1
                 # reduce all columns to 2d blocks with 1 column
                 shape = (self._shape[0], len(self._blocks))
+            elif (ufunc in self._UFUNC_MOMENTS
+                    and self._row_dtype.kind in DTYPE_MOMENTS_KINDS):
+                # axis 1, not block composable, but can be accumulated per row across blocks
+                return self._ufunc_moments_axis_1(ufunc=ufunc, skipna=skipna)
             else: # axis 1, not block composable
                 # Cannot do block-wise processing, must resolve to single array and return
                 array = self._blocks_to_array(
@@ -812,24 +881,28 @@ class TypeBlocks(ContainerOperand):
             # If dtypes were specified, we know we have specific targets in mind for output
             out = np.empty(shape, dtype=dtype)
             # print('out', out, out.dtype, self._row_dtype)
-            for idx, b in enumerate(self._blocks):
+            def blocks() -> tp.Iterator[tp.Tuple[int, int, np.ndarray]]:
+                # yield the block index and the start position of the block in axis 0 results
+                pos = 0
+                for idx, b in enumerate(self._blocks):
+                    yield idx, pos, b
+                    pos += 1 if b.ndim == 1 else b.shape[1]
 
+            def process(item: tp.Tuple[int, int, np.ndarray]) -> None:
+                # each block writes to a distinct region of out, so blocks can be processed in any order
+                idx, pos, b = item
                 if astype_pre and b.dtype != dtype:
                     b = b.astype(dtype)
 
                 if axis == 0: # Combine rows, end with columns shape.
                     if b.size == 1 and size_one_unity and not skipna:
                         # No function call is necessary; if skipna could turn NaN to zero.
-                        end = pos + 1
                         # Can assign an array, even 2D, as an element if size is 1
                         out[pos] = b
                     elif b.ndim == 1:
-                        end = pos + 1
                         out[pos] = func(array=b, axis=axis)
                     else:
-                        end = pos + b.shape[1]
-                        func(array=b, axis=axis, out=out[pos: end])
-                    pos = end
+                        func(array=b, axis=axis, out=out[pos: pos + b.shape[1]])
                 else:
                     # Combine columns, end with block length shape and then call func again, for final result
                     if b.size == 1 and size_one_unity and not skipna:
@@ -844,6 +917,12 @@ class TypeBlocks(ContainerOperand):
                     else:
                         func(array=b, axis=axis, out=out[:, idx])
 
+            for _ in map_blocks(process,
+                    blocks(),
+                    size=self._shape[0] * self._shape[1],
+                    ):
+                pass
+
         if axis == 0: # nothing more to do
             out.flags.writeable = False
             return out
@@ -853,6 +932,96 @@ class TypeBlocks(ContainerOperand):
         return result
 
 
+    def ufunc_shape_skipna(self, *,
+            axis: int,
+            skipna: bool,
+            ufunc: UFunc,
+            ufunc_skipna: UFunc,
+            dtype: tp.Optional[np.dtype] = None,
+            ) -> 'TypeBlocks':
+        '''Apply a cumulative function that retains the shape of the blocks. For axis 0, the function is applied per block, retaining block dtypes. For axis 1, the function is applied per block, and the last column of each result is carried into the next block with the combining ufunc defined in ``UFUNC_SHAPE_CARRY``; if no combining ufunc is known, blocks are consolidated into a single array.
+        '''
+        if axis < 0 or axis > 1:
+            raise RuntimeError(f'invalid axis: {axis}')
+
+        func = ufunc_skipna if skipna else ufunc
+        carry_func = UFUNC_SHAPE_CARRY.get(ufunc)
+
+        if self._shape[1] == 0 or (axis == 1 and carry_func is None):
+            array = self._blocks_to_array(
+                    blocks=self._blocks,
+                    shape=self._shape,
+                    row_dtype=self._row_dtype,
+                    row_multiple=True)
+            return self.from_blocks(func(array, axis=axis, dtype=dtype))
+
+        # when a consolidated array would be object, string blocks are processed as object, such that string concatenation is retained
+        str_to_obj = self._row_dtype == DTYPE_OBJECT
+
+        def blocks() -> tp.Iterator[np.ndarray]:
+            carry: tp.Optional[np.ndarray] = None
+            for b in self._blocks:
+                if str_to_obj and b.dtype.kind in DTYPE_STR_KINDS:
+                    b = b.astype(DTYPE_OBJECT)
+                if axis == 0:
+                    post = func(b, axis=0, dtype=dtype)
+                else:
+                    post = func(column_2d_filter(b), axis=1, dtype=dtype)
+                    if carry is not None:
+                        # carry is the left operand to retain order for non-commutative (object) operations
+                        post = carry_func(carry[:, np.newaxis], post)
+                    carry = post[:, -1]
+                    if b.ndim == 1:
+                        post = post[:, 0]
+                post.flags.writeable = False
+                yield post
+
+        return self.from_blocks(blocks(), shape_reference=self._shape)
+
+    def _ufunc_moments_axis_1(self, *,
+            ufunc: UFunc,
+            skipna: bool,
+            ) -> np.ndarray:
+        '''
+        Compute the mean, variance, or standard deviation of each row by accumulating per-row sum, count, and sum of squared differences (M2) block by block, avoiding consolidating all blocks into a single array. M2 is accumulated in a second pass over the blocks, after the mean is known, matching the results of NumPy on a consolidated array.
+        '''
+        rows = self._shape[0]
+        total = np.zeros(rows, dtype=DTYPE_FLOAT_DEFAULT)
+        count = np.zeros(rows, dtype=DTYPE_FLOAT_DEFAULT)
+
+        def blocks() -> tp.Iterator[tp.Tuple[np.ndarray, bool]]:
+            for b in self._blocks:
+                # only float blocks can have NaN to skip
+                nan_skip = skipna and b.dtype.kind == DTYPE_FLOAT_KIND
+                yield column_2d_filter(b).astype(DTYPE_FLOAT_DEFAULT, copy=False), nan_skip
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for b, nan_skip in blocks():
+                if nan_skip:
+                    total += np.nansum(b, axis=1)
+                    count += (~np.isnan(b)).sum(axis=1)
+                else:
+                    total += b.sum(axis=1)
+                    count += b.shape[1]
+            mean = total / count # NaN where count is zero
+
+            if ufunc is np.mean:
+                result = mean
+            else:
+                m2 = np.zeros(rows, dtype=DTYPE_FLOAT_DEFAULT)
+                for b, nan_skip in blocks():
+                    sq = (b - mean[:, None]) ** 2
+                    m2 += np.nansum(sq, axis=1) if nan_skip else sq.sum(axis=1)
+                result = m2 / count
+                if ufunc is np.std:
+                    result = np.sqrt(result)
+
+        # match the dtype of the function applied to a consolidated array
+        if self._row_dtype.kind == DTYPE_FLOAT_KIND:
+            result = result.astype(self._row_dtype, copy=False)
+        result.flags.writeable = False
+        return result
+
     #---------------------------------------------------------------------------
     def __round__(self, decimals: int = 0) -> 'TypeBlocks':
         '''
@@ -862,9 +1031,8 @@ class TypeBlocks(ContainerOperand):
         # for now, we do not expose application of rounding on a subset of blocks, but is doable by setting the column_key
         return self.__class__(
                 blocks=list(self._ufunc_blocks(column_key=NULL_SLICE, func=func)),
-                dtypes=self._dtypes.copy(), # list
-                index=self._index.copy(),
-                shape=self._shape
+                shape=self._shape,
+                index=self._index_share(),
                 )
 
     def __len__(self) -> int:
@@ -933,35 +1101,46 @@ class TypeBlocks(ContainerOperand):
 
 
     @classmethod
-    def _indices_to_contiguous_pairs(cls, indices: tp.Iterable[tp.Tuple[int, int]]
-        ) -> tp.Iterator[tp.Tuple[int, slice]]:
+    def _indices_to_contiguous_pairs(cls,
+            indices: tp.Union[np.ndarray, tp.Iterable[tp.Tuple[int, int]]]
+            ) -> tp.Iterator[tp.Tuple[int, slice]]:
         '''Indices are pairs of (block_idx, value); convert these to pairs of (block_idx, slice) when we identify contiguous indices within a block (these are block slices)
 
         Args:
-            indices: can be a generator
-        '''
-        # store pairs of block idx, ascending col list
-        last = None
-        for block_idx, col in indices:
-            if not last:
-                last = (block_idx, col)
-                bundle = [col]
-                continue
-            if last[0] == block_idx and abs(col - last[1]) == 1:
-                # if contiguous, update last, add to bundle
-                last = (block_idx, col)
-                # do not need to store all col, only the last, however probably easier to just accumulate all
-                bundle.append(col)
-                continue
-            # either new block, or not contiguous on same block
-            yield (last[0], cls._cols_to_slice(bundle))
-            # start a new bundle
-            bundle = [col]
-            last = (block_idx, col)
-
-        # last can be None
-        if last and bundle:
-            yield (last[0], cls._cols_to_slice(bundle))
+            indices: a two-column integer array, as selected from ``_index``, or an iterable (or generator) of pairs.
+        '''
+        if not isinstance(indices, np.ndarray):
+            indices = np.array(list(indices), dtype=DTYPE_INT_DEFAULT).reshape(-1, 2)
+        if not len(indices):
+            return
+
+        block_idx = indices[:, 0]
+        columns = indices[:, 1]
+
+        # a step continues a run if it stays within a block and moves by one column; a run cannot change direction
+        steps = columns[1:] - columns[:-1]
+        contiguous = (block_idx[1:] == block_idx[:-1]) & (np.abs(steps) == 1)
+        contiguous[1:] &= ~(contiguous[:-1] & (steps[1:] != steps[:-1]))
+
+        starts = np.empty(len(indices), dtype=DTYPE_BOOL)
+        starts[0] = True
+        starts[1:] = ~contiguous
+        run_starts = np.nonzero(starts)[0]
+        run_stops = np.empty(len(run_starts), dtype=DTYPE_INT_DEFAULT)
+        run_stops[:-1] = run_starts[1:] - 1
+        run_stops[-1] = len(indices) - 1
+
+        for block, start, stop in zip(
+                block_idx[run_starts].tolist(),
+                columns[run_starts].tolist(),
+                columns[run_stops].tolist(),
+                ):
+            if stop >= start: # ascending or single column
+                yield block, slice(start, stop + 1)
+            elif stop == 0:
+                yield block, slice(start, None, -1)
+            else: # stop is less than start, need to reduce by 1 to cover range
+                yield block, slice(start, stop - 1, -1)
 
     def _all_block_slices(self) -> tp.Iterator[tp.Tuple[int, slice]]:
         '''
@@ -991,22 +1170,24 @@ class TypeBlocks(ContainerOperand):
         else:
             if isinstance(key, INT_TYPES):
                 # the index has the pair block, column integer
-                yield self._index[key]
+                block_idx, column = self._index[key].tolist()
+                yield block_idx, column
             else: # all cases where we try to get contiguous slices
                 if isinstance(key, slice):
                     #  slice the index; null slice already handled
                     if not retain_key_order:
                         key = slice_to_ascending_slice(key, self._shape[1])
-                    indices: tp.Iterable[tp.Tuple[int, int]] = self._index[key]
+                    indices: np.ndarray = self._index[key]
                 elif isinstance(key, np.ndarray) and key.dtype == bool:
-                    # NOTE: if self._index was an array we could use Boolean selection directly
-                    indices = (self._index[idx] for idx, v in enumerate(key) if v)
+                    indices = self._index[key]
                 elif isinstance(key, KEY_ITERABLE_TYPES):
-                    # an iterable of keys, may not have contiguous regions; provide in the order given; set as a generator; self._index is a list, not an np.array, so cannot slice self._index; requires iteration in passed generator so probably this is as fast as it can be.
-                    if retain_key_order:
-                        indices = (self._index[x] for x in key)
+                    # an iterable of keys, may not have contiguous regions; provide in the order given
+                    if not len(key):
+                        indices = self._index[:0]
+                    elif retain_key_order:
+                        indices = self._index[key]
                     else:
-                        indices = (self._index[x] for x in sorted(key))
+                        indices = self._index[np.sort(key)]
                 elif key is None: # get all
                     indices = self._index
                 else:
@@ -1064,69 +1245,81 @@ class TypeBlocks(ContainerOperand):
         '''
         Generator producer of np.ndarray.
         '''
-        # block slices must be in ascending order, not key order
-        block_slices = iter(self._key_to_block_slices(
-                column_key,
-                retain_key_order=False))
+        def block_parts() -> tp.Iterator[tp.Tuple[np.ndarray, bool]]:
+            '''Generator of pairs of an array and a Boolean, True if the array is to be converted.
+            '''
+            # block slices must be in ascending order, not key order
+            block_slices = iter(self._key_to_block_slices(
+                    column_key,
+                    retain_key_order=False))
 
-        target_slice: tp.Optional[tp.Union[slice, int]]
+            target_slice: tp.Optional[tp.Union[slice, int]]
 
-        target_block_idx = target_slice = None
-        targets_remain = True
+            target_block_idx = target_slice = None
+            targets_remain = True
 
-        for block_idx, b in enumerate(self._blocks):
-            parts = []
-            part_start_last = 0
+            for block_idx, b in enumerate(self._blocks):
+                parts: tp.List[tp.Tuple[np.ndarray, bool]] = []
+                part_start_last = 0
 
-            while targets_remain:
-                # get target block and slice
-                if target_block_idx is None: # can be zero
-                    try:
-                        target_block_idx, target_slice = next(block_slices)
-                    except StopIteration:
-                        targets_remain = False
-                        break
+                while targets_remain:
+                    # get target block and slice
+                    if target_block_idx is None: # can be zero
+                        try:
+                            target_block_idx, target_slice = next(block_slices)
+                        except StopIteration:
+                            targets_remain = False
+                            break
 
-                if block_idx != target_block_idx:
-                    break # need to advance blocks
+                    if block_idx != target_block_idx:
+                        break # need to advance blocks
 
-                if dtype == b.dtype:
-                    target_block_idx = target_slice = None
-                    continue # there may be more slices for this block
+                    if dtype == b.dtype:
+                        target_block_idx = target_slice = None
+                        continue # there may be more slices for this block
 
-                if b.ndim == 1: # given 1D array, our row key is all we need
-                    parts.append(b.astype(dtype))
-                    part_start_last = 1
-                    target_block_idx = target_slice = None
-                    break
+                    if b.ndim == 1: # given 1D array, our row key is all we need
+                        parts.append((b, True))
+                        part_start_last = 1
+                        target_block_idx = target_slice = None
+                        break
 
-                assert target_slice is not None
-                # target_slice can be a slice or an integer
-                if isinstance(target_slice, slice):
-                    target_start = target_slice.start
-                    target_stop = target_slice.stop
-                else: # it is an integer
-                    target_start = target_slice
-                    target_stop = target_slice + 1
+                    assert target_slice is not None
+                    # target_slice can be a slice or an integer
+                    if isinstance(target_slice, slice):
+                        target_start = target_slice.start
+                        target_stop = target_slice.stop
+                    else: # it is an integer
+                        target_start = target_slice
+                        target_stop = target_slice + 1
 
-                assert target_start is not None and target_stop is not None
-                if target_start > part_start_last:
-                    # yield un changed components before and after
-                    parts.append(b[:, slice(part_start_last, target_start)])
+                    assert target_start is not None and target_stop is not None
+                    if target_start > part_start_last:
+                        # yield un changed components before and after
+                        parts.append((b[:, slice(part_start_last, target_start)], False))
 
-                parts.append(b[:, target_slice].astype(dtype))
-                part_start_last = target_stop
+                    parts.append((b[:, target_slice], True))
+                    part_start_last = target_stop
 
-                target_block_idx = target_slice = None
+                    target_block_idx = target_slice = None
 
-            # if this is a 1D block, we either convert it or do not, and thus either have parts or not, and do not need to get other part pieces of the block
-            if b.ndim != 1 and part_start_last < b.shape[1]:
-                parts.append(b[:, slice(part_start_last, None)])
+                # if this is a 1D block, we either convert it or do not, and thus either have parts or not, and do not need to get other part pieces of the block
+                if b.ndim != 1 and part_start_last < b.shape[1]:
+                    parts.append((b[:, slice(part_start_last, None)], False))
 
-            if not parts:
-                yield b # no change for this block
-            else:
-                yield from parts
+                if not parts:
+                    yield b, False # no change for this block
+                else:
+                    yield from parts
+
+        parts_all = list(block_parts())
+        converted = map_blocks(lambda b: b.astype(dtype),
+                [b for b, convert in parts_all if convert],
+                size=self._shape[0] * self._shape[1],
+                dtype=np.dtype(dtype),
+                )
+        for b, convert in parts_all:
+            yield next(converted) if convert else b
 
 
     def _ufunc_blocks(self,
@@ -1138,66 +1331,77 @@ class TypeBlocks(ContainerOperand):
 
         Generator producer of np.ndarray.
         '''
-        # block slices must be in ascending order, not key order
-        block_slices = iter(self._key_to_block_slices(
-                column_key,
-                retain_key_order=False))
+        def block_parts() -> tp.Iterator[tp.Tuple[np.ndarray, bool]]:
+            '''Generator of pairs of an array and a Boolean, True if the array is to be processed.
+            '''
+            # block slices must be in ascending order, not key order
+            block_slices = iter(self._key_to_block_slices(
+                    column_key,
+                    retain_key_order=False))
 
-        target_slice: tp.Optional[tp.Union[slice, int]]
+            target_slice: tp.Optional[tp.Union[slice, int]]
 
-        target_block_idx = target_slice = None
-        targets_remain = True
+            target_block_idx = target_slice = None
+            targets_remain = True
 
-        for block_idx, b in enumerate(self._blocks):
-            parts = []
-            part_start_last = 0
+            for block_idx, b in enumerate(self._blocks):
+                parts: tp.List[tp.Tuple[np.ndarray, bool]] = []
+                part_start_last = 0
 
-            while targets_remain:
-                # get target block and slice
-                if target_block_idx is None: # can be zero
-                    try:
-                        target_block_idx, target_slice = next(block_slices)
-                    except StopIteration:
-                        targets_remain = False
-                        break
+                while targets_remain:
+                    # get target block and slice
+                    if target_block_idx is None: # can be zero
+                        try:
+                            target_block_idx, target_slice = next(block_slices)
+                        except StopIteration:
+                            targets_remain = False
+                            break
 
-                if block_idx != target_block_idx:
-                    break # need to advance blocks
+                    if block_idx != target_block_idx:
+                        break # need to advance blocks
 
-                if b.ndim == 1: # given 1D array, our row key is all we need
-                    parts.append(func(b))
-                    part_start_last = 1
-                    target_block_idx = target_slice = None
-                    break
+                    if b.ndim == 1: # given 1D array, our row key is all we need
+                        parts.append((b, True))
+                        part_start_last = 1
+                        target_block_idx = target_slice = None
+                        break
 
-                assert target_slice is not None
-                # target_slice can be a slice or an integer
-                if isinstance(target_slice, slice):
-                    target_start = target_slice.start
-                    target_stop = target_slice.stop
-                else: # it is an integer
-                    target_start = target_slice
-                    target_stop = target_slice + 1
+                    assert target_slice is not None
+                    # target_slice can be a slice or an integer
+                    if isinstance(target_slice, slice):
+                        target_start = target_slice.start
+                        target_stop = target_slice.stop
+                    else: # it is an integer
+                        target_start = target_slice
+                        target_stop = target_slice + 1
 
-                assert target_start is not None and target_stop is not None
-                if target_start > part_start_last:
-                    # yield un changed components before and after
-                    parts.append(b[:, slice(part_start_last, target_start)])
+                    assert target_start is not None and target_stop is not None
+                    if target_start > part_start_last:
+                        # yield un changed components before and after
+                        parts.append((b[:, slice(part_start_last, target_start)], False))
 
-                # apply func
-                parts.append(func(b[:, target_slice]))
-                part_start_last = target_stop
+                    # apply func
+                    parts.append((b[:, target_slice], True))
+                    part_start_last = target_stop
 
-                target_block_idx = target_slice = None
+                    target_block_idx = target_slice = None
 
-            # if this is a 1D block, we either convert it or do not, and thus either have parts or not, and do not need to get other part pieces of the block
-            if b.ndim != 1 and part_start_last < b.shape[1]:
-                parts.append(b[:, slice(part_start_last, None)])
+                # if this is a 1D block, we either convert it or do not, and thus either have parts or not, and do not need to get other part pieces of the block
+                if b.ndim != 1 and part_start_last < b.shape[1]:
+                    parts.append((b[:, slice(part_start_last, None)], False))
 
-            if not parts:
-                yield b # no change for this block
-            else:
-                yield from parts
+                if not parts:
+                    yield b, False # no change for this block
+                else:
+                    yield from parts
+
+        parts_all = list(block_parts())
+        processed = map_blocks(func,
+                [b for b, process in parts_all if process],
+                size=self._shape[0] * self._shape[1],
+                )
+        for b, process in parts_all:
+            yield next(processed) if process else b
 
     def _drop_blocks(self,
             row_key: GetItemKeyType = None,
@@ -1524,45 +1728,53 @@ class TypeBlocks(ContainerOperand):
             # value_dtype = np.array(value).dtype
             is_element = True
 
-        start = 0
-        value_slice: tp.Union[int, slice]
+        def operands() -> tp.Iterator[tp.Tuple[np.ndarray, np.ndarray, tp.Any]]:
+            start = 0
+            value_slice: tp.Union[int, slice]
 
-        for block, target in zip_longest(self._blocks, targets):
-            if block is None or target is None:
-                raise RuntimeError('blocks or targets do not align')
+            for block, target in zip_longest(self._blocks, targets):
+                if block is None or target is None:
+                    raise RuntimeError('blocks or targets do not align')
 
-            if not is_element:
-                if block.ndim == 1:
-                    end = start + 1
-                    value_slice = start
-                else:
-                    end = start + block.shape[1]
-                    value_slice = slice(start, end)
+                if not is_element:
+                    if block.ndim == 1:
+                        end = start + 1
+                        value_slice = start
+                    else:
+                        end = start + block.shape[1]
+                        value_slice = slice(start, end)
 
-                # update target to valid values
-                if value_valid is not None:
-                    value_valid_part = value_valid[NULL_SLICE, value_slice]
-                    target &= value_valid_part
+                    # update target to valid values
+                    if value_valid is not None:
+                        value_valid_part = value_valid[NULL_SLICE, value_slice]
+                        target &= value_valid_part
 
-                value_part = value[NULL_SLICE, value_slice][target] #type: ignore
-                start = end # always update start
-            else:
-                value_part = value
+                    value_part = value[NULL_SLICE, value_slice][target] #type: ignore
+                    start = end # always update start
+                else:
+                    value_part = value
+                yield block, target, value_part
 
+        def assign(operand: tp.Tuple[np.ndarray, np.ndarray, tp.Any]) -> np.ndarray:
+            block, target, value_part = operand
             # evalaute after updating target
             if not target.any(): # works for ndim 1 and 2
-                yield block
+                return block
 
+            assigned_dtype = resolve_dtype(value_dtype, block.dtype)
+            if block.dtype == assigned_dtype:
+                assigned = block.copy()
             else:
-                assigned_dtype = resolve_dtype(value_dtype, block.dtype)
-                if block.dtype == assigned_dtype:
-                    assigned = block.copy()
-                else:
-                    assigned = block.astype(assigned_dtype)
+                assigned = block.astype(assigned_dtype)
 
-                assigned[target] = value_part
-                assigned.flags.writeable = False
-                yield assigned
+            assigned[target] = value_part
+            assigned.flags.writeable = False
+            return assigned
+
+        yield from map_blocks(assign,
+                operands(),
+                size=self._shape[0] * self._shape[1],
+                )
 
 
     def _assign_blocks_from_boolean_blocks_and_value_arrays(self,
@@ -1887,13 +2099,15 @@ class TypeBlocks(ContainerOperand):
 
     def _ufunc_unary_operator(self, operator: tp.Callable[[np.ndarray], np.ndarray]) -> 'TypeBlocks':
         # for now, do no reblocking; though, in many cases, operating on a unified block will be faster
-        def operation() -> tp.Iterator[np.ndarray]:
-            for b in self._blocks:
-                result = operator(b)
-                result.flags.writeable = False
-                yield result
+        def operation(b: np.ndarray) -> np.ndarray:
+            result = operator(b)
+            result.flags.writeable = False
+            return result
 
-        return self.from_blocks(operation())
+        return self.from_blocks(map_blocks(operation,
+                self._blocks,
+                size=self._shape[0] * self._shape[1],
+                ))
 
     #---------------------------------------------------------------------------
 
@@ -1961,6 +2175,7 @@ class TypeBlocks(ContainerOperand):
                 other=other_operands,
                 operator=operator,
                 apply_column_2d_filter=apply_column_2d_filter,
+                size=self._shape[0] * self._shape[1],
                 ))
 
     #---------------------------------------------------------------------------
@@ -1984,8 +2199,7 @@ class TypeBlocks(ContainerOperand):
         '''Return a Boolean TypeBlocks where True is NaN or None.
         '''
         def blocks() -> tp.Iterator[np.ndarray]:
-            for b in self._blocks:
-                bool_block = isna_array(b, include_none)
+            for bool_block in self._isna_blocks(include_none):
                 bool_block.flags.writeable = False
                 yield bool_block
 
@@ -1996,13 +2210,29 @@ class TypeBlocks(ContainerOperand):
         '''Return a Boolean TypeBlocks where True is not NaN or None.
         '''
         def blocks() -> tp.Iterator[np.ndarray]:
-            for b in self._blocks:
-                bool_block = np.logical_not(isna_array(b, include_none))
+            for bool_block in self._isna_blocks(include_none, invert=True):
                 bool_block.flags.writeable = False
                 yield bool_block
 
         return self.from_blocks(blocks())
 
+    def _isna_blocks(self,
+            include_none: bool = True,
+            invert: bool = False,
+            ) -> tp.Iterator[np.ndarray]:
+        '''Generator of Boolean arrays, one per block, where True is NaN or None (or, if ``invert``, where True is not NaN or None).
+        '''
+        if invert:
+            func = lambda b: np.logical_not(isna_array(b, include_none))
+        else:
+            func = partial(isna_array, include_none=include_none)
+
+        yield from map_blocks(func,
+                self._blocks,
+                size=self._shape[0] * self._shape[1],
+                dtype=DTYPE_BOOL,
+                )
+
     #---------------------------------------------------------------------------
     # fillna sided
 
@@ -2210,70 +2440,12 @@ class TypeBlocks(ContainerOperand):
         Args:
             directional_forward: if True, start from the forward (top or left) side.
         '''
-
         for b in blocks:
-            sel = isna_array(b) # True for is NaN
-            ndim = sel.ndim
-
-            if ndim == 1 and not np.any(sel):
-                yield b
-            elif ndim == 2 and not np.any(sel).any():
-                yield b
-            else:
-                target_indexes = binary_transition(sel)
-
-                if ndim == 1:
-                    # make single array look like iterable of tuples
-                    slots = 1
-                    length = len(sel)
-
-                elif ndim == 2:
-                    slots = b.shape[1] # axis 0 has column width
-                    length = b.shape[0]
-
-                # type is already compatible, no need for check
-                assigned = b.copy()
-
-                for i in range(slots):
-
-                    if ndim == 1:
-                        target_index = target_indexes
-                        if not len(target_index):
-                            continue
-                        target_values = b[target_index]
-
-                        def slice_condition(target_slice: slice) -> bool:
-                            # NOTE: start is never None
-                            return sel[target_slice.start] # type: ignore
-
-                    else: # 2D blocks
-                        target_index = target_indexes[i]
-                        if not target_index:
-                            continue
-                        target_values = b[target_index, i]
-
-                        def slice_condition(target_slice: slice) -> bool:
-                            # NOTE: start is never None
-                            return sel[target_slice.start, i] # type: ignore
-
-                    for target_slice, value in slices_from_targets(
-                            target_index=target_index,
-                            target_values=target_values,
-                            length=length,
-                            directional_forward=directional_forward,
-                            limit=limit,
-                            slice_condition=slice_condition
-                            ):
-
-                        if ndim == 1:
-                            assigned[target_slice] = value
-                        else:
-                            assigned[target_slice, i] = value
-
-                assigned.flags.writeable = False
-                yield assigned
-
-
+            yield array_fillna_directional(b,
+                    directional_forward=directional_forward,
+                    limit=limit,
+                    axis=0,
+                    )
 
     @staticmethod
     def _fillna_directional_axis_1(
@@ -2288,152 +2460,63 @@ class TypeBlocks(ContainerOperand):
 
         '''
         bridge_src_index = -1 if directional_forward else 0
-        bridge_dst_index = 0 if directional_forward else -1
 
         # will need to re-reverse blocks coming out of this
         block_iter = blocks if directional_forward else reversed(blocks) # type: ignore
 
+        # per row, the value to bridge into the next block, and the count of contiguous nulls since the last non-null value
         bridging_values: tp.Optional[np.ndarray] = None
+        bridging_isna: tp.Optional[np.ndarray] = None
         bridging_count: tp.Optional[np.ndarray] = None
-        bridging_isna: tp.Optional[np.ndarray] = None # Boolean array describing isna of bridging values
 
         for b in block_iter:
-            sel = isna_array(b) # True for is NaN
-            ndim = sel.ndim
+            b_2d = column_2d_filter(b)
+            width = b_2d.shape[1]
+            sel = isna_array(b_2d) # True for is NaN
 
-            if ndim == 1 and not np.any(sel):
-                bridging_values = b
-                bridging_isna = sel
-                bridging_count = np.full(b.shape[0], 0)
-                yield b
-            elif ndim == 2 and not np.any(sel).any():
-                bridging_values = b[:, bridge_src_index]
-                bridging_isna = sel[:, bridge_src_index]
-                bridging_count = np.full(b.shape[0], 0)
-                yield b
+            if not sel.any():
+                assigned = b
+                bridging_count = np.zeros(b_2d.shape[0], dtype=DTYPE_INT_DEFAULT)
             else: # some NA in this block
                 if bridging_values is None:
-                    assigned = b.copy()
-                    bridging_count = np.full(b.shape[0], 0)
+                    assigned_2d = b_2d.copy()
                 else:
                     assignable_dtype = resolve_dtype(bridging_values.dtype, b.dtype)
-                    assigned = b.astype(assignable_dtype)
-
-                if ndim == 1:
-                    # a single array has either NaN or non-NaN values; will only fill in NaN if we have a caried value from the previous block
-                    if bridging_values is not None: # sel has at least one NaN
-                        bridging_isnotna = ~bridging_isna # type: ignore #pylint: disable=E1130
-
-                        sel_sided = sel & bridging_isnotna
-                        if limit:
-                            # set to false those values where bridging already at limit
-                            sel_sided[bridging_count >= limit] = False # type: ignore
-
-                        # set values in assigned if there is a NaN here (sel_sided) and we are not beyond the count
-                        assigned[sel_sided] = bridging_values[sel_sided] #pylint: disable=E1136
-                        # only increment positions that are NaN here and have not-nan bridging values
-                        sel_count_increment = sel & bridging_isnotna
-                        bridging_count[sel_count_increment] += 1 # type: ignore
-                        # set unassigned to zero
-                        bridging_count[~sel_count_increment] = 0 # type: ignore
-                    else:
-                        bridging_count = np.full(b.shape[0], 0)
-
-                    bridging_values = assigned
-                    bridging_isna = isna_array(bridging_values) # must reevaluate if assigned
-
-                elif ndim == 2:
-
-                    slots = b.shape[0] # axis 0 has column width
-                    length = b.shape[1]
-
-                    # set to True when can reset count to zero; this is always the case if the bridge src value is not NaN (before we do any filling)
-                    bridging_count_reset = ~sel[:, bridge_src_index]
-
-                    if bridging_values is not None:
-                        bridging_isnotna = ~bridging_isna #type: ignore #pylint: disable=E1130
-
-                        # find leading NaNs segments if they exist, and if there is as corrresponding non-nan value to bridge
-                        isna_entry = sel[:, bridge_dst_index] & bridging_isnotna
-                        # get a row of Booleans for plausible candidates
-                        candidates = (i for i, j in enumerate(isna_entry) if j)
-                        sels_nonzero = ((i, sel[i]) for i in candidates)
-
-                        # get appropriate leading slice to cover nan region
-                        for idx, sel_nonzero in sels_nonzero:
-                            # indices of not-nan values, per row
-                            targets = np.nonzero(~sel_nonzero)[0]
-                            if len(targets):
-                                if directional_forward:
-                                    sel_slice = slice(0, targets[0])
-                                else: # backward
-                                    sel_slice = slice(targets[-1]+1, length)
-                            else: # all are NaN
-                                sel_slice = slice(0, length)
-
-                            # truncate sel_slice by limit-
-                            sided_len = len(range(*sel_slice.indices(length)))
-
-                            if limit and bridging_count[idx] >= limit: # type: ignore #pylint: disable=R1724
-                                # if already at limit, do not assign
-                                bridging_count[idx] += sided_len # type: ignore
-                                continue
-                            elif limit and (bridging_count[idx] + sided_len) >= limit: # type: ignore
-                                # trim slice to fit
-                                shift = bridging_count[idx] + sided_len - limit # type: ignore
-                                # shift should only be positive only here
-                                if directional_forward:
-                                    sel_slice = slice(
-                                            sel_slice.start,
-                                            sel_slice.stop - shift)
-                                else:
-                                    sel_slice = slice(
-                                            sel_slice.start + shift,
-                                            sel_slice.stop)
-
-                            # update with full length or limited length?
-                            bridging_count[idx] += sided_len # type: ignore
-                            assigned[idx, sel_slice] = bridging_values[idx] #pylint: disable=E1136
-
-                    # handle each row (going horizontally) in isolation
-                    target_indexes = binary_transition(sel, axis=1)
-                    for i in range(slots):
-
-                        target_index = target_indexes[i]
-                        if target_index is None:
-                            # found no transitions, so either all NaN or all not NaN; if all NaN, might have been filled in bridging; if had values, will aready identify as bridging_count_reset[i] == True
-                            continue
-
-                        target_values = b[i, target_index]
-
-                        def slice_condition(target_slice: slice) -> bool:
-                            # NOTE: start is never None
-                            return sel[i, target_slice.start] # type: ignore
-
-                        target_slice = None
-                        for target_slice, value in slices_from_targets(
-                                target_index=target_index,
-                                target_values=target_values,
-                                length=length,
-                                directional_forward=directional_forward,
-                                limit=limit,
-                                slice_condition=slice_condition
-                                ):
-                            assigned[i, target_slice] = value
-
-                        # update counts from the last slice; this will have already been limited if necessary, but need to reflext contiguous values going into the next block; if slices does not go to edge; will identify as needing as reset
-                        if target_slice is not None:
-                            bridging_count[i] = len(range(*target_slice.indices(length))) # type: ignore
-
-                    bridging_values = assigned[:, bridge_src_index]
-                    bridging_isna = isna_array(bridging_values) # must reevaluate if assigned
-
-                    # if the birdging values is NaN now, it could not be filled, or was not filled enough, and thus does not continue a count; can set to zero
-                    bridging_count_reset |= bridging_isna
-                    bridging_count[bridging_count_reset] = 0 # type: ignore
+                    assigned_2d = b_2d.astype(assignable_dtype)
 
+                source, distance = fill_positions_directional(sel,
+                        directional_forward=directional_forward,
+                        axis=1,
+                        )
+                in_block = (source >= 0) & (source < width)
+
+                # fill from non-null values in this block
+                fill = sel & in_block
+                if limit:
+                    fill &= distance <= limit
+                rows, columns = np.nonzero(fill)
+                assigned_2d[rows, columns] = b_2d[rows, source[rows, columns]]
+
+                # fill leading nulls from the bridging values of the previous block
+                if bridging_values is not None:
+                    fill = sel & ~in_block & ~bridging_isna[:, np.newaxis] # type: ignore
+                    if limit:
+                        fill &= (distance + bridging_count[:, np.newaxis]) <= limit # type: ignore
+                    rows, _ = np.nonzero(fill)
+                    assigned_2d[fill] = bridging_values[rows]
+
+                # count the nulls after the last non-null value; rows without a non-null value in this block continue the count from the previous block
+                count = distance[:, bridge_src_index]
+                if bridging_count is not None:
+                    count = np.where(in_block[:, bridge_src_index], count, count + bridging_count)
+                bridging_count = count
+
+                assigned = assigned_2d if b.ndim == 2 else assigned_2d.reshape(b.shape[0])
                 assigned.flags.writeable = False
-                yield assigned
+
+            bridging_values = column_2d_filter(assigned)[:, bridge_src_index]
+            bridging_isna = isna_array(bridging_values)
+            yield assigned
 
 
     def fillna_forward(self,
@@ -2525,7 +2608,7 @@ class TypeBlocks(ContainerOperand):
         '''
         return self.from_blocks(
                 self._assign_blocks_from_boolean_blocks(
-                        targets=(isna_array(b) for b in self._blocks),
+                        targets=self._isna_blocks(),
                         value=value,
                         value_valid=value_valid
                         )
@@ -2575,7 +2658,7 @@ class TypeBlocks(ContainerOperand):
         # same type from here
         if self._shape != other._shape:
             return False
-        if compare_dtype and self._dtypes != other._dtypes: # these are lists
+        if compare_dtype and (self.dtypes != other.dtypes).any():
             return False
 
         # NOTE: TypeBlocks handles array operations that return Boolean
@@ -2627,14 +2710,9 @@ class TypeBlocks(ContainerOperand):
         # extend shape, or define it if not yet set
         self._shape = (row_count, self._shape[1] + block_columns)
 
-        # add block, dtypes, index
-        block_idx = len(self._blocks) # next block
-        for i in range(block_columns):
-            self._index.append((block_idx, i))
-            self._dtypes.append(block.dtype)
-
         # make immutable copy if necessary before appending
         self._blocks.append(immutable_filter(block))
+        self._index_update(self._shape[1] - block_columns, block_columns)
 
         # if already aligned, nothing to do
         if not self._row_dtype: # if never set as shape is empty
@@ -2643,6 +2721,23 @@ class TypeBlocks(ContainerOperand):
             # we do not use resolve_dtype here as we want to preserve types, not safely cooerce them (i.e., int to float)
             self._row_dtype = DTYPE_OBJECT
 
+    def consolidate_trailing(self, count: int) -> None:
+        '''Consolidate, in place, the last ``count`` blocks into a single 2D block if all are 1D and of the same dtype. Called after each append, this bounds the number of blocks created by adding columns one at a time, copying each column at most once.
+        '''
+        blocks = self._blocks
+        if count < 2 or len(blocks) < count:
+            return
+        dtype = blocks[-1].dtype
+        for i in range(1, count + 1):
+            block = blocks[-i]
+            if block.ndim != 1 or block.dtype != dtype:
+                return
+        block = np.stack(blocks[-count:], axis=1)
+        block.flags.writeable = False
+        del blocks[-count:]
+        blocks.append(block)
+        self._index_update(self._shape[1] - count, count)
+
     def extend(self,
             other: tp.Union['TypeBlocks', tp.Iterable[np.ndarray]]
             ) -> None:
@@ -1,15 +1,14 @@
 from collections import abc
-from collections import defaultdict
 from collections import namedtuple
 from enum import Enum
 from functools import partial
 from functools import reduce
 from io import StringIO
 from itertools import chain
-from itertools import zip_longest
 from os import PathLike
 from urllib import request
 import datetime
+import numbers
 import operator
 import os
 import tempfile
@@ -55,9 +54,12 @@ DTYPE_OBJECT_KIND = 'O'
 DTYPE_BOOL_KIND = 'b'
 
 DTYPE_STR_KINDS = ('U', 'S') # S is np.bytes_
+DTYPE_STR_KIND = 'U'
 DTYPE_INT_KINDS = ('i', 'u') # signed and unsigned
 DTYPE_INEXACT_KINDS = (DTYPE_FLOAT_KIND, DTYPE_COMPLEX_KIND) # kinds that support NaN values
 DTYPE_NAT_KINDS = (DTYPE_DATETIME_KIND, DTYPE_TIMEDELTA_KIND)
+DTYPE_MOMENTS_KINDS = (DTYPE_BOOL_KIND, 'i', 'u', DTYPE_FLOAT_KIND) # kinds for which moments are computed as float
+DTYPE_NAN_FREE_KINDS = (DTYPE_BOOL_KIND, 'i', 'u', 'U', 'S') # kinds that cannot contain missing values
 
 # all kinds that can have NaN, NaT, or None
 # DTYPE_NA_KINDS = frozenset((
@@ -120,6 +122,14 @@ TIME_DELTA_ATTR_MAP = (
 # ufunc functions that will not work with DTYPE_STR_KINDS, but do work if converted to object arrays
 UFUNC_AXIS_STR_TO_OBJ = {np.min, np.max, np.sum}
 
+# cumulative ufuncs mapped to the binary ufunc that combines a running carry with a partial result
+UFUNC_SHAPE_CARRY = {
+        np.cumsum: np.add,
+        np.nancumsum: np.add,
+        np.cumprod: np.multiply,
+        np.nancumprod: np.multiply,
+        }
+
 #-------------------------------------------------------------------------------
 # utility type groups
 
@@ -141,6 +151,15 @@ NON_STR_TYPES = {int, float, bool}
 # integers above this value will occassionally, once coerced to a float (64 or 128) in an NP array, will not match a hash lookup as a key in a dictionary; an NP array of int or object will work
 INT_MAX_COERCIBLE_TO_FLOAT = 1_000_000_000_000_000
 
+# when materializing rows from heterogenous blocks, the number of elements converted at a time into a row-major buffer
+ROW_CHUNK_ELEMENTS = 65_536
+
+# the minimum number of elements processed before blocks are dispatched to a thread pool, if enabled with BlockExecutor
+BLOCK_EXECUTOR_ELEMENTS = 1_000_000
+
+# when sizing pool task chunks automatically, the count of chunks per worker, such that workers finishing early can take remaining chunks
+POOL_CHUNKS_PER_WORKER = 4
+
 # for getitem / loc selection
 KEY_ITERABLE_TYPES = (list, np.ndarray)
 KeyIterableTypes = tp.Union[tp.Iterable[tp.Any], np.ndarray]
@@ -747,6 +766,156 @@ def _argminmax_2d(
 argmin_2d = partial(_argminmax_2d, ufunc=np.argmin, ufunc_skipna=np.nanargmin)
 argmax_2d = partial(_argminmax_2d, ufunc=np.argmax, ufunc_skipna=np.nanargmax)
 
+
+def _argnextreme(
+        arrays: tp.Sequence[np.ndarray],
+        count: int,
+        largest: bool,
+        ) -> np.ndarray:
+    '''
+    Return the positions of the ``count`` largest (or smallest) values, ordered by value, where values are given by one or more 1D arrays of equal length, in order of priority. Missing values are excluded; ties are ordered (and, at the boundary, selected) by position. Rather than sorting all values, the threshold of each key is found with a partition, and only the selected positions are sorted.
+    '''
+    size = len(arrays[0])
+    positions = None # a subset of positions, if missing values are excluded
+    for array in arrays:
+        if array.dtype.kind not in DTYPE_NAN_FREE_KINDS:
+            isna = isna_array(array)
+            if isna.any():
+                valid = ~isna if positions is None else ~isna[positions]
+                positions = (np.arange(size) if positions is None else positions)[valid]
+    if positions is not None:
+        arrays = [array[positions] for array in arrays]
+        size = len(positions)
+
+    def select(candidates: np.ndarray, depth: int, count: int) -> np.ndarray:
+        if count >= len(candidates):
+            return candidates
+        if count <= 0:
+            return candidates[:0]
+        values = arrays[depth][candidates]
+        if largest:
+            threshold = np.partition(values, len(values) - count)[len(values) - count]
+            better = values > threshold
+        else:
+            threshold = np.partition(values, count - 1)[count - 1]
+            better = values < threshold
+        tied = candidates[values == threshold]
+        selected = candidates[better]
+        count = count - len(selected)
+        if depth + 1 < len(arrays):
+            tied = select(tied, depth + 1, count)
+        else:
+            tied = tied[:count]
+        return np.concatenate((selected, tied))
+
+    selected = select(np.arange(size), 0, count)
+    selected.sort()
+    # lexsort is stable and has the highest priority key last; selected positions are ascending
+    keys = [array[selected] for array in reversed(arrays)]
+    if largest:
+        # break ties by descending position, such that reversing orders ties by position
+        keys.insert(0, np.arange(len(selected), 0, -1))
+        order = np.lexsort(keys)[::-1]
+    else:
+        order = np.lexsort(keys)
+
+    post = selected[order]
+    if positions is not None:
+        post = positions[post]
+    post.flags.writeable = False
+    return post
+
+argnlargest = partial(_argnextreme, largest=True)
+argnsmallest = partial(_argnextreme, largest=False)
+
+
+def monotonic_1d(array: np.ndarray) -> tp.Tuple[bool, bool]:
+    '''
+    Return a pair of Booleans, True if ``array`` is non-strictly increasing, and True if ``array`` is non-strictly decreasing. Arrays with missing values, or with values that cannot be compared, are neither.
+    '''
+    if len(array) < 2:
+        return True, True
+    if array.dtype.kind in DTYPE_NAT_KINDS and np.isnat(array).any():
+        return False, False
+    try:
+        increasing = bool((array[1:] >= array[:-1]).all())
+        decreasing = bool((array[1:] <= array[:-1]).all())
+    except TypeError: # unorderable object values
+        return False, False
+    return increasing, decreasing
+
+
+def _sort_key_mixed(value: tp.Any) -> tp.Tuple[str, tp.Any]:
+    # real numbers of all types share a group, named such that it sorts before type names
+    if isinstance(value, (numbers.Real, np.bool_)):
+        return '', value
+    return value.__class__.__name__, value
+
+def factorize_sortable(array: np.ndarray) -> np.ndarray:
+    '''
+    Return integer codes for a 1D array such that the order of codes is the order of values. Object arrays are factorized by hashing, such that only unique values are sorted; values that cannot be compared with each other are ordered in groups, first real numbers (compared by value regardless of type), then other values by type name, and within each group by value.
+    '''
+    if array.dtype.kind != DTYPE_OBJECT_KIND:
+        _, codes = np.unique(array, return_inverse=True)
+        return codes
+
+    value_to_code: tp.Dict[tp.Any, int] = {}
+    try:
+        codes = np.fromiter(
+                (value_to_code.setdefault(v, len(value_to_code)) for v in array),
+                count=len(array),
+                dtype=DTYPE_INT_DEFAULT,
+                )
+    except TypeError: # unhashable values
+        _, codes = np.unique(array, return_inverse=True)
+        return codes
+
+    values = list(value_to_code.keys())
+    try:
+        values.sort()
+    except TypeError: # unorderable values
+        try:
+            values.sort(key=_sort_key_mixed)
+        except TypeError: # values of the same type are not orderable; retain order of appearance
+            return codes
+
+    remap = np.empty(len(values), dtype=DTYPE_INT_DEFAULT)
+    remap[[value_to_code[v] for v in values]] = np.arange(len(values))
+    return remap[codes]
+
+
+def argsort_keys(
+        arrays: tp.Sequence[np.ndarray],
+        ascending: tp.Sequence[bool],
+        kind: str = DEFAULT_SORT_KIND,
+        ) -> np.ndarray:
+    '''
+    Return the sort order of one or more 1D arrays of equal length, given in order of priority, each with its own direction. For a single array, ``kind`` is passed to ``np.argsort``; with a stable ``kind`` (the default), ties retain their order of position, including when descending. Multiple arrays are sorted with ``np.lexsort``, which is always stable and does not take a ``kind``. Object arrays are factorized to integer codes once, permitting the sorting of values of mixed types.
+    '''
+    if len(arrays) == 1:
+        array = arrays[0]
+        if ascending[0]:
+            try:
+                return np.argsort(array, kind=kind)
+            except TypeError: # unorderable object values
+                return np.argsort(factorize_sortable(array), kind=kind)
+        # the reverse of the ascending sort of the reversed array is descending with stable ties
+        try:
+            order = np.argsort(array[::-1], kind=kind)
+        except TypeError:
+            order = np.argsort(factorize_sortable(array)[::-1], kind=kind)
+        return len(array) - 1 - order[::-1]
+
+    keys = []
+    for array, asc in zip(arrays, ascending):
+        if asc and array.dtype.kind != DTYPE_OBJECT_KIND:
+            keys.append(array)
+        else:
+            codes = factorize_sortable(array)
+            keys.append(codes if asc else codes.max(initial=0) - codes)
+    # lexsort is stable and has the highest priority key last
+    return np.lexsort(keys[::-1])
+
 #-------------------------------------------------------------------------------
 # array constructors
 
@@ -1159,6 +1328,89 @@ def array_to_groups_and_locations(
     return groups, locations
 
 
+def groups_to_positions(
+        groups: tp.Iterable[tp.Hashable],
+        locations: np.ndarray,
+        ) -> tp.Tuple[np.ndarray, tp.List[tp.Tuple[tp.Hashable, int, int]]]:
+    '''Given groups and locations (as returned by ``array_to_groups_and_locations``), return an array of positions ordered by group, retaining the order of positions within each group, and a list of each group with the start and stop of its positions.
+    '''
+    positions = np.argsort(locations, kind=DEFAULT_SORT_KIND)
+    # every group has at least one location, so counts are found for all groups
+    stops = np.cumsum(np.bincount(locations)).tolist()
+    starts = [0] + stops[:-1]
+    return positions, list(zip(groups, starts, stops))
+
+
+def chunks_from_sizes(
+        sizes: tp.Sequence[int],
+        count: int,
+        ) -> tp.List[slice]:
+    '''Partition a sequence of item sizes into contiguous slices, such that each slice has a total size near the total divided by ``count``; items at or above that size are given their own slice.
+    '''
+    target = max(sum(sizes) / max(count, 1), 1)
+    chunks = []
+    start = 0
+    total = 0
+    for i, size in enumerate(sizes):
+        if size >= target and i > start:
+            # a large item is not combined with preceding items
+            chunks.append(slice(start, i))
+            start = i
+            total = 0
+        total += size
+        if total >= target:
+            chunks.append(slice(start, i + 1))
+            start = i + 1
+            total = 0
+    if start < len(sizes):
+        chunks.append(slice(start, len(sizes)))
+    return chunks
+
+
+def array_factorize(array: np.ndarray) -> tp.Tuple[np.ndarray, np.ndarray]:
+    '''Given a 1D array, return an array of unique values and an array of integer codes, such that the unique values selected by the codes reproduce the array. If values are sortable, unique values are sorted; otherwise (as may be the case for object arrays of mixed types), unique values are in the order of first appearance.
+    '''
+    try:
+        return np.unique(array, return_inverse=True) #type: ignore
+    except TypeError:
+        pass
+    # values are not sortable; factorize by hashing
+    mapping: tp.Dict[tp.Any, int] = {}
+    codes = np.fromiter(
+            (mapping.setdefault(v, len(mapping)) for v in array),
+            count=len(array),
+            dtype=DTYPE_INT_DEFAULT,
+            )
+    uniques = np.empty(len(mapping), dtype=array.dtype)
+    for i, v in enumerate(mapping):
+        uniques[i] = v
+    return uniques, codes
+
+
+def positions_unique(array: np.ndarray) -> bool:
+    '''Return True if the integer positions in ``array`` are known to be unique. This is a cheap check for ascending, non-negative positions (as produced by Boolean selection or grouping); other positions return False, even though they might be unique.
+    '''
+    if array.dtype.kind not in DTYPE_INT_KINDS or array.ndim != 1:
+        return False
+    if len(array) < 2:
+        return len(array) == 0 or array[0] >= 0 #type: ignore
+    return bool(array[0] >= 0 and (array[1:] > array[:-1]).all())
+
+
+def positions_to_slice(positions: np.ndarray) -> tp.Optional[slice]:
+    '''If the integer positions in ``array`` are ascending, non-negative, and contiguous, return an equivalent slice; otherwise, return None.
+    '''
+    count = len(positions)
+    if count == 0:
+        return None
+    start = positions[0]
+    if start < 0 or positions[-1] - start + 1 != count:
+        return None
+    if count > 2 and not (positions[1:] - positions[:-1] == 1).all():
+        return None
+    return slice(int(start), int(start) + count)
+
+
 def isna_element(value: tp.Any) -> bool:
     '''Return Boolean if value is an NA. This does not yet handle pd.NA
     '''
@@ -1196,69 +1448,6 @@ def isna_array(array: np.ndarray,
     return np.not_equal(array, array)
 
 
-def binary_transition(
-        array: np.ndarray,
-        axis: int = 0
-        ) -> np.ndarray:
-    '''
-    Given a Boolean 1D array, return the index positions (integers) at False values where that False was previously True, or will be True
-
-    Returns:
-        For a 1D input, a 1D array of integers; for a 2D input, a 1D object array of lists, where each position corresponds to a found index position. Returning a list is undesirable, but more efficient as a list will be neede for selection downstream.
-    '''
-
-    if len(array) == 0:
-        # NOTE: on some platforms this may not be the same dtype as returned from np.nonzero
-        return EMPTY_ARRAY_INT
-
-    not_array = ~array
-
-    if array.ndim == 1:
-        # non-nan values that go (from left to right) to NaN
-        target_sel_leading = (array ^ roll_1d(array, -1)) & not_array
-        target_sel_leading[-1] = False # wrap around observation invalid
-        # non-nan values that were previously NaN (from left to right)
-        target_sel_trailing = (array ^ roll_1d(array, 1)) & not_array
-        target_sel_trailing[0] = False # wrap around observation invalid
-
-        return np.nonzero(target_sel_leading | target_sel_trailing)[0]
-
-    elif array.ndim == 2:
-        # if axis == 0, we compare rows going down/up, looking at column values
-        # non-nan values that go (from left to right) to NaN
-        target_sel_leading = (array ^ roll_2d(array, -1, axis=axis)) & not_array
-        # non-nan values that were previously NaN (from left to right)
-        target_sel_trailing = (array ^ roll_2d(array, 1, axis=axis)) & not_array
-
-        # wrap around observation invalid
-        if axis == 0:
-            # process an entire row
-            target_sel_leading[-1, :] = False
-            target_sel_trailing[0, :] = False
-        else:
-            # process entire column
-            target_sel_leading[:, -1] = False
-            target_sel_trailing[:, 0] = False
-
-        # this dictionary could be very sparse compared to axis dimensionality
-        indices_by_axis: tp.DefaultDict[int, tp.List[int]] = defaultdict(list)
-        for y, x in zip(*np.nonzero(target_sel_leading | target_sel_trailing)):
-            if axis == 0:
-                # store many rows values for each column
-                indices_by_axis[x].append(y)
-            else:
-                indices_by_axis[y].append(x)
-
-        # if axis is 0, return column width, else return row height
-        post = np.empty(dtype=object, shape=array.shape[not axis])
-        for k, v in indices_by_axis.items():
-            post[k] = v
-
-        return post
-
-    raise NotImplementedError(f'no handling for array with ndim: {array.ndim}')
-
-
 #-------------------------------------------------------------------------------
 # tools for handling duplicates
 
@@ -2131,71 +2320,71 @@ def array_from_element_method(*,
 
 #-------------------------------------------------------------------------------
 
-def slices_from_targets(
-        target_index: tp.Sequence[int],
-        target_values: tp.Sequence[tp.Any],
-        length: int,
+def fill_positions_directional(
+        isna: np.ndarray,
+        *,
         directional_forward: bool,
-        limit: int,
-        slice_condition: tp.Callable[[slice], bool]
-        ) -> tp.Iterator[tp.Tuple[slice, tp.Any]]:
+        axis: int = 0,
+        ) -> tp.Tuple[np.ndarray, np.ndarray]:
     '''
-    Utility function used in fillna_directional implementations for Series and Frame. Yields slices and values for setting contiguous ranges of values.
-
-    NOTE: slice_condition is still needed to check if a slice actually has missing values; see if there is a way to determine these cases in advance, so as to not call a function on each slice.
+    For each position in a 1D or 2D Boolean array of missing values, return the position along ``axis`` of the nearest non-missing value before it (if ``directional_forward``) or after it, and the distance to that position. Positions are found by accumulating the maximum (or minimum) of non-missing positions. Where there is no such value, the position is -1 (or the length of ``axis``), and the distance is measured to just beyond the edge of the array.
 
-    Args:
-        target_index: iterable of integers, where integers are positions where (as commonly used) values along an axis were previously NA, or will be NA. Often the result of binary_transition()
-        target_values: values found at the index positions
-        length: the maximum length in the target array
-        directional_forward: determine direction
-        limit: set a max size for all slices
-        slice_condition: optional function for filtering slices.
+    Returns:
+        A tuple of an array of positions and an array of distances.
     '''
-    if directional_forward:
-        target_slices = (
-                slice(start+1, stop)
-                for start, stop in
-                zip_longest(target_index, target_index[1:], fillvalue=length)
-                )
-    else:
-        # use None to signal first value, but store 0
-        target_slices = (
-                slice((start+1 if start is not None else 0), stop)
-                for start, stop in
-                zip(chain((None,), target_index[:-1]), target_index)
-                )
+    size = isna.shape[axis]
+    positions = np.arange(size, dtype=DTYPE_INT_DEFAULT)
+    if isna.ndim == 2:
+        positions = positions.reshape(size, 1) if axis == 0 else positions.reshape(1, size)
 
-    for target_slice, value in zip(target_slices, target_values):
-        # asserts not necessary as slices are created above; but mypy needs them
-        assert target_slice.start is not None and target_slice.stop is not None
+    if directional_forward:
+        post = np.where(isna, -1, positions)
+        np.maximum.accumulate(post, axis=axis, out=post)
+        return post, positions - post
 
-        # all conditions that are noop slices
-        if target_slice.start == target_slice.stop: #pylint: disable=R1724
-            # matches case where start is 0 and stop is 0
-            continue
-        elif directional_forward and target_slice.start >= length:
-            continue
+    post = np.where(isna, size, positions)
+    post_flipped = np.flip(post, axis=axis)
+    np.minimum.accumulate(post_flipped, axis=axis, out=post_flipped)
+    return post, post - positions
 
-        # only process if first value of slice is NaN
-        if slice_condition(target_slice):
 
-            if limit > 0:
-                # get the length of the range resulting from the slice; if bigger than limit, reduce the by that amount
-                shift = len(range(*target_slice.indices(length))) - limit
-                if shift > 0:
+def array_fillna_directional(
+        array: np.ndarray,
+        *,
+        directional_forward: bool,
+        limit: int = 0,
+        axis: int = 0,
+        ) -> np.ndarray:
+    '''
+    Return a 1D or 2D array after feeding the last (if ``directional_forward``) or next non-null (NaN or None) value along ``axis`` across contiguous nulls. If no values are null, the array is returned.
 
-                    if directional_forward:
-                        target_slice = slice(
-                                target_slice.start,
-                                target_slice.stop - shift)
-                    else:
-                        target_slice = slice(
-                                (target_slice.start or 0) + shift,
-                                target_slice.stop)
+    Args:
+        limit: the maximum number of nulls filled per contiguous region of nulls; 0 is no limit.
+    '''
+    isna = isna_array(array)
+    if not isna.any():
+        return array
 
-            yield target_slice, value
+    source, distance = fill_positions_directional(isna,
+            directional_forward=directional_forward,
+            axis=axis,
+            )
+    size = array.shape[axis]
+    # retain values that are not null, that have no value to fill from, or that are beyond the limit
+    retain = ~isna | (source < 0) | (source >= size)
+    if limit:
+        retain |= distance > limit
+
+    # type is already compatible, no need for check
+    np.clip(source, 0, size - 1, out=source)
+    if array.ndim == 1:
+        assigned = array[source]
+    else:
+        assigned = np.take_along_axis(array, source, axis=axis)
+    assigned[retain] = array[retain]
 
+    assigned.flags.writeable = False
+    return assigned
 
 
 #-------------------------------------------------------------------------------
@@ -226,24 +226,6 @@ class TestUnit(TestCase):
         self.assertTrue(np.ravel(post).sum() == count_na)
 
 
-    @given(get_array_1d(dtype_group=DTGroup.BOOL))
-    def test_binary_transition(self, array: np.ndarray) -> None:
-        post = util.binary_transition(array)
-
-        # could be 32 via result of np.nonzero
-        self.assertTrue(post.dtype in (np.int32, np.int64))
-
-        # if no True in original array, result will be empty
-        if array.sum() == 0:
-            self.assertTrue(len(post) == 0)
-        # if all True, result is empty
-        elif array.sum() == len(array):
-            self.assertTrue(len(post) == 0)
-        else:
-            # the post selection shold always be indices that are false
-            self.assertTrue(array[post].sum() == 0)
-
-
     @given(get_array_1d2d())
     def test_array_to_duplicated(self, array: np.ndarray) -> None:
         if array.ndim == 2:
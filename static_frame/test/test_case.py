@@ -41,6 +41,11 @@ skip_pylt37 = pytest.mark.skipif(
         reason='Windows default dtypes'
         )
 
+skip_pylt38 = pytest.mark.skipif(
+        sys.version_info < (3, 8),
+        reason='multiprocessing.shared_memory not available'
+        )
+
 skip_linux_no_display = pytest.mark.skipif(
         sys.platform == 'linux' and 'DISPLAY' not in os.environ,
         reason='No display available'
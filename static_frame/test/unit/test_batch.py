@@ -1,4 +1,5 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -6,10 +7,12 @@ nan = np.nan
 
 from static_frame.core.frame import Frame
 from static_frame.core.batch import Batch
+from static_frame.core.batch import map_pool
 from static_frame.test.test_case import TestCase
 from static_frame.core.index_auto import IndexAutoFactory
 from static_frame.core.display_config import DisplayConfig
 from static_frame.test.test_case import temp_file
+from static_frame.test.test_case import skip_pylt38
 from static_frame.core.store import StoreConfig
 
 
@@ -208,6 +211,64 @@ class TestUnit(TestCase):
                 (('a', ((0, '1'), (1, '2'), (2, ''), (3, ''), (4, ''), (5, ''), (6, ''))), ('b', ((0, '3'), (1, '_'), (2, '_'), (3, '5'), (4, '6'), (5, '50'), (6, '60'))), ('c', ((0, ''), (1, ''), (2, '1'), (3, '2'), (4, '3'), (5, ''), (6, ''))), ('d', ((0, ''), (1, ''), (2, ''), (3, ''), (4, ''), (5, '10'), (6, '20')))))
 
 
+    @skip_pylt38 #type: ignore
+    def test_batch_apply_c(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=('x', 'y')),
+                index=('x', 'y'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(c=(1.5, 2, 3), b=(True, False, True)),
+                index=('x', 'y', 'z'),
+                name='f2')
+
+        b1 = Batch.from_frames((f1, f2), max_workers=2, use_shared_memory=True)
+        self.assertEqual(dict(b1.apply(np.shape).items()),
+                {'f1': (2, 2), 'f2': (3, 2)}
+                )
+
+        b2 = Batch.from_frames((f1, f2), max_workers=2, use_shared_memory=True)
+        f3 = b2.iloc[1:].to_frame()
+        self.assertEqual(f3.shape, (3, 3))
+        self.assertEqual(f3['b'].to_pairs(),
+                ((('f1', 'y'), 'y'), (('f2', 'y'), False), (('f2', 'z'), True))
+                )
+
+
+    def test_batch_apply_d(self) -> None:
+        frames = [Frame.from_element(i, index=range(i + 1), columns=('a',), name=i)
+                for i in range(6)]
+
+        b1 = Batch.from_frames(frames, max_workers=2, chunksize='auto')
+        self.assertEqual(dict(b1.apply(np.shape).items()),
+                {i: (i + 1, 1) for i in range(6)}
+                )
+
+        b2 = Batch.from_frames(frames, max_workers=2, chunksize='auto', use_threads=True)
+        self.assertEqual(b2.sum().to_frame().to_pairs(0),
+                (('a', tuple((i, i * (i + 1)) for i in range(6))),)
+                )
+
+        with self.assertRaises(RuntimeError):
+            Batch.from_frames(frames, max_workers=2, chunksize='Auto')
+
+    def test_batch_map_pool_a(self) -> None:
+
+        submitted = []
+        class Executor(ThreadPoolExecutor):
+            def submit(self, func, *args, **kwargs): # type: ignore
+                submitted.append(len(args[1]))
+                return super().submit(func, *args, **kwargs)
+
+        sizes = [1, 1, 1, 1, 20, 1, 1, 1]
+        with Executor(max_workers=1) as executor:
+            post = list(map_pool(executor, str, list(range(8)), sizes, 'auto', 1))
+
+        # results are in order, while the chunk of the largest item is submitted first
+        self.assertEqual(post, [str(i) for i in range(8)])
+        self.assertEqual(submitted, [1, 4, 3])
+
     def test_batch_apply_b(self) -> None:
 
         f1 = Frame.from_dict(
@@ -0,0 +1,98 @@
+import unittest
+import threading
+import typing as tp
+
+import numpy as np
+
+from static_frame.core.block_executor import BlockExecutor
+from static_frame.core.block_executor import map_blocks
+from static_frame.core.frame import Frame
+from static_frame.core.series import Series
+from static_frame.core.util import BLOCK_EXECUTOR_ELEMENTS
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    def test_block_executor_a(self) -> None:
+
+        self.assertEqual(BlockExecutor.get(), 1)
+        with BlockExecutor.context(4):
+            self.assertEqual(BlockExecutor.get(), 4)
+        self.assertEqual(BlockExecutor.get(), 1)
+
+        with self.assertRaises(RuntimeError):
+            BlockExecutor.set(0)
+
+    def test_block_executor_b(self) -> None:
+
+        a1 = np.arange(20).reshape(10, 2)
+        a2 = np.arange(10)
+
+        with BlockExecutor.context(3):
+            # results are returned in order
+            post1 = list(map_blocks(lambda a: a * 2,
+                    (a1, a2, a1),
+                    size=BLOCK_EXECUTOR_ELEMENTS,
+                    ))
+            self.assertEqual([a.shape for a in post1], [(10, 2), (10,), (10, 2)])
+            self.assertEqual(post1[1].tolist(), list(range(0, 20, 2)))
+
+            # with fewer arrays than threads, rows are processed in chunks
+            post2 = list(map_blocks(lambda a: a > 5,
+                    (a1,),
+                    size=BLOCK_EXECUTOR_ELEMENTS,
+                    dtype=np.dtype(bool),
+                    ))
+            self.assertEqual(post2[0].tolist(), (a1 > 5).tolist())
+
+    def test_block_executor_c(self) -> None:
+
+        a1 = np.arange(BLOCK_EXECUTOR_ELEMENTS, dtype=float).reshape(-1, 4)
+        a1[::7, 1] = np.nan
+        f1 = Frame.from_items((
+                ('a', a1[:, 0].astype(int)),
+                ('b', a1[:, 1]),
+                ('c', a1[:, 2] > 10),
+                ('d', a1[:, 3]),
+                ))
+
+        def chain(f: Frame) -> tp.Tuple[Series, Series, Series]:
+            f = f.astype(float).fillna(0)
+            return (f * 2).sum(), f.isna().sum(), round(f, 1).iloc[-1]
+
+        post1 = chain(f1)
+        with BlockExecutor.context(4):
+            post2 = chain(f1)
+
+        for s1, s2 in zip(post1, post2):
+            self.assertTrue(s1.equals(s2, compare_dtype=True))
+
+    def test_block_executor_d(self) -> None:
+
+        f1 = Frame(np.arange(BLOCK_EXECUTOR_ELEMENTS, dtype=float).reshape(-1, 100))
+        expected = (f1 * 2).sum()
+        errors = []
+
+        def run(max_workers: int) -> None:
+            # each thread has its own count of workers
+            try:
+                for _ in range(3):
+                    with BlockExecutor.context(max_workers):
+                        self.assertEqual(BlockExecutor.get(), max_workers)
+                        self.assertTrue((f1 * 2).sum().equals(expected))
+            except Exception as e: # pragma: no cover
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in (1, 2, 3, 4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(BlockExecutor.get(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
+import asyncio
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from datetime import datetime
 # from io import StringIO
@@ -949,6 +951,94 @@ class TestUnit(TestCase):
         self.assertTrue(f1.equals(post[0]))
         self.assertTrue(f2.equals(post[1]))
 
+    #---------------------------------------------------------------------------
+    def test_bus_to_frame_a(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=('x', 'y'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(c=(1.5,2,3), b=(4,5,6)),
+                index=('x', 'y', 'z'),
+                name='f2')
+        f3 = Frame.from_dict(
+                dict(d=(True,False), b=(50,60)),
+                index=('p', 'q'),
+                name='f3')
+        b1 = Bus.from_frames((f1, f2, f3))
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+            b2 = Bus.from_zip_pickle(fp)
+
+            post = b2.to_frame()
+            # Frames are read from the Store but not retained
+            self.assertFalse(b2._loaded.any())
+            self.assertEqualFrames(post, Frame.from_concat_items(b1.items()))
+            self.assertEqual(post.dtypes.values.tolist(),
+                    [np.dtype(float), np.dtype(int), np.dtype(float), np.dtype(object)])
+
+            post = b2.to_frame(union=False, columns=('B',))
+            self.assertEqual(post['B'].values.tolist(),
+                    [3, 4, 4, 5, 6, 50, 60])
+
+    def test_bus_to_frame_b(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=('x', 'y'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(a=(10,20), b=(30,40)),
+                index=('y', 'z'),
+                name='f2')
+        b1 = Bus.from_frames((f1, f2))
+
+        post = b1.to_frame(axis=1, fill_value=0)
+        self.assertEqual(post.to_pairs(0),
+                ((('f1', 'a'), (('x', 1), ('y', 2), ('z', 0))), (('f1', 'b'), (('x', 3), ('y', 4), ('z', 0))), (('f2', 'a'), (('x', 0), ('y', 10), ('z', 20))), (('f2', 'b'), (('x', 0), ('y', 30), ('z', 40))))
+                )
+        self.assertEqual(Bus.from_frames(()).to_frame().shape, (0, 0))
+
+    def test_bus_to_frame_c(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=('x', 'y'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(a=(10,20,30), c=(3.5,4,5)),
+                index=('x', 'y', 'z'),
+                name='f2')
+        b1 = Bus.from_frames((f1, f2))
+
+        class StoreCounter:
+            def __init__(self, store):
+                self.store = store
+                self.count = 0
+            def read(self, label, config=None):
+                self.count += 1
+                return self.store.read(label, config=config)
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+            b2 = Bus.from_zip_pickle(fp)
+            b2._store = StoreCounter(b2._store)
+
+            # Frames read in the first pass are retained for the second
+            post1 = b2.to_frame()
+            self.assertEqual(b2._store.count, 2)
+            self.assertEqualFrames(post1, Frame.from_concat_items(b1.items()))
+
+            # beyond the limit, Frames are read again
+            b2._store.count = 0
+            retain_nbytes = Bus.TO_FRAME_RETAIN_NBYTES
+            Bus.TO_FRAME_RETAIN_NBYTES = f1.nbytes
+            try:
+                post2 = b2.to_frame()
+            finally:
+                Bus.TO_FRAME_RETAIN_NBYTES = retain_nbytes
+            self.assertEqual(b2._store.count, 3)
+            self.assertEqualFrames(post1, post2)
+
     #---------------------------------------------------------------------------
     def test_bus_to_parquet_a(self) -> None:
         f1 = Frame.from_dict(
@@ -982,6 +1072,81 @@ class TestUnit(TestCase):
             # parquet brings in characters as objects, thus forcing different dtypes
             self.assertEqualFrames(frame, b2[frame.name], compare_dtype=False)
 
+    #---------------------------------------------------------------------------
+    def test_bus_aget_a(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=('x', 'y'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(c=(1,2,3), b=(4,5,6)),
+                index=('x', 'y', 'z'),
+                name='f2')
+
+        submitted = []
+
+        class Executor(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs): # type: ignore
+                submitted.append(args)
+                return super().submit(*args, **kwargs)
+
+        b1 = Bus.from_frames((f1, f2))
+
+        async def main(b2: Bus) -> None:
+            with Executor(max_workers=2) as executor:
+                post = await asyncio.gather(
+                        *(b2.aget('f2', executor=executor) for _ in range(4)))
+            # concurrent requests share one read
+            self.assertEqual(len(submitted), 1)
+            self.assertTrue(all(f is post[0] for f in post))
+            self.assertEqualFrames(post[0], f2)
+            self.assertEqual(b2.status['loaded'].to_pairs(),
+                    (('f1', False), ('f2', True)))
+            self.assertIs(b2['f2'], post[0])
+
+            with self.assertRaises(RuntimeError):
+                await b2.aget(['f1', 'f2'])
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+            b2 = Bus.from_zip_pickle(fp)
+
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(main(b2))
+            finally:
+                loop.close()
+
+    def test_bus_prefetch_a(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=('x', 'y'),
+                name='f1')
+        f2 = Frame.from_dict(
+                dict(c=(1,2,3), b=(4,5,6)),
+                index=('x', 'y', 'z'),
+                name='f2')
+        f3 = Frame.from_dict(
+                dict(d=(10,20), b=(50,60)),
+                index=('p', 'q'),
+                name='f3')
+
+        b1 = Bus.from_frames((f1, f2, f3))
+
+        with temp_file('.zip') as fp:
+            b1.to_zip_pickle(fp)
+            b2 = Bus.from_zip_pickle(fp)
+
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(b2.prefetch(('f1', 'f3')))
+            finally:
+                loop.close()
+
+            self.assertEqual(b2.status['loaded'].to_pairs(),
+                    (('f1', True), ('f2', False), ('f3', True)))
+            self.assertEqualFrames(b2['f3'], f3)
+
 
 
 
@@ -779,7 +779,7 @@ dtype('int64')
 <Index: signature>
 sort_index(*, ascending, kind)  Series   Method Return a new Seri...
 sort_values(*, ascending, kind) Series   Method Return a new Seri...
-<<U94>                          <<U6>    <<U17> <<U83>
+<<U113>                         <<U6>    <<U17> <<U83>
 
 #end_Series-interface
 
@@ -1290,7 +1290,7 @@ d'Arrest 6.51           1.346
 sort_columns(*, ascending, kind)     Frame    Method Return a new Fram...
 sort_index(*, ascending, kind)       Frame    Method Return a new Fram...
 sort_values(key, *, ascending, ax... Frame    Method Return a new Fram...
-<<U94>                               <<U5>    <<U17> <<U83>
+<<U113>                              <<U5>    <<U17> <<U83>
 
 #end_Frame-interface
 
@@ -2403,7 +2403,7 @@ dropna(axis, condition)              FrameGO  Method   Return a new Fram...
 drop[key]                            FrameGO  Selector Label-based selec...
 drop.iloc[key]                       FrameGO  Selector
 drop.loc[key]                        FrameGO  Selector
-<<U94>                               <<U7>    <<U17>   <<U83>
+<<U113>                              <<U7>    <<U17>   <<U83>
 
 #end_FrameGO-interface
 
@@ -2430,16 +2430,17 @@ Saturn    120536   568.0     60268.0
 #start_Bus-interface
 >>> sf.Bus.interface.loc[sf.Bus.interface['group'] == 'Exporter']
 <Frame: Bus>
-<Index>                    cls_name group    doc                  <<U18>
+<Index>                              cls_name group    doc                  <<U18>
 <Index: signature>
-to_hdf5(fp, config)        Bus      Exporter Write the complet...
-to_sqlite(fp, config)      Bus      Exporter Write the complet...
-to_xlsx(fp, config)        Bus      Exporter Write the complet...
-to_zip_csv(fp, config)     Bus      Exporter Write the complet...
-to_zip_parquet(fp, config) Bus      Exporter Write the complet...
-to_zip_pickle(fp, config)  Bus      Exporter Write the complet...
-to_zip_tsv(fp, config)     Bus      Exporter Write the complet...
-<<U50>                     <<U3>    <<U15>   <<U83>
+to_frame(*, axis, union, index, ...) Bus      Exporter Concatenate the c...
+to_hdf5(fp, config)                  Bus      Exporter Write the complet...
+to_sqlite(fp, config)                Bus      Exporter Write the complet...
+to_xlsx(fp, config)                  Bus      Exporter Write the complet...
+to_zip_csv(fp, config)               Bus      Exporter Write the complet...
+to_zip_parquet(fp, config)           Bus      Exporter Write the complet...
+to_zip_pickle(fp, config)            Bus      Exporter Write the complet...
+to_zip_tsv(fp, config)               Bus      Exporter Write the complet...
+<<U50>                               <<U3>    <<U15>   <<U83>
 
 #end_Bus-interface
 
@@ -2456,7 +2457,7 @@ to_zip_tsv(fp, config)     Bus      Exporter Write the complet...
 <Index: signature>
 relabel(mapper)    Index    Method Return a new Inde...
 rename(name)       Index    Method Return a new Fram...
-<<U68>             <<U5>    <<U17> <<U83>
+<<U87>             <<U5>    <<U17> <<U83>
 
 #end_Index-interface
 
@@ -2516,7 +2517,7 @@ to_html(config)                      IndexGO  Exporter Return an HTML ta...
 to_html_datatables(fp, *, show, c... IndexGO  Exporter Return a complete...
 to_pandas()                          IndexGO  Exporter Return a Pandas I...
 to_series()                          IndexGO  Exporter Return a Series w...
-<<U68>                               <<U7>    <<U17>   <<U83>
+<<U87>                               <<U7>    <<U17>   <<U83>
 
 #end_IndexGO-interface
 
@@ -2541,6 +2542,7 @@ Pluto
 <Frame: IndexHierarchy>
 <Index>                              cls_name       group       doc                  <<U18>
 <Index: signature>
+from_arrays(arrays, *, name, inde... IndexHierarchy Constructor Construct an Inde...
 from_index_items(items, *, index_... IndexHierarchy Constructor Given an iterable...
 from_labels(labels, *, name, reor... IndexHierarchy Constructor Construct an Inde...
 from_labels_delimited(labels, *, ... IndexHierarchy Constructor Construct an Inde...
@@ -2548,7 +2550,7 @@ from_names(names)                    IndexHierarchy Constructor Construct a zero
 from_pandas(value)                   IndexHierarchy Constructor Given a Pandas in...
 from_product(*, name, *levels)       IndexHierarchy Constructor Given groups of i...
 from_tree(tree, *, name)             IndexHierarchy Constructor Convert into a In...
-<<U68>                               <<U14>         <<U17>      <<U83>
+<<U87>                               <<U14>         <<U17>      <<U83>
 
 #end_IndexHierarchy-interface
 
@@ -2576,7 +2578,7 @@ quark            down
 rehierarch(depth_map)     IndexHierarchyGO Method Return a new Inde...
 relabel(mapper)           IndexHierarchyGO Method Return a new Inde...
 rename(name)              IndexHierarchyGO Method Return a new Fram...
-<<U68>                    <<U16>           <<U17> <<U83>
+<<U87>                    <<U16>           <<U17> <<U83>
 
 #end_IndexHierarchyGO-interface
 
@@ -2631,7 +2633,7 @@ from_labels(labels, *, name)         IndexYear Constructor Construct an Inde...
 from_pandas(value)                   IndexYear Constructor Given a Pandas in...
 from_year_month_range(start, stop... IndexYear Constructor Get an IndexYearM...
 from_year_range(start, stop, step... IndexYear Constructor Get an IndexDate ...
-<<U68>                               <<U9>     <<U17>      <<U83>
+<<U87>                               <<U9>     <<U17>      <<U83>
 
 #end_IndexYear-interface
 
@@ -2648,7 +2650,7 @@ from_labels(labels, *, name)         IndexYearGO Constructor Construct an Inde..
 from_pandas(value)                   IndexYearGO Constructor Given a Pandas in...
 from_year_month_range(start, stop... IndexYearGO Constructor Get an IndexYearM...
 from_year_range(start, stop, step... IndexYearGO Constructor Get an IndexDate ...
-<<U68>                               <<U11>      <<U17>      <<U83>
+<<U87>                               <<U11>      <<U17>      <<U83>
 
 #end_IndexYearGO-interface
 
@@ -2666,7 +2668,7 @@ from_labels(labels, *, name)         IndexYearMonthGO Constructor Construct an I
 from_pandas(value)                   IndexYearMonthGO Constructor Given a Pandas in...
 from_year_month_range(start, stop... IndexYearMonthGO Constructor Get an IndexYearM...
 from_year_range(start, stop, step... IndexYearMonthGO Constructor Get an IndexYearM...
-<<U68>                               <<U16>           <<U17>      <<U83>
+<<U87>                               <<U16>           <<U17>      <<U83>
 
 #end_IndexYearMonth-interface
 
@@ -2684,7 +2686,7 @@ from_labels(labels, *, name)         IndexYearMonthGO Constructor Construct an I
 from_pandas(value)                   IndexYearMonthGO Constructor Given a Pandas in...
 from_year_month_range(start, stop... IndexYearMonthGO Constructor Get an IndexYearM...
 from_year_range(start, stop, step... IndexYearMonthGO Constructor Get an IndexYearM...
-<<U68>                               <<U16>           <<U17>      <<U83>
+<<U87>                               <<U16>           <<U17>      <<U83>
 
 #end_IndexYearMonthGO-interface
 
@@ -2702,7 +2704,7 @@ from_labels(labels, *, name)         IndexDate Constructor Construct an Inde...
 from_pandas(value)                   IndexDate Constructor Given a Pandas in...
 from_year_month_range(start, stop... IndexDate Constructor Get an IndexDate ...
 from_year_range(start, stop, step... IndexDate Constructor Get an IndexDate ...
-<<U68>                               <<U9>     <<U17>      <<U83>
+<<U87>                               <<U9>     <<U17>      <<U83>
 
 #end_IndexDate-interface
 
@@ -2720,7 +2722,7 @@ from_labels(labels, *, name)         IndexDateGO Constructor Construct an Inde..
 from_pandas(value)                   IndexDateGO Constructor Given a Pandas in...
 from_year_month_range(start, stop... IndexDateGO Constructor Get an IndexDate ...
 from_year_range(start, stop, step... IndexDateGO Constructor Get an IndexDate ...
-<<U68>                               <<U11>      <<U17>      <<U83>
+<<U87>                               <<U11>      <<U17>      <<U83>
 
 #end_IndexDateGO-interface
 
@@ -8,6 +8,7 @@ import pickle
 import sqlite3
 import datetime
 import typing as tp
+import operator
 
 import numpy as np
 
@@ -37,6 +38,7 @@ from static_frame.test.test_case import TestCase
 from static_frame.test.test_case import skip_win
 from static_frame.test.test_case import skip_linux_no_display
 from static_frame.test.test_case import skip_pylt37
+from static_frame.test.test_case import skip_pylt38
 from static_frame.test.test_case import temp_file
 from static_frame.core.exception import ErrorInitFrame
 from static_frame.core.exception import ErrorInitIndex
@@ -3504,6 +3506,30 @@ class TestUnit(TestCase):
 
 
 
+    def test_frame_std_b(self) -> None:
+
+        a1 = np.array([[1.5, np.nan], [np.nan, np.nan], [3.0, 4.0]])
+        a2 = np.array([2, 7, -1])
+        a3 = np.array([[1, 0], [0, 0], [1, 1]], dtype=np.uint8)
+        f1 = Frame(TypeBlocks.from_blocks((a1, a2, a3)))
+        values = f1.values.astype(float)
+
+        for func, func_nan in ((np.mean, np.nanmean), (np.std, np.nanstd), (np.var, np.nanvar)):
+            post1 = getattr(f1, func.__name__)(axis=1).values
+            self.assertTrue(np.allclose(post1, func_nan(values, axis=1)))
+
+            post2 = getattr(f1, func.__name__)(axis=1, skipna=False).values
+            self.assertTrue(np.allclose(post2, func(values, axis=1), equal_nan=True))
+            self.assertTrue(np.isnan(post2[:2]).all())
+
+        f2 = Frame(TypeBlocks.from_blocks((
+                np.array([1, 2], dtype=np.float32),
+                np.array([[3, np.nan], [4, 5]], dtype=np.float32),
+                )))
+        post3 = f2.mean(axis=1)
+        self.assertEqual(post3.dtype, np.dtype(np.float32))
+        self.assertEqual(post3.values.tolist(), [2.0, 3.6666667461395264])
+
     def test_frame_var_a(self) -> None:
 
         a1 = np.array([
@@ -3614,6 +3640,44 @@ class TestUnit(TestCase):
                 (('p', (('w', 2.0), ('x', 30.0), ('y', 2.0), ('z', 30.0))), ('q', (('w', 4.0), ('x', 64.0), ('y', None), ('z', None))), ('r', (('w', 7.0), ('x', 124.0), ('y', None), ('z', None))))
                 )
 
+    def test_frame_cumsum_c(self) -> None:
+
+        f1 = Frame.from_items((
+                ('a', (1, 2, 3)),
+                ('b', (1.5, np.nan, 2.0)),
+                ('c', ('x', 'y', 'z')),
+                ('d', (True, False, True)),
+                ))
+        f2 = f1.cumsum()
+
+        # per-block dtypes are retained; strings concatenate as objects
+        self.assertEqual([dt.kind for dt in f2.dtypes.values],
+                ['i', 'f', 'O', 'i'])
+        self.assertEqual(f2.to_pairs(0),
+                (('a', ((0, 1), (1, 3), (2, 6))), ('b', ((0, 1.5), (1, 1.5), (2, 3.5))), ('c', ((0, 'x'), (1, 'xy'), (2, 'xyz'))), ('d', ((0, 1), (1, 1), (2, 2))))
+                )
+
+    def test_frame_cumsum_d(self) -> None:
+
+        f1 = Frame.from_items((
+                ('a', (1, 2, 3)),
+                ('b', (1.5, np.nan, 2.0)),
+                ('c', (True, False, True)),
+                ))
+
+        f2 = f1.cumsum(axis=1)
+        self.assertEqual([dt.kind for dt in f2.dtypes.values], ['i', 'f', 'f'])
+        self.assertEqual(f2.to_pairs(0),
+                (('a', ((0, 1), (1, 2), (2, 3))), ('b', ((0, 2.5), (1, 2.0), (2, 5.0))), ('c', ((0, 3.5), (1, 2.0), (2, 6.0))))
+                )
+
+        f3 = f1.cumprod(axis=1, skipna=False)
+        self.assertEqual(f3.fillna(None).to_pairs(0),
+                (('a', ((0, 1), (1, 2), (2, 3))), ('b', ((0, 1.5), (1, None), (2, 6.0))), ('c', ((0, 1.5), (1, None), (2, 6.0))))
+                )
+
+        self.assertEqual(Frame(index=range(2)).cumsum(axis=1).shape, (2, 0))
+
     def test_frame_cumprod_a(self) -> None:
 
         records = (
@@ -3930,6 +3994,46 @@ class TestUnit(TestCase):
         f2 = f1 == f1.values.tolist()
         self.assertTrue(f2.all().all())
 
+    def test_frame_binary_operator_m(self) -> None:
+
+        f1 = Frame.from_dict(dict(a=(1, 2, 3), b=(4, 5, 6)), index=tuple('xyz'))
+        f2 = Frame.from_dict(dict(b=(10, 20), c=(30, 40)), index=tuple('zx'))
+
+        # labels already match: index and columns are reused
+        f3 = f1 + Frame(f1.values, index=f1.index.values, columns=f1.columns.values)
+        self.assertIs(f3.index, f1.index)
+        self.assertEqual(f3.to_pairs(0),
+                (('a', (('x', 2), ('y', 4), ('z', 6))), ('b', (('x', 8), ('y', 10), ('z', 12))))
+                )
+
+        f4 = f1 + f2
+        self.assertEqual(f4.fillna(0).to_pairs(0),
+                (('a', (('x', 0.0), ('y', 0.0), ('z', 0.0))), ('b', (('x', 24.0), ('y', 0.0), ('z', 16.0))), ('c', (('x', 0.0), ('y', 0.0), ('z', 0.0))))
+                )
+
+        # a Frame without columns
+        f5 = f1 + Frame(index=tuple('yz'))
+        self.assertEqual(f5.shape, (3, 2))
+        self.assertTrue(f5.isna().all().all())
+
+        s1 = Series((100, 200), index=('b', 'd'))
+        f6 = f1 + s1
+        self.assertEqual(f6.columns.values.tolist(), ['a', 'b', 'd'])
+        self.assertEqual(f6['b'].values.tolist(), [104, 105, 106])
+
+    def test_frame_binary_operator_n(self) -> None:
+        # NaN labels in index or columns
+        f1 = Frame.from_dict(dict(a=(1, 2)), index=(1.0, np.nan))
+        f2 = Frame.from_dict(dict(a=(3, 4)), index=(np.nan, 2.0))
+        f3 = f1 + f2
+        self.assertEqual(f3.shape, (3, 1))
+        self.assertTrue(f3.isna().all().all())
+
+        f4 = Frame.from_items(((np.nan, (1, 2)), ('b', (3, 4))))
+        f5 = Frame.from_items((('b', (1, 2)), (np.nan, (5, 6))))
+        f6 = f4 + f5
+        self.assertEqual(f6['b'].values.tolist(), [4, 6])
+
     #---------------------------------------------------------------------------
     def test_frame_isin_a(self) -> None:
         # reindex both axis
@@ -4302,6 +4406,67 @@ class TestUnit(TestCase):
         self.assertEqual(post.to_pairs(),
                 ((0, 67), (1, 28), (2, 'III')))
 
+    def test_frame_iter_element_e(self) -> None:
+        f1 = FrameGO.from_dict(dict(a=(1, 2, 3), b=('x', 'y', 'z')),
+                index=tuple('pqr'))
+
+        f2 = f1.iter_element().apply_vectorized(
+                lambda a: np.char.upper(a.astype(str)), name='foo')
+        self.assertEqual(f2.__class__, FrameGO)
+        self.assertEqual(f2.name, 'foo')
+        self.assertEqual(f2.to_pairs(0),
+                (('a', (('p', '1'), ('q', '2'), ('r', '3'))), ('b', (('p', 'X'), ('q', 'Y'), ('r', 'Z')))))
+
+        with self.assertRaises(RuntimeError):
+            f1.iter_element().apply_vectorized(lambda a: a[:2])
+
+        with self.assertRaises(NotImplementedError):
+            f1.iter_element_items().apply_vectorized(np.abs)
+
+        f3 = Frame(index=range(3))
+        f4 = f3.iter_element().apply_vectorized(np.abs)
+        self.assertEqual(f4.shape, (3, 0))
+        self.assertEqual(f4.index.values.tolist(), [0, 1, 2])
+
+        s1 = f3.iter_array(axis=1).apply_vectorized(lambda a: a.sum(axis=1))
+        self.assertEqual(s1.to_pairs(), ((0, 0.0), (1, 0.0), (2, 0.0)))
+
+    def test_frame_iter_element_f(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1, 2, 1), b=('x', 'y', 'x')),
+                index=tuple('pqr'))
+
+        f2 = f1.iter_element().map_all({1: 10, 2: 20, 'x': 0.5, 'y': 1.5})
+        self.assertEqual(f2.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(float)])
+        self.assertEqual(f2.to_pairs(0),
+                (('a', (('p', 10), ('q', 20), ('r', 10))), ('b', (('p', 0.5), ('q', 1.5), ('r', 0.5)))))
+
+        f3 = f1.iter_element().map_any({2: 20, 'y': 'z'})
+        self.assertEqual(f3.to_pairs(0),
+                (('a', (('p', 1), ('q', 20), ('r', 1))), ('b', (('p', 'x'), ('q', 'z'), ('r', 'x')))))
+
+        f4 = f1.iter_element().map_fill({'x': 'w'}, fill_value='')
+        self.assertEqual(f4.to_pairs(0),
+                (('a', (('p', ''), ('q', ''), ('r', ''))), ('b', (('p', 'w'), ('q', ''), ('r', 'w')))))
+
+    def test_frame_iter_array_vectorized_a(self) -> None:
+        f1 = Frame.from_dict(dict(a=(1, 2, 3), b=(1.5, 2, 3), c=(0, 0, 1)),
+                index=tuple('pqr'))
+
+        s1 = f1.iter_array(axis=1).apply_vectorized(lambda a: a.sum(axis=1))
+        self.assertEqual(s1.to_pairs(), (('p', 2.5), ('q', 4.0), ('r', 7.0)))
+        self.assertTrue(s1.equals(f1.iter_series(axis=1).apply(lambda s: s.sum())))
+
+        s2 = f1.iter_series(axis=0).apply_vectorized(lambda a: a.max(axis=1), name='max')
+        self.assertEqual(s2.name, 'max')
+        self.assertEqual(s2.to_pairs(), (('a', 3.0), ('b', 3.0), ('c', 1.0)))
+
+        s3 = f1.iloc[:0].iter_array(axis=1).apply_vectorized(lambda a: a.sum(axis=1))
+        self.assertEqual(len(s3), 0)
+
+        with self.assertRaises(RuntimeError):
+            f1.iter_array(axis=1).apply_vectorized(lambda a: a.sum())
+
     #---------------------------------------------------------------------------
 
     def test_frame_iter_group_a(self) -> None:
@@ -4363,6 +4528,71 @@ class TestUnit(TestCase):
                 )
 
 
+    @skip_pylt38 #type: ignore
+    def test_frame_iter_group_d(self) -> None:
+        columns = tuple('pqrst')
+        index = tuple('zxwy')
+        records = (('A', 1, 'a', False, False),
+                   ('A', 2, 'b', True, False),
+                   ('B', 1, 'c', False, False),
+                   ('B', 2, 'd', True, True))
+
+        f = Frame.from_records(
+                records, columns=columns, index=index, name='foo')
+
+        post1 = f.iter_group('q').apply_pool(len,
+                max_workers=2,
+                use_shared_memory=True)
+        self.assertEqual(post1.to_pairs(), ((1, 2), (2, 2)))
+
+        # functions must be picklable; items are given as a single argument
+        post2 = f.iter_group_items(['p', 's']).apply_pool(
+                operator.itemgetter(0),
+                max_workers=2,
+                use_shared_memory=True)
+        self.assertEqual(post2.to_pairs(),
+                ((('A', False), ('A', False)), (('A', True), ('A', True)), (('B', False), ('B', False)), (('B', True), ('B', True))))
+
+        post3 = f.iter_group_labels(axis=1).apply_pool(np.shape,
+                max_workers=2,
+                use_shared_memory=True)
+        self.assertEqual(post3.to_pairs(),
+                (('p', (4, 1)), ('q', (4, 1)), ('r', (4, 1)), ('s', (4, 1)), ('t', (4, 1))))
+
+        with self.assertRaises(NotImplementedError):
+            f.iter_element().apply_pool(str, max_workers=2, use_shared_memory=True)
+
+    @skip_pylt38 #type: ignore
+    def test_frame_iter_group_e(self) -> None:
+        f = Frame.from_dict(
+                dict(p=(1, 1, 1, 1, 2, 3), q=(0, 1, 2, 3, 4, 5)),
+                index=tuple('abcdef'))
+
+        for use_shared_memory in (False, True):
+            post1 = f.iter_group('p').apply_pool(len,
+                    max_workers=2,
+                    chunksize='auto',
+                    use_shared_memory=use_shared_memory)
+            self.assertEqual(post1.to_pairs(), ((1, 4), (2, 1), (3, 1)))
+
+            post2 = f.iter_group('p').apply_pool_iter_unordered(len,
+                    max_workers=2,
+                    chunksize='auto',
+                    use_shared_memory=use_shared_memory)
+            self.assertEqual(sorted(post2), [(1, 4), (2, 1), (3, 1)])
+
+        post3 = f.iter_element().apply_pool_iter_unordered(str,
+                max_workers=2,
+                chunksize=4,
+                use_threads=True)
+        self.assertEqual(len(dict(post3)), 12)
+
+        with self.assertRaises(RuntimeError):
+            f.iter_group('p').apply_pool(len, max_workers=2, chunksize='Auto')
+        with self.assertRaises(RuntimeError):
+            f.iter_group('p').apply_pool_iter_unordered(len, max_workers=2, chunksize='2')
+
+
     def test_frame_iter_group_items_a(self) -> None:
 
         # testing a hierarchical index and columns, selecting column with a tuple
@@ -4671,6 +4901,17 @@ class TestUnit(TestCase):
 
 
 
+    def test_frame_sort_index_c(self) -> None:
+        f1 = Frame.from_dict(dict(b=(1, 2), a=(3, 4)), index=('x', 'y'))
+        self.assertIs(f1.sort_index(), f1)
+        self.assertEqual(f1.sort_columns().columns.values.tolist(), ['a', 'b'])
+        self.assertIs(f1.sort_columns(ascending=False), f1)
+
+        f2 = FrameGO(f1)
+        self.assertIsNot(f2.sort_index(), f2)
+        self.assertEqual(f2.sort_index(ascending=False).to_pairs(0),
+                (('b', (('y', 2), ('x', 1))), ('a', (('y', 4), ('x', 3)))))
+
     def test_frame_sort_index_b(self) -> None:
         # reindex both axis
         records = (
@@ -4907,6 +5148,55 @@ class TestUnit(TestCase):
                 (('a', (('x', 3), ('y', 8), ('z', 2))), ('c', (('x', 3), ('y', 4), ('z', 6))), ('b', (('x', 7), ('y', 1), ('z', 9))))
                 )
 
+    def test_frame_sort_values_g(self) -> None:
+        f1 = Frame.from_dict(dict(
+                region=('w', 'e', 'w', 'e', 'w'),
+                revenue=(10.0, 30.0, 20.0, 30.0, 20.0),
+                name=('c', 'b', 'a', 'a', 'b'),
+                ),
+                index=tuple('pqrst'),
+                )
+        post1 = f1.sort_values(('region', 'revenue', 'name'), ascending=(True, False, True))
+        self.assertEqual(post1.index.values.tolist(), ['s', 'q', 'r', 't', 'p'])
+
+        # descending sorts retain the position order of ties
+        post2 = f1.sort_values('revenue', ascending=False)
+        self.assertEqual(post2.index.values.tolist(), ['q', 's', 'r', 't', 'p'])
+
+        post3 = f1.sort_values(('revenue', 'name'), ascending=False)
+        self.assertEqual(post3.index.values.tolist(), ['q', 's', 't', 'r', 'p'])
+
+        with self.assertRaises(RuntimeError):
+            f1.sort_values(('region', 'name'), ascending=(True,))
+
+    def test_frame_sort_values_h(self) -> None:
+        # object columns of mixed types are sorted with real numbers first, then by type name, then value
+        f1 = Frame.from_dict(dict(
+                a=(1, 1, 2, 2),
+                b=('x', 3, None, 0),
+                ),
+                index=tuple('pqrs'),
+                )
+        post = f1.sort_values(('a', 'b'), ascending=(False, True))
+        self.assertEqual(post.index.values.tolist(), ['s', 'r', 'q', 'p'])
+        self.assertEqual(f1['b'].sort_values().index.values.tolist(), ['s', 'q', 'r', 'p'])
+
+
+    def test_frame_nlargest_a(self) -> None:
+        f1 = Frame.from_dict(
+                dict(a=(3, 1, 4, 1, 5, 9), b=(1, 2, 3, 2, 1, np.nan), c=tuple('pqrstu')),
+                index=tuple('uvwxyz'))
+
+        self.assertEqual(f1.nlargest('a', count=3)['c'].to_pairs(),
+                (('z', 'u'), ('y', 't'), ('w', 'r')))
+        self.assertEqual(f1.nsmallest(['a', 'b'], count=3)['c'].to_pairs(),
+                (('v', 'q'), ('x', 's'), ('u', 'p')))
+        # rows missing values in key columns are excluded
+        self.assertEqual(f1.nlargest(['b', 'a'], count=3).index.values.tolist(),
+                ['w', 'v', 'x'])
+        self.assertEqual(f1.iloc_nsmallest('b', count=2).tolist(), [0, 4])
+        self.assertEqual(f1.iloc_nlargest('c', count=1).tolist(), [5])
+
 
     #---------------------------------------------------------------------------
     def test_frame_relabel_a(self) -> None:
@@ -7503,6 +7793,36 @@ class TestUnit(TestCase):
         dtype_diffs = sf.Frame.from_concat((f1_dtypes, f2_dtypes), axis=1, name='dtype_diffs')
         self.assertEqual(dtype_diffs.to_pairs(0), (('a', ()), ('b', ())))
 
+    def test_frame_from_concat_bb(self) -> None:
+
+        f1 = Frame.from_items((('a', (1, 2)), ('b', (True, False)), ('c', ('x', 'y'))),
+                index=('p', 'q'))
+        f2 = Frame.from_items((('c', ('zz',)), ('a', (3.5,))),
+                index=('r',))
+        f3 = Frame(np.array([[10, 20], [30, 40]]), columns=('a', 'b'), index=('s', 't'))
+
+        f4 = Frame.from_concat((f1, f2, f3), fill_value=None)
+        self.assertEqual(f4.dtypes.values.tolist(),
+                [np.dtype(float), np.dtype(object), np.dtype(object)])
+        self.assertEqual(f4.to_pairs(0),
+                (('a', (('p', 1.0), ('q', 2.0), ('r', 3.5), ('s', 10.0), ('t', 30.0))),
+                ('b', (('p', True), ('q', False), ('r', None), ('s', 20), ('t', 40))),
+                ('c', (('p', 'x'), ('q', 'y'), ('r', 'zz'), ('s', None), ('t', None))))
+                )
+        # contiguous columns of the same dtype are allocated as one block
+        self.assertEqual(f4._blocks.shapes.tolist(), [(5,), (5, 2)])
+
+        f5 = Frame.from_concat((f1, f3), union=False, fill_value='')
+        self.assertEqual(f5.to_pairs(0),
+                (('a', (('p', 1), ('q', 2), ('s', 10), ('t', 30))),
+                ('b', (('p', True), ('q', False), ('s', 20), ('t', 40))))
+                )
+
+        f6 = Frame.from_concat((f3, f3.relabel(index=('u', 'v'))), columns=('b', 'x', 'a'), fill_value=0)
+        self.assertEqual(f6._blocks.shapes.tolist(), [(4, 3)])
+        self.assertEqual(f6.values.tolist(),
+                [[20, 0, 10], [40, 0, 30], [20, 0, 10], [40, 0, 30]])
+
     #---------------------------------------------------------------------------
 
     def test_frame_from_concat_error_init_a(self) -> None:
@@ -8282,6 +8602,28 @@ class TestUnit(TestCase):
                 (('p', (('w', 2), ('x', 34))), ('q', (('w', 'a'), ('x', 'b'))), ('r', (('w', False), ('x', True))), ('x', (('w', None), ('x', None))))
                 )
 
+    def test_frame_to_frame_go_f(self) -> None:
+
+        f1 = FrameGO(index=range(3))
+        for i in range(FrameGO.CONSOLIDATE_COUNT + 2):
+            f1[i] = np.arange(3)
+        f1['a'] = 'x'
+        # a full run of 1D blocks is consolidated as columns are added
+        self.assertEqual(f1._blocks.shapes.tolist(),
+                [(3, FrameGO.CONSOLIDATE_COUNT), (3,), (3,), (3,)])
+
+        f2 = f1.to_frame()
+        self.assertEqual(f2._blocks.shapes.tolist(),
+                [(3, FrameGO.CONSOLIDATE_COUNT + 2), (3,)])
+        self.assertEqual(f2.iloc[:, -3:].to_pairs(0),
+                ((FrameGO.CONSOLIDATE_COUNT, ((0, 0), (1, 1), (2, 2))),
+                (FrameGO.CONSOLIDATE_COUNT + 1, ((0, 0), (1, 1), (2, 2))),
+                ('a', ((0, 'x'), (1, 'x'), (2, 'x'))))
+                )
+
+        f3 = FrameGO(index=range(3)).to_frame()
+        self.assertEqual(f3.shape, (3, 0))
+
     #---------------------------------------------------------------------------
 
     def test_frame_astype_a(self) -> None:
@@ -9835,6 +10177,20 @@ class TestUnit(TestCase):
         f2 = f1.via_str.count('BA')
         self.assertEqual(f2.to_pairs(0), (('x', (('a', 0), ('b', 0))), ('y', (('a', 1), ('b', 1)))))
 
+    def test_frame_str_contains_a(self) -> None:
+
+        f1 = Frame(np.array([['aoc', 'BAR'], ['baz', 'BAQ']]),
+                index=('a', 'b'),
+                columns=('x', 'y')
+                )
+        f2 = f1.via_str.contains('a[oz]')
+        self.assertEqual(f2.to_pairs(0),
+                (('x', (('a', True), ('b', True))), ('y', (('a', False), ('b', False)))))
+
+        f3 = f1.via_str.extract('[QR]$')
+        self.assertEqual(f3.to_pairs(0),
+                (('x', (('a', ''), ('b', ''))), ('y', (('a', 'R'), ('b', 'Q')))))
+
     #---------------------------------------------------------------------------
     def test_frame_as_dt_year_a(self) -> None:
 
@@ -10046,6 +10402,46 @@ class TestUnit(TestCase):
                 )
 
 
+    #---------------------------------------------------------------------------
+    def test_frame_via_lazy_a(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1, 2, 3), b=(4.0, 5.0, 6.0), c=(1, 1, 1), d=(2, 2, 4)),
+                index=tuple('xyz'))
+        lf = f1.via_lazy
+        self.assertIs(lf.evaluate(), f1)
+
+        s1 = ((lf['a'] * lf['b'] + lf['c']) / lf['d']).evaluate()
+        self.assertEqual(s1.to_pairs(),
+                (('x', 2.5), ('y', 5.5), ('z', 4.75)))
+        self.assertTrue(s1.equals((f1['a'] * f1['b'] + f1['c']) / f1['d']))
+
+        f2 = (10 - lf * 2 > f1['b']).evaluate()
+        self.assertTrue(f2.equals(10 - f1 * 2 > f1['b'], compare_dtype=True))
+
+        with self.assertRaises(RuntimeError):
+            _ = (lf + 1)['a']
+
+    def test_frame_via_lazy_b(self) -> None:
+
+        f1 = Frame.from_dict(dict(a=(1, 2), b=(3, 4)), index=('x', 'y'))
+        f2 = FrameGO.from_dict(dict(b=(10, 20), c=(30, 40)), index=('z', 'x'))
+        s1 = Series((100, 200), index=('a', 'b'))
+
+        # alignment is done once, to the union of all labels
+        f3 = (f1.via_lazy + f2 * 2 + s1).evaluate()
+        self.assertEqual(f3.__class__, Frame)
+        self.assertEqual(f3.fillna(0).to_pairs(0),
+                (('a', (('x', 0.0), ('y', 0.0), ('z', 0.0))), ('b', (('x', 243.0), ('y', 0.0), ('z', 0.0))), ('c', (('x', 0.0), ('y', 0.0), ('z', 0.0))))
+                )
+        self.assertTrue(f3.equals(f1 + f2 * 2 + s1))
+
+        f4 = (abs(-f1.via_lazy) + np.array([[1, 2], [3, 4]])).evaluate()
+        self.assertEqual(f4.to_pairs(0),
+                (('a', (('x', 2), ('y', 5))), ('b', (('x', 5), ('y', 8))))
+                )
+
+
     #---------------------------------------------------------------------------
     def test_frame_equals_a(self) -> None:
 
@@ -0,0 +1,149 @@
+
+import unittest
+
+import numpy as np
+
+from static_frame.core.frame_builder import FrameBuilder
+from static_frame.core.series import Series
+from static_frame.test.test_case import TestCase
+
+
+class TestUnit(TestCase):
+
+    def test_frame_builder_a(self) -> None:
+
+        fb = FrameBuilder(index=('x', 'y', 'z'),
+                columns=('a', 'b', 'c', 'd'),
+                dtypes=(int, int, bool, float),
+                fill_value=0,
+                name='foo',
+                )
+        self.assertEqual(fb.shape, (3, 4))
+        self.assertEqual(len(fb._blocks), 3)
+
+        fb['a'] = (1, 2, 3)
+        fb.loc['y', 'c'] = True
+        fb.iloc[2, 3] = 1.5
+        fb.loc['x', ['b', 'c', 'd']] = (10, True, 0.5)
+
+        f = fb.to_frame()
+        self.assertEqual(f.name, 'foo')
+        self.assertEqual(f.dtypes.values.tolist(),
+                [np.dtype(int), np.dtype(int), np.dtype(bool), np.dtype(float)])
+        self.assertEqual(f.to_pairs(0),
+                (('a', (('x', 1), ('y', 2), ('z', 3))),
+                ('b', (('x', 10), ('y', 0), ('z', 0))),
+                ('c', (('x', True), ('y', True), ('z', False))),
+                ('d', (('x', 0.5), ('y', 0.0), ('z', 1.5))))
+                )
+        # blocks are owned by the Frame without a copy
+        self.assertEqual(f._blocks.shapes.tolist(), [(3, 2), (3,), (3,)])
+        self.assertFalse(f._blocks._blocks[0].flags.writeable)
+        self.assertIs(f._blocks._blocks[0], fb._blocks[0])
+
+        with self.assertRaises(RuntimeError):
+            fb['a'] = 0
+
+    def test_frame_builder_b(self) -> None:
+
+        fb = FrameBuilder(index=range(4),
+                columns=('a', 'b', 'c'),
+                dtypes={'b': object},
+                )
+        values = np.arange(12).reshape(4, 3)
+        fb.iloc[:] = values
+        fb.iloc[1:3, 1] = Series(('p', 'q'))
+
+        f = fb.to_frame()
+        self.assertEqual(f.dtypes.values.tolist(),
+                [np.dtype(float), np.dtype(object), np.dtype(float)])
+        self.assertEqual(f.values.tolist(),
+                [[0.0, 1, 2.0], [3.0, 'p', 5.0], [6.0, 'q', 8.0], [9.0, 10, 11.0]])
+
+    def test_frame_builder_c(self) -> None:
+
+        fb = FrameBuilder(index=('x', 'y'), columns=('a', 'b', 'c'), dtypes=int)
+        fb.iloc[:, [2, 0]] = ((1, 2), (3, 4))
+        fb['b'] = 0
+        f = fb.to_frame()
+        self.assertEqual(f.values.tolist(), [[2, 0, 1], [4, 0, 3]])
+        self.assertEqual(f._blocks.shapes.tolist(), [(2, 3)])
+
+    def test_frame_builder_d(self) -> None:
+
+        fb = FrameBuilder(index=('x', 'y'),
+                columns=('a', 'b', 'c', 'd'),
+                dtypes=(str, str, bytes, 'U2'),
+                fill_value='',
+                )
+        fb['a'] = ('foo', 'ba')
+        fb.loc['y', ['b', 'c']] = ('quux', b'zz')
+        fb.iloc[0, 3] = 'pq'
+
+        f = fb.to_frame()
+        self.assertEqual(f.dtypes.values.tolist(),
+                [np.dtype('<U4'), np.dtype('<U4'), np.dtype('S2'), np.dtype('<U2')])
+        self.assertEqual(f.to_pairs(0),
+                (('a', (('x', 'foo'), ('y', 'ba'))),
+                ('b', (('x', ''), ('y', 'quux'))),
+                ('c', (('x', b''), ('y', b'zz'))),
+                ('d', (('x', 'pq'), ('y', ''))))
+                )
+
+    def test_frame_builder_e(self) -> None:
+
+        fb = FrameBuilder(index=('x', 'y'),
+                columns=('a', 'b', 'c'),
+                dtypes=(int, 'U2', float),
+                fill_value=0,
+                )
+        with self.assertRaises(RuntimeError):
+            fb['a'] = 1.5
+        with self.assertRaises(RuntimeError):
+            fb.iloc[:, 0] = np.array((1.0, 2.0))
+        with self.assertRaises(RuntimeError):
+            fb.loc['x', ['a', 'c']] = (0.5, 0.5)
+        with self.assertRaises(RuntimeError):
+            fb['b'] = 'abc'
+
+        fb['a'] = np.array((1, 2), dtype=np.int8)
+        fb['b'] = 'ab'
+        fb['c'] = 3
+        f = fb.to_frame()
+        self.assertEqual(f.values.tolist(), [[1, 'ab', 3.0], [2, 'ab', 3.0]])
+
+    def test_frame_builder_f(self) -> None:
+
+        fb = FrameBuilder(index=('x', 'y'),
+                columns=('a', 'b', 'c'),
+                dtypes=(np.int8, np.uint8, np.float16),
+                fill_value=0,
+                )
+        # values out of the range of narrower dtypes raise
+        with self.assertRaises(RuntimeError):
+            fb['a'] = [1000, 5]
+        with self.assertRaises(RuntimeError):
+            fb['a'] = np.array((1000, 5))
+        with self.assertRaises(RuntimeError):
+            fb.iloc[0, 0] = -129
+        with self.assertRaises(RuntimeError):
+            fb['b'] = (-1, 5)
+        with self.assertRaises(RuntimeError):
+            fb['c'] = np.array((1e10, 0.5))
+        with self.assertRaises(RuntimeError):
+            fb['c'] = [70000, 1]
+        with self.assertRaises(RuntimeError):
+            fb['a'] = np.array((1, 2), dtype=np.uint64) * 2 ** 40
+
+        # values of wider dtypes within range are accepted
+        fb['a'] = [-128, 127]
+        fb['b'] = np.array((0, 255))
+        fb['c'] = np.array((np.nan, -np.inf, 0.5))[1:]
+        f = fb.to_frame()
+        self.assertEqual(f.dtypes.values.tolist(),
+                [np.dtype(np.int8), np.dtype(np.uint8), np.dtype(np.float16)])
+        self.assertEqual(f.values.tolist(), [[-128, 0, -np.inf], [127, 255, 0.5]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -421,7 +421,7 @@ class TestUnit(TestCase):
 
         index = IndexGO(('a', 'b', 'c'))
         index.append('d')
-        self.assertEqual(len(index.__slots__), 8)
+        self.assertEqual(len(index.__slots__), 12)
         self.assertFalse(index.STATIC)
         self.assertEqual(index._IMMUTABLE_CONSTRUCTOR, Index)
         self.assertEqual(Index._MUTABLE_CONSTRUCTOR, IndexGO)
@@ -483,6 +483,43 @@ class TestUnit(TestCase):
                 [index.sort(ascending=False).loc_to_iloc(x) for x in sorted(index.values)],
                 [4, 3, 2, 1, 0])
 
+    def test_index_sort_b(self) -> None:
+        index = Index(('a', 'c', 'd', 'e', 'b'))
+        self.assertFalse(index.is_monotonic_increasing)
+        self.assertFalse(index.is_monotonic_decreasing)
+
+        post = index.sort()
+        self.assertEqual(post.values.tolist(), ['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(post._monotonic_cache, (True, None))
+        # an already sorted Index is returned
+        self.assertIs(post.sort(), post)
+        sub = post.iloc[1:]
+        self.assertIs(sub.sort(), sub)
+
+        index_go = IndexGO(('a', 'b'))
+        self.assertTrue(index_go.is_monotonic_increasing)
+        index_go.append('0')
+        self.assertFalse(index_go.is_monotonic_increasing)
+        self.assertEqual(index_go.sort().values.tolist(), ['0', 'a', 'b'])
+
+    def test_index_is_monotonic_a(self) -> None:
+        index = Index((1, 2, 5, 10))
+        self.assertTrue(index.is_monotonic_increasing)
+        self.assertFalse(index.is_monotonic_decreasing)
+        self.assertFalse(index.has_na)
+
+        # ordered selections retain cached values
+        post = index.iloc[1:3]
+        self.assertEqual(post._monotonic_cache, (True, None))
+        self.assertEqual(post._has_na_cache, False)
+        self.assertEqual(index.iloc[::-1]._monotonic_cache, (None, None))
+        self.assertTrue(index.iloc[::-1].is_monotonic_decreasing)
+
+        index = Index((1, np.nan, 3))
+        self.assertTrue(index.has_na)
+        self.assertFalse(index.is_monotonic_increasing)
+        self.assertEqual(index.sort(ascending=False).values.tolist()[1:], [3, 1])
+
     def test_index_relable(self) -> None:
 
         index = Index(('a', 'c', 'd', 'e', 'b'))
@@ -1276,6 +1313,58 @@ class TestUnit(TestCase):
         b.append(4)
         self.assertFalse(a.equals(b))
 
+    def test_index_equals_g(self) -> None:
+        a = Index(('a', 'b', 'c'), name='foo')
+        b = Index(a, name='bar')
+        # labels are shared
+        self.assertIs(a._labels, b._labels)
+        self.assertTrue(a.equals(b))
+        self.assertFalse(a.equals(b, compare_name=True))
+        self.assertFalse(a.equals(Index(('a', 'b', 'd'))))
+
+    #---------------------------------------------------------------------------
+
+    def test_index_map_deferred_a(self) -> None:
+        idx1 = Index(('a', 'b', 'c', 'd'))
+        idx2 = idx1[1:]
+        self.assertTrue(idx2._map_deferred)
+        self.assertEqual(idx2.values.tolist(), ['b', 'c', 'd'])
+        self.assertEqual(len(idx2), 3)
+        self.assertTrue(idx2._map_deferred)
+
+        self.assertEqual(idx2.loc_to_iloc('c'), 1)
+        self.assertFalse(idx2._map_deferred)
+        self.assertTrue('d' in idx2)
+        self.assertFalse('a' in idx2)
+
+    def test_index_map_deferred_b(self) -> None:
+        idx1 = IndexDate(('2020-01-01', '2020-01-02', '2020-01-03'))
+        idx2 = idx1[np.array([True, False, True])]
+        self.assertTrue(idx2._map_deferred)
+
+        # deferral is retained when sharing between static indices
+        idx3 = idx2.rename('foo')
+        self.assertTrue(idx3._map_deferred)
+        self.assertTrue('2020-01-03' in idx3)
+        self.assertEqual(idx3.loc_to_iloc('2020-01-03'), 1)
+
+        idx4 = pickle.loads(pickle.dumps(idx2))
+        self.assertEqual(idx4.loc['2020-01-03'], np.datetime64('2020-01-03'))
+
+    def test_index_map_deferred_c(self) -> None:
+        idx1 = Index(('a', 'b', 'c', 'd'))
+        # positions that are not ascending are mapped at creation
+        self.assertFalse(idx1[np.array([3, 0])]._map_deferred)
+        self.assertTrue(idx1[np.array([0, 3])]._map_deferred)
+
+        with self.assertRaises(ErrorInitIndex):
+            idx1[np.array([1, 1])]
+
+        idx2 = IndexGO(idx1[1:])
+        self.assertFalse(idx2._map_deferred)
+        idx2.append('e')
+        self.assertEqual(idx2.loc_to_iloc('e'), 3)
+
 
 
 if __name__ == '__main__':
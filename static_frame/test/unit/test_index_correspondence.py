@@ -10,6 +10,7 @@ import numpy as np
 
 
 from static_frame.core.index_correspondence import IndexCorrespondence
+from static_frame.core.index_correspondence import union_correspondence
 from static_frame.core.index import Index
 
 from static_frame.test.test_case import TestCase
@@ -45,6 +46,52 @@ class TestUnit(TestCase):
         self.assertEqual(ic.iloc_src, [0]) # this is as list in this use case
         self.assertEqual(ic.iloc_dst.tolist(), [0]) # type: ignore
 
+    def test_index_correspondence_from_union_a(self) -> None:
+        idx1 = Index(('c', 'a'))
+        idx2 = Index(('a', 'b', 'c', 'd'))
+        ic = IndexCorrespondence.from_union(idx1, idx2)
+        self.assertFalse(ic.is_subset)
+        self.assertTrue(ic.has_common)
+        self.assertEqual(ic.size, 4)
+        self.assertEqual(ic.iloc_src.tolist(), [0, 1]) # type: ignore
+        self.assertEqual(list(ic.iloc_dst), [2, 0]) # type: ignore
+
+        post = ic.resize_array(np.array([10, 20]), -1)
+        self.assertEqual(post.tolist(), [20, -1, 10, -1])
+        self.assertFalse(post.flags.writeable)
+
+        post = ic.resize_array(np.array([[1, 2], [3, 4]]), 0)
+        self.assertEqual(post.tolist(), [[3, 4], [0, 0], [1, 2], [0, 0]])
+
+    def test_index_correspondence_from_union_b(self) -> None:
+        idx1 = Index((), dtype=str)
+        ic = IndexCorrespondence.from_union(idx1, Index(('a', 'b')))
+        self.assertFalse(ic.has_common)
+        self.assertEqual(ic.resize_array(np.array((), dtype=float), 0).tolist(), [0.0, 0.0])
+
+        idx2 = Index((True,))
+        ic = IndexCorrespondence.from_union(idx2, Index((False, True)))
+        self.assertEqual(ic.iloc_dst, [1])
+
+    def test_union_correspondence_a(self) -> None:
+        idx1 = Index(('a', 'b', 'c'))
+        idx2 = Index(idx1.values.tolist())
+
+        self.assertEqual(union_correspondence(idx1, idx1), (idx1, None, None))
+        self.assertEqual(union_correspondence(idx1, idx2), (idx1, None, None))
+
+        union, ic1, ic2 = union_correspondence(idx1, Index(('b', 'a')))
+        self.assertEqual(union.values.tolist(), ['a', 'b', 'c'])
+        self.assertIs(ic1, None)
+        assert ic2 is not None
+        self.assertEqual(list(ic2.iloc_dst), [1, 0]) # type: ignore
+
+        union, ic1, ic2 = union_correspondence(idx1, Index(('d',)))
+        self.assertEqual(union.values.tolist(), ['a', 'b', 'c', 'd'])
+        assert ic1 is not None and ic2 is not None
+        self.assertEqual(list(ic1.iloc_dst), [0, 1, 2]) # type: ignore
+        self.assertEqual(list(ic2.iloc_dst), [3]) # type: ignore
+
 
 
 if __name__ == '__main__':
@@ -276,8 +276,8 @@ class TestUnit(TestCase):
                 ['A', 'B', 'C'],
                 slice('2018-01-01', '2018-01-04'),
                 ['x', 'y']])
-        # this will break if we recognize this can be a slice
-        self.assertEqual(post, list(range(len(ih))))
+        # contiguous selections are returned as a slice
+        self.assertEqual(post, slice(0, len(ih)))
 
         post = ih.loc_to_iloc(HLoc[
                 ['A', 'B', 'C'],
@@ -344,17 +344,17 @@ class TestUnit(TestCase):
 
 
         post = ih.loc_to_iloc(HLoc[:, 'A', :])
-        self.assertEqual(post, [0, 1, 7, 8, 9])
+        self.assertEqual(post.tolist(), [0, 1, 7, 8, 9])
 
 
         post = ih.loc_to_iloc(HLoc[:, 'C', 3])
-        self.assertEqual(post, [6])
+        self.assertEqual(post, slice(6, 7))
 
         post = ih.loc_to_iloc(HLoc[:, :, 3])
-        self.assertEqual(post, [4, 6, 9])
+        self.assertEqual(post.tolist(), [4, 6, 9])
 
         post = ih.loc_to_iloc(HLoc[:, :, 1])
-        self.assertEqual(post, [0, 2, 7, 10])
+        self.assertEqual(post.tolist(), [0, 2, 7, 10])
 
         self.assertEqual(
                 ih.loc_to_iloc(HLoc[:, :, [1, 2]]),
@@ -492,7 +492,7 @@ class TestUnit(TestCase):
 
         sel2 = ih1.values_at_depth(2) == 3
         post2 = ih1.loc_to_iloc(HLoc[slice(None), slice(None), sel2])
-        self.assertEqual(post2, [6])
+        self.assertEqual(post2, slice(6, 7))
 
 
     def test_hierarchy_loc_to_iloc_i(self) -> None:
@@ -514,7 +514,7 @@ class TestUnit(TestCase):
 
         # ILoc context is outermost, not local
         post1 = ih1.loc_to_iloc(HLoc[slice(None), ILoc[[0, -1]], 3])
-        self.assertEqual(post1, [6])
+        self.assertEqual(post1, slice(6, 7))
 
         post2 = ih1.loc_to_iloc(HLoc[['I', 'III'], 'B', 1])
         self.assertEqual(post2, [1, 4])
@@ -536,14 +536,14 @@ class TestUnit(TestCase):
 
         self.assertEqual(ih1.loc_to_iloc(HLoc[ILoc[-4:], :, 1]),
                 [4, 7])
-        self.assertEqual(ih1.loc_to_iloc(HLoc[:, :, 1]),
+        self.assertEqual(ih1.loc_to_iloc(HLoc[:, :, 1]).tolist(),
                 [0, 3, 4, 7])
 
         self.assertEqual(ih1.loc_to_iloc(HLoc[:, :, ILoc[-2:]]),
-                [6, 7])
+                slice(6, 8))
 
         self.assertEqual(ih1.loc_to_iloc(HLoc[:, ILoc[2:6], 1]),
-                [3, 4])
+                slice(3, 5))
 
 
     def test_hierarchy_loc_to_iloc_k(self) -> None:
@@ -561,10 +561,10 @@ class TestUnit(TestCase):
         ih1 = IndexHierarchy.from_labels(labels)
 
         post1 = ih1.loc_to_iloc(HLoc['II', ILoc[-5:], [2, 3]])
-        self.assertEqual(post1, [4, 5, 6, 7])
+        self.assertEqual(post1, slice(4, 8))
 
         post2 = ih1.loc_to_iloc(HLoc[:, :, ILoc[-4]])
-        self.assertEqual(post1, [4, 5, 6, 7])
+        self.assertEqual(post1, slice(4, 8))
 
     #---------------------------------------------------------------------------
 
@@ -901,6 +901,80 @@ class TestUnit(TestCase):
 
 
 
+    def test_hierarchy_from_arrays_a(self) -> None:
+
+        labels = (('I', 'A', 1),
+                ('I', 'A', 2),
+                ('I', 'B', 1),
+                ('II', 'B', 2),
+                ('II', 'C', 1),
+                )
+        arrays = [np.array(x) for x in zip(*labels)]
+        ih1 = IndexHierarchy.from_arrays(arrays, name=('a', 'b', 'c'))
+        ih2 = IndexHierarchy.from_labels(labels)
+
+        self.assertTrue(ih1.equals(ih2))
+        self.assertEqual(ih1.name, ('a', 'b', 'c'))
+        self.assertEqual(ih1.dtypes.values.tolist(),
+                [np.dtype('<U2'), np.dtype('<U1'), np.dtype(int)])
+        self.assertEqual([ih1.loc_to_iloc(x) for x in labels], [0, 1, 2, 3, 4])
+        self.assertEqual(ih1.loc_to_iloc(HLoc['II']), slice(3, 5))
+        self.assertEqual(ih1.loc_to_iloc(HLoc[:, 'B']), slice(2, 4))
+
+    def test_hierarchy_from_arrays_b(self) -> None:
+
+        ih1 = IndexHierarchy.from_arrays(
+                (('2020-01', '2020-01', '2020-02'), ('2020-01-05', '2020-01-12', '2020-01-05')),
+                index_constructors=(IndexYearMonth, IndexDate),
+                )
+        self.assertEqual([cls.__name__ for cls in ih1.index_types.values],
+                ['IndexYearMonth', 'IndexDate'])
+        self.assertEqual(
+                ih1.loc_to_iloc((np.datetime64('2020-02'), np.datetime64('2020-01-05'))),
+                2)
+
+        ih2 = IndexHierarchyGO.from_arrays((('a', 'a'), (1, 2)))
+        ih2.append(('b', 1))
+        self.assertEqual(ih2.values.tolist(), [['a', 1], ['a', 2], ['b', 1]])
+
+        ih3 = IndexHierarchy.from_arrays(((), ()))
+        self.assertEqual(ih3.shape, (0, 2))
+
+    def test_hierarchy_from_arrays_c(self) -> None:
+
+        with self.assertRaises(ErrorInitIndex):
+            IndexHierarchy.from_arrays((('a', 'b', 'a'), (1, 2, 3)))
+
+        with self.assertRaises(ErrorInitIndex):
+            IndexHierarchy.from_arrays((('a', 'a', 'b'), (1, 1, 2)))
+
+        with self.assertRaises(ErrorInitIndex):
+            IndexHierarchy.from_arrays((('a', 'a', 'b'),))
+
+        with self.assertRaises(ErrorInitIndex):
+            IndexHierarchy.from_arrays((np.arange(4).reshape(2, 2), (1, 2)))
+
+    def test_hierarchy_loc_to_iloc_hloc_labels_a(self) -> None:
+
+        ih = IndexHierarchyGO.from_product(('a', 'b'), (1, 2), ('x', 'y'))
+
+        self.assertEqual(ih.loc_to_iloc(HLoc['b', 1]), slice(4, 6))
+        self.assertEqual(ih.loc_to_iloc(HLoc[:, 2, 'y']).tolist(), [3, 7])
+
+        ih.append(('c', 2, 'y'))
+        self.assertEqual(ih.loc_to_iloc(HLoc[:, 2, 'y']).tolist(), [3, 7, 8])
+
+        with self.assertRaises(KeyError):
+            ih.loc_to_iloc(HLoc[:, 3, 'y'])
+
+    def test_hierarchy_loc_to_iloc_hloc_labels_b(self) -> None:
+
+        ih = IndexHierarchy.from_product(('a', 'b'), (1.0, np.nan), ('x', 'y'))
+
+        self.assertEqual(list(ih.loc_to_iloc(HLoc[:, np.nan, 'x'])), [2, 6])
+        self.assertEqual(list(ih.loc_to_iloc(HLoc[:, 1.0, 'x'])), [0, 4])
+        self.assertEqual(ih.loc[HLoc[:, np.nan, 'y']].values[:, 0].tolist(), ['a', 'b'])
+
     def test_hierarchy_from_labels_delimited_a(self) -> None:
 
         labels = ("'I' 'A'", "'I' 'B'")
@@ -665,6 +665,23 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
+    def test_index_level_from_arrays_a(self) -> None:
+        arrays = (
+                np.array(('a', 'a', 'a', 'b', 'b')),
+                np.array((1, 1, 2, 1, 1)),
+                np.array((True, False, True, True, False)),
+                )
+        lvl = IndexLevel.from_arrays(arrays)
+
+        self.assertEqual(lvl.depth, 3)
+        self.assertEqual(len(lvl), 5)
+        self.assertEqual([lvl.targets[i].offset for i in range(2)], [0, 3])
+        self.assertEqual([lvl.targets[1].targets[i].offset for i in range(1)], [0])
+        self.assertEqual([lvl.targets[0].targets[i].offset for i in range(2)], [0, 2])
+        self.assertEqual(lvl.leaf_loc_to_iloc(('b', 1, False)), 4)
+        self.assertEqual(lvl.values.tolist(),
+                [['a', 1, True], ['a', 1, False], ['a', 2, True], ['b', 1, True], ['b', 1, False]])
+
     def test_index_level_depth_reference_a(self) -> None:
         dtype = np.dtype
 
@@ -5,6 +5,7 @@ from io import StringIO
 import string
 import pickle
 import datetime
+import re
 import typing as tp
 from enum import Enum
 import numpy as np
@@ -521,6 +522,21 @@ class TestUnit(TestCase):
             # TypeError: int() argument must be a string, a bytes-like object or a number, not 'datetime.date'
             _ = d < s2
 
+    def test_series_binary_operator_n(self) -> None:
+        # NaN labels are not found in the union, and are not aligned
+        s1 = Series((1, 2), index=(1.0, np.nan))
+        s2 = Series((3, 4), index=(np.nan, 2.0))
+        s3 = s1 + s2
+        self.assertEqual(len(s3), 3)
+        self.assertTrue(s3.isna().all())
+
+        s4 = Series((1, 2), index=('a', np.nan))
+        s5 = Series((3, 4), index=('a', 'b'))
+        s6 = s4 + s5
+        self.assertEqual(len(s6), 3)
+        self.assertEqual(s6['a'], 4)
+        self.assertEqual(s6.isna().sum(), 2)
+
 
 
     #---------------------------------------------------------------------------
@@ -955,7 +971,7 @@ class TestUnit(TestCase):
 
     def test_series_fillna_forward_c(self) -> None:
 
-        # this case shown to justify the slice_condition oassed to slices_from_targets
+        # a missing value between values is filled from the nearest preceding value
         index = tuple(string.ascii_lowercase[:8])
         s1 = Series((3, 2, None, 4, None, None, 5, 6), index=index)
 
@@ -1457,6 +1473,20 @@ class TestUnit(TestCase):
         self.assertEqual(post3,
                 (('a', 100), ('b', 30), ('c', 150), ('d', 210), ('e', 280)))
 
+    def test_series_iter_element_d(self) -> None:
+        s1 = Series((10, 3, 15), index=('a', 'b', 'c'), name='foo')
+
+        s2 = s1.iter_element().apply_vectorized(np.negative)
+        self.assertEqual(s2.to_pairs(), (('a', -10), ('b', -3), ('c', -15)))
+        self.assertEqual(s2.name, None)
+
+        s3 = s1.iter_element().apply_vectorized(lambda a: a > 5, dtype=int)
+        self.assertEqual(s3.dtype, np.dtype(int))
+        self.assertEqual(s3.values.tolist(), [1, 0, 1])
+
+        with self.assertRaises(RuntimeError):
+            s1.iter_element().apply_vectorized(np.sum)
+
 
     #---------------------------------------------------------------------------
 
@@ -1589,6 +1619,29 @@ class TestUnit(TestCase):
                 (('a', 0), ('b', 0), ('c', 0), ('d', 100), ('e', 101))
                 )
 
+    def test_series_iter_element_map_d(self) -> None:
+        s1 = Series(('b', 'a', 'b', 'c', 'a'), index=tuple('pqrst'))
+
+        post1 = s1.iter_element().map_all({'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(post1.dtype, np.dtype(int))
+        self.assertEqual(post1.to_pairs(),
+                (('p', 2), ('q', 1), ('r', 2), ('s', 3), ('t', 1)))
+
+        with self.assertRaises(KeyError):
+            s1.iter_element().map_all({'a': 1, 'b': 2})
+
+        post2 = s1.iter_element().map_fill({'a': 1.5}, fill_value=0)
+        self.assertEqual(post2.dtype, np.dtype(float))
+        self.assertEqual(post2.values.tolist(), [0, 1.5, 0, 0, 1.5])
+
+        post3 = s1.iter_element().map_any({'a': 'x'}, name='foo')
+        self.assertEqual(post3.name, 'foo')
+        self.assertEqual(post3.values.tolist(), ['b', 'x', 'b', 'c', 'x'])
+
+        s2 = Series((1, None, 'a', 1), dtype=object)
+        post4 = s2.iter_element().map_any({'a': 0})
+        self.assertEqual(post4.values.tolist(), [1, None, 0, 1])
+
 
 
     #---------------------------------------------------------------------------
@@ -1649,6 +1702,35 @@ class TestUnit(TestCase):
 
 
 
+    def test_series_sort_index_e(self) -> None:
+        s1 = Series((10, 20, 30), index=('a', 'b', 'c'))
+        self.assertIs(s1.sort_index(), s1)
+        self.assertEqual(s1.sort_index(ascending=False).to_pairs(),
+                (('c', 30), ('b', 20), ('a', 10)))
+
+        s2 = Series((10, 20, 30), index=('c', 'a', 'b'))
+        self.assertEqual(s2.sort_index().to_pairs(),
+                (('a', 20), ('b', 30), ('c', 10)))
+        # the index sort order is cached
+        self.assertEqual(s2.index._argsort_cache.tolist(), [1, 2, 0])
+
+    def test_series_is_monotonic_a(self) -> None:
+        s1 = Series((1, 2, 2, 5))
+        self.assertTrue(s1.is_monotonic_increasing)
+        self.assertFalse(s1.is_monotonic_decreasing)
+        self.assertFalse(s1.has_na)
+        self.assertIs(s1.sort_values(), s1)
+
+        self.assertEqual(s1.head(2)._monotonic_cache, (True, None))
+        self.assertEqual(s1.tail(2)._has_na_cache, False)
+
+        s2 = Series((3, np.nan, 1))
+        self.assertTrue(s2.has_na)
+        self.assertFalse(s2.is_monotonic_decreasing)
+        post = s2.sort_values(ascending=False)
+        self.assertEqual(post._monotonic_cache, (None, None))
+        self.assertEqual(post.index.values.tolist(), [1, 0, 2])
+
     #---------------------------------------------------------------------------
     def test_series_sort_values_a(self) -> None:
 
@@ -1678,6 +1760,25 @@ class TestUnit(TestCase):
 
         self.assertEqual(post.index.__class__, IndexHierarchy)
 
+    def test_series_sort_values_c(self) -> None:
+        s = Series((2, 1, 2, np.nan, 1), index=tuple('abcde'))
+        # descending sorts retain the position order of ties
+        self.assertEqual(s.sort_values(ascending=False).index.values.tolist(),
+                ['d', 'a', 'c', 'b', 'e'])
+        self.assertEqual(s.sort_values().index.values.tolist(),
+                ['b', 'e', 'a', 'c', 'd'])
+
+
+    def test_series_nlargest_a(self) -> None:
+        s = Series((3, np.nan, 4, 1, 4, 9), index=tuple('abcdef'))
+
+        self.assertEqual(s.nlargest(3).to_pairs(),
+                (('f', 9.0), ('c', 4.0), ('e', 4.0)))
+        self.assertEqual(s.nsmallest(2).to_pairs(),
+                (('d', 1.0), ('a', 3.0)))
+        self.assertEqual(s.iloc_nlargest(2).tolist(), [5, 2])
+        self.assertEqual(s.iloc_nsmallest(10).tolist(), [3, 0, 2, 4, 5])
+
 
 
     def test_series_reversed(self) -> None:
@@ -3322,6 +3423,40 @@ class TestUnit(TestCase):
         self.assertEqual(s2.to_pairs(),
                 (('x', ('f', '*', 'oo')), ('y', ('b', '*', 'ar'))))
 
+    def test_series_str_contains_a(self) -> None:
+        s1 = Series(('ticket-123', 'Ticket-9', 'none'), index=('x', 'y', 'z'))
+
+        self.assertEqual(s1.via_str.contains('ticket').to_pairs(),
+                (('x', True), ('y', False), ('z', False)))
+        self.assertEqual(s1.via_str.contains(r'\d$', re.I).to_pairs(),
+                (('x', True), ('y', True), ('z', False)))
+
+        s2 = Series((10, 23), index=('x', 'y'))
+        self.assertEqual(s2.via_str.contains('3').to_pairs(),
+                (('x', False), ('y', True)))
+
+    def test_series_str_match_a(self) -> None:
+        s1 = Series(('ticket-123', 'Ticket-9', 'none'), index=('x', 'y', 'z'))
+
+        self.assertEqual(s1.via_str.match('t').to_pairs(),
+                (('x', True), ('y', False), ('z', False)))
+        self.assertEqual(s1.via_str.match('t', re.I).to_pairs(),
+                (('x', True), ('y', True), ('z', False)))
+
+    def test_series_str_extract_a(self) -> None:
+        s1 = Series(('ticket-123', 'Ticket-9', 'none'), index=('x', 'y', 'z'))
+
+        s2 = s1.via_str.extract(r'\d+')
+        self.assertEqual(s2.dtype, np.dtype('<U3'))
+        self.assertEqual(s2.to_pairs(),
+                (('x', '123'), ('y', '9'), ('z', '')))
+
+        self.assertEqual(s1.via_str.extract(r'^(\w)').to_pairs(),
+                (('x', 't'), ('y', 'T'), ('z', 'n')))
+
+        self.assertEqual(s1.via_str.extract(r'(\w+)-(\d+)').to_pairs(),
+                (('x', ('ticket', '123')), ('y', ('Ticket', '9')), ('z', None)))
+
     def test_series_str_rpartition_a(self) -> None:
         s1 = Series(('f*o*o', 'b*a*r'), index=('x', 'y'))
         s2 = s1.via_str.rpartition('*')
@@ -3329,7 +3464,55 @@ class TestUnit(TestCase):
         self.assertEqual(s2.to_pairs(),
                 (('x', ('f*o', '*', 'o')), ('y', ('b*a', '*', 'r'))))
 
-        # import ipdb; ipdb.set_trace()
+    #---------------------------------------------------------------------------
+    def test_series_via_lazy_a(self) -> None:
+        s1 = Series((1, 2, 3), index=('a', 'b', 'c'))
+        s2 = Series((10.0, 20.0), index=('b', 'c'))
+
+        e1 = (s1.via_lazy * 2 + s2) / 4
+        s3 = e1.evaluate()
+        self.assertEqual(s3.fillna(0).to_pairs(),
+                (('a', 0.0), ('b', 3.5), ('c', 6.5)))
+        self.assertTrue(s3.equals((s1 * 2 + s2) / 4))
+
+        s4 = (-s1.via_lazy + 1 == s1.via_lazy - 1).evaluate()
+        self.assertEqual(s4.to_pairs(), (('a', True), ('b', False), ('c', False)))
+        self.assertFalse(s4.values.flags.writeable)
+
+    def test_series_via_lazy_b(self) -> None:
+        s1 = Series(('a', 'b'), index=('x', 'y'))
+        s2 = Series(('c', 'd'), index=('x', 'y'))
+        # operators on non-numeric values are applied as with Series
+        s3 = (s1.via_lazy + s2 + 'e').evaluate()
+        self.assertEqual(s3.to_pairs(), (('x', 'ace'), ('y', 'bde')))
+        s4 = ('z' + s1.via_lazy).evaluate()
+        self.assertEqual(s4.to_pairs(), (('x', 'za'), ('y', 'zb')))
+
+    def test_series_via_lazy_c(self) -> None:
+        s1 = Series((1, 2, 3), index=('a', 'b', 'c'))
+        s2 = Series((True, False, True), index=('a', 'b', 'c'))
+
+        # reflected operators match those of arrays
+        for func in (
+                lambda s: 7 % s,
+                lambda s: 2 ** s,
+                lambda s: 1 << s,
+                lambda s: 16 >> s,
+                lambda s: 3 & s,
+                lambda s: 3 ^ s,
+                lambda s: 4 | s,
+                ):
+            self.assertEqual(func(s1.via_lazy).evaluate().values.tolist(),
+                    func(s1.values).tolist())
+
+        self.assertEqual((False | s2.via_lazy).evaluate().values.tolist(),
+                [True, False, True])
+
+        with self.assertRaises(NotImplementedError):
+            [1, 2, 3] @ s1.via_lazy
+        with self.assertRaises(NotImplementedError):
+            s1.via_lazy @ s1
+
     #---------------------------------------------------------------------------
     def test_series_as_dt_year_a(self) -> None:
         dt64 = np.datetime64
@@ -3403,6 +3586,68 @@ class TestUnit(TestCase):
             s1.via_dt.isoformat()
 
 
+    def test_series_as_dt_weekday_b(self) -> None:
+
+        s1 = Series(('1969-12-28', '1970-01-01', '2021-03-14'),
+                index=('x', 'y', 'z'),
+                dtype=np.datetime64
+                )
+        self.assertEqual(s1.via_dt.weekday().to_pairs(),
+                (('x', 6), ('y', 3), ('z', 6)))
+
+        s2 = Series(s1.values.astype(object), index=s1.index)
+        self.assertEqual(s2.via_dt.weekday().to_pairs(),
+                (('x', 6), ('y', 3), ('z', 6)))
+
+    def test_series_as_dt_isoformat_b(self) -> None:
+
+        s1 = Series(('2014-01-02T05:02:01.250', '2013-02-05T16:55:00'),
+                index=('x', 'y'),
+                dtype='datetime64[ms]'
+                )
+        self.assertEqual(s1.via_dt.isoformat().to_pairs(),
+                (('x', '2014-01-02T05:02:01.250000'), ('y', '2013-02-05T16:55:00')))
+
+        self.assertEqual(s1.via_dt.isoformat(' ', 'minutes').to_pairs(),
+                (('x', '2014-01-02 05:02'), ('y', '2013-02-05 16:55')))
+
+        with self.assertRaises(ValueError):
+            s1.via_dt.isoformat(timespec='days')
+
+    def test_series_as_dt_hour_a(self) -> None:
+
+        s1 = Series(('2014-01-02T05:02:01', '2013-02-05T16:55:40'),
+                index=('x', 'y'),
+                dtype='datetime64[s]'
+                )
+        self.assertEqual(s1.via_dt.hour.to_pairs(), (('x', 5), ('y', 16)))
+        self.assertEqual(s1.via_dt.minute.to_pairs(), (('x', 2), ('y', 55)))
+        self.assertEqual(s1.via_dt.second.to_pairs(), (('x', 1), ('y', 40)))
+
+        s2 = Series(s1.values.astype(object), index=s1.index)
+        self.assertEqual(s2.via_dt.hour.to_pairs(), (('x', 5), ('y', 16)))
+        self.assertEqual(s2.via_dt.second.to_pairs(), (('x', 1), ('y', 40)))
+
+        with self.assertRaises(RuntimeError):
+            _ = s1.astype('datetime64[D]').via_dt.hour
+
+    def test_series_as_dt_quarter_a(self) -> None:
+
+        s1 = Series(('2014-01-02', '2013-05-31', '2012-12-31'),
+                index=('x', 'y', 'z'),
+                dtype=np.datetime64
+                )
+        self.assertEqual(s1.via_dt.quarter.to_pairs(),
+                (('x', 1), ('y', 2), ('z', 4)))
+        self.assertEqual(s1.via_dt.day_of_year.to_pairs(),
+                (('x', 2), ('y', 151), ('z', 366)))
+
+        s2 = Series(s1.values.astype(object), index=s1.index)
+        self.assertEqual(s2.via_dt.quarter.to_pairs(),
+                (('x', 1), ('y', 2), ('z', 4)))
+        self.assertEqual(s2.via_dt.day_of_year.to_pairs(),
+                (('x', 2), ('y', 151), ('z', 366)))
+
     def test_series_via_dt_fromisoformat_a(self) -> None:
         s1 = Series(('2014-02-12', '2013-11-28'), index=('x', 'y'))
         post = s1.via_dt.fromisoformat()
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from static_frame.core.frame import FrameGO
+from static_frame.core.shared_blocks import array_from_spec
+from static_frame.core.shared_blocks import frame_from_spec
+from static_frame.core.shared_blocks import SharedBlocks
+from static_frame.test.test_case import TestCase
+from static_frame.test.test_case import skip_pylt38
+
+
+@skip_pylt38 #type: ignore
+class TestUnit(TestCase):
+
+    def test_shared_blocks_a(self) -> None:
+
+        a1 = np.arange(6).reshape(2, 3)
+        a2 = np.array([None, 'a'], dtype=object)
+
+        with SharedBlocks() as shared:
+            spec1 = shared.share_array(a1)
+            self.assertEqual(spec1[1:], ((2, 3), a1.dtype))
+            # object arrays are not shared
+            self.assertIs(shared.share_array(a2), a2)
+
+            post = array_from_spec(spec1)
+            self.assertEqual(post.tolist(), a1.tolist())
+            self.assertFalse(post.flags.writeable)
+
+    def test_shared_blocks_b(self) -> None:
+
+        f1 = FrameGO.from_dict(
+                dict(a=(1, 2), b=('x', 'y'), c=(False, True), d=(None, 3)),
+                index=('p', 'q'),
+                name='foo')
+
+        with SharedBlocks() as shared:
+            f2 = frame_from_spec(shared.share_frame(f1))
+            self.assertTrue(f2.equals(f1,
+                    compare_name=True,
+                    compare_dtype=True,
+                    compare_class=True,
+                    ))
+            f2['e'] = 0
+            self.assertEqual(f2.shape, (2, 5))
+            self.assertEqual(f1.shape, (2, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
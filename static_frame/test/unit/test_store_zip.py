@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 # from io import StringIO
 
@@ -186,6 +187,28 @@ class TestUnit(TestCase):
             with self.assertRaises(NotImplementedError):
                 st.write(((f1.name, f1),))
 
+    def test_store_zip_pickle_d(self) -> None:
+
+        f1 = Frame.from_dict(
+                dict(a=(1,2), b=(3,4)),
+                index=('x', 'y'),
+                name='foo')
+
+        with temp_file('.zip') as fp:
+
+            st = StoreZipPickle(fp)
+            st.write(((f1.name, f1),))
+
+            loop = asyncio.new_event_loop()
+            try:
+                frame_stored = loop.run_until_complete(
+                        st.aread('foo', container_type=FrameGO))
+            finally:
+                loop.close()
+
+            self.assertEqual(frame_stored.__class__, FrameGO)
+            self.assertEqual(frame_stored.to_pairs(0), f1.to_pairs(0))
+
 
     def test_store_zip_parquet_a(self) -> None:
 
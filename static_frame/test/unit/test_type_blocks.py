@@ -1,4 +1,5 @@
 import unittest
+import datetime
 import pickle
 
 import numpy as np
@@ -172,6 +173,59 @@ class TestUnit(TestCase):
 
 
 
+    def test_type_blocks_contiguous_pairs_b(self) -> None:
+
+        a = np.array([(0, 0), (0, 1), (0, 0), (0, 1), (1, 3), (1, 2), (1, 1), (1, 0)])
+        post = list(TypeBlocks._indices_to_contiguous_pairs(a))
+        self.assertEqual(post, [
+                (0, slice(0, 2)),
+                (0, slice(0, 1)),
+                (0, slice(1, 2)),
+                (1, slice(3, None, -1)),
+                ])
+
+        self.assertEqual(list(TypeBlocks._indices_to_contiguous_pairs(())), [])
+
+    def test_type_blocks_index_a(self) -> None:
+
+        a1 = np.array([[1, 2, 3], [4, 5, 6]])
+        a2 = np.array([False, True])
+        tb1 = TypeBlocks.from_blocks((a1, a2))
+        self.assertEqual(tb1._index.tolist(), [[0, 0], [0, 1], [0, 2], [1, 0]])
+
+        tb1.append(np.array([['a', 'b'], ['c', 'd']]))
+        self.assertEqual(tb1._index.tolist(),
+                [[0, 0], [0, 1], [0, 2], [1, 0], [2, 0], [2, 1]])
+        self.assertEqual(tb1.dtypes.tolist(),
+                [np.dtype(int), np.dtype(int), np.dtype(int), np.dtype(bool),
+                np.dtype('<U1'), np.dtype('<U1')])
+        self.assertEqual(tb1.iloc[:, 5].values.tolist(), [['b'], ['d']])
+
+        tb2 = TypeBlocks.from_zero_size_shape((3, 0))
+        self.assertEqual(tb2._index.shape, (0, 2))
+
+    def test_type_blocks_index_b(self) -> None:
+
+        tb1 = TypeBlocks.from_blocks((np.arange(2),))
+        self.assertEqual(tb1._index.tolist(), [[0, 0]])
+        tb2 = tb1.copy()
+
+        for i in range(5):
+            tb1.append(np.arange(2) if i % 2 else np.ones((2, 2)))
+            tb1.consolidate_trailing(2)
+            self.assertEqual(tb1._index.tolist(),
+                    TypeBlocks.from_blocks(tb1._blocks)._index.tolist())
+            self.assertFalse(tb1._index.flags.writeable)
+
+        self.assertEqual(tb1._index.tolist(),
+                [[0, 0], [1, 0], [1, 1], [2, 0], [3, 0], [3, 1], [4, 0], [5, 0], [5, 1]])
+        # the shared locator of the copy is not modified
+        self.assertEqual(tb2._index.tolist(), [[0, 0]])
+
+        tb3 = pickle.loads(pickle.dumps(tb1))
+        tb3.append(np.arange(2))
+        self.assertEqual(tb3._index.tolist()[-2:], [[5, 1], [6, 0]])
+
     def test_type_blocks_indices_to_contiguous_pairs(self) -> None:
 
         a1 = np.array([[1, 2, 3], [4, 5, 6], [0, 0, 1]])
@@ -582,6 +636,27 @@ class TestUnit(TestCase):
         tb2 = tb1.consolidate()
         self.assertTrue((tb1.dtypes == tb2.dtypes).all())
 
+    def test_type_blocks_consolidate_d(self) -> None:
+        tb1 = TypeBlocks.from_blocks(np.empty(shape=(3, 0)))
+        tb2 = tb1.consolidate()
+        self.assertEqual(tb2.shape, (3, 0))
+
+    def test_type_blocks_consolidate_trailing_a(self) -> None:
+        tb1 = TypeBlocks.from_blocks((np.array([1, 2]), np.array([3.0, 4.0])))
+        tb1.append(np.array([5.0, 6.0]))
+        tb1.consolidate_trailing(3)
+        self.assertEqual(len(tb1._blocks), 3)
+
+        tb1.consolidate_trailing(2)
+        self.assertEqual(tb1.shapes.tolist(), [(2,), (2, 2)])
+        self.assertFalse(tb1._blocks[1].flags.writeable)
+        self.assertEqual(tb1.values.tolist(), [[1, 3, 5], [2, 4, 6]])
+        self.assertEqual(tb1._extract_array(column_key=2).tolist(), [5.0, 6.0])
+
+        # the trailing block is now 2D
+        tb1.consolidate_trailing(2)
+        self.assertEqual(len(tb1._blocks), 2)
+
 
     #---------------------------------------------------------------------------
 
@@ -1447,6 +1522,35 @@ class TestUnit(TestCase):
         with self.assertRaises(AxisInvalid):
             _ = next(tb.axis_values(-1))
 
+    def test_type_blocks_axis_values_d(self) -> None:
+        # rows span more than one chunk
+        count = 40_000
+        a1 = np.arange(count)
+        a2 = np.arange(count) * 0.5
+        tb = TypeBlocks.from_blocks((a1, a2))
+
+        rows = list(tb.axis_values(1))
+        self.assertEqual(len(rows), count)
+        self.assertEqual(rows[0].tolist(), [0.0, 0.0])
+        self.assertEqual(rows[-1].tolist(), [39_999.0, 19_999.5])
+        self.assertFalse(rows[-1].flags.writeable)
+        self.assertTrue((np.array(rows) == tb.values).all())
+
+        rows = list(tb.axis_values(1, reverse=True))
+        self.assertEqual(rows[0].tolist(), [39_999.0, 19_999.5])
+        self.assertTrue((np.array(rows[::-1]) == tb.values).all())
+
+    def test_type_blocks_axis_values_e(self) -> None:
+        a1 = np.array([1, 2])
+        a2 = np.array([['a', 'b'], ['c', 'd']])
+        a3 = np.array(['2020-01-01', '2021-06-30'], dtype='datetime64[D]')
+        tb = TypeBlocks.from_blocks((a1, a2, a3))
+
+        rows = list(tb.axis_values(1))
+        self.assertEqual(rows[1].dtype, object)
+        self.assertEqual(rows[1].tolist(),
+                [2, 'c', 'd', datetime.date(2021, 6, 30)])
+
 
     #---------------------------------------------------------------------------
     def test_type_blocks_extract_iloc_mask_a(self) -> None:
@@ -2757,6 +2861,37 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
+    def test_type_blocks_ufunc_shape_skipna_a(self) -> None:
+
+        a1 = np.array(['a', 'b', 'c'])
+        a2 = np.arange(6).reshape(3, 2)
+        a3 = np.array([True, False, True])
+        tb1 = TypeBlocks.from_blocks((a1, a2, a3))
+
+        tb2 = tb1.ufunc_shape_skipna(axis=0,
+                skipna=False,
+                ufunc=np.cumsum,
+                ufunc_skipna=np.nancumsum,
+                )
+        self.assertEqual(tb2.shapes.tolist(), [(3,), (3, 2), (3,)])
+        self.assertEqual(tb2.values.tolist(),
+                [['a', 0, 1, 1], ['ab', 2, 4, 1], ['abc', 6, 9, 2]])
+
+        tb3 = TypeBlocks.from_blocks((a2, a3)).ufunc_shape_skipna(axis=1,
+                skipna=False,
+                ufunc=np.cumprod,
+                ufunc_skipna=np.nancumprod,
+                )
+        self.assertEqual(tb3.values.tolist(),
+                [[0, 0, 0], [2, 6, 0], [4, 20, 20]])
+
+        with self.assertRaises(RuntimeError):
+            tb1.ufunc_shape_skipna(axis=2,
+                    skipna=False,
+                    ufunc=np.cumsum,
+                    ufunc_skipna=np.nancumsum,
+                    )
+
     def test_type_blocks_ufunc_blocks_a(self) -> None:
 
         a1 = np.arange(8).reshape(2, 4)
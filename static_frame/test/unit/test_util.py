@@ -19,15 +19,23 @@ from static_frame.core.util import argmax_1d
 from static_frame.core.util import argmax_2d
 from static_frame.core.util import argmin_1d
 from static_frame.core.util import argmin_2d
+from static_frame.core.util import argnlargest
+from static_frame.core.util import argnsmallest
+from static_frame.core.util import argsort_keys
+from static_frame.core.util import array_fillna_directional
+from static_frame.core.util import fill_positions_directional
+from static_frame.core.util import factorize_sortable
+from static_frame.core.util import array_factorize
 from static_frame.core.util import array_from_element_method
 from static_frame.core.util import array_shift
 from static_frame.core.util import array_to_duplicated
-from static_frame.core.util import binary_transition
 from static_frame.core.util import column_1d_filter
 from static_frame.core.util import concat_resolved
 from static_frame.core.util import DT64_DAY
 from static_frame.core.util import DT64_YEAR
 from static_frame.core.util import dtype_to_fill_value
+from static_frame.core.util import groups_to_positions
+from static_frame.core.util import chunks_from_sizes
 from static_frame.core.util import intersect1d
 from static_frame.core.util import intersect2d
 from static_frame.core.util import isin
@@ -36,6 +44,8 @@ from static_frame.core.util import iterable_to_array_1d
 from static_frame.core.util import iterable_to_array_2d
 from static_frame.core.util import iterable_to_array_nd
 from static_frame.core.util import key_to_datetime_key
+from static_frame.core.util import positions_to_slice
+from static_frame.core.util import positions_unique
 from static_frame.core.util import resolve_dtype
 from static_frame.core.util import resolve_dtype_iter
 from static_frame.core.util import resolve_type_iter
@@ -45,7 +55,6 @@ from static_frame.core.util import row_1d_filter
 from static_frame.core.util import setdiff1d
 from static_frame.core.util import setdiff2d
 from static_frame.core.util import slice_to_ascending_slice
-from static_frame.core.util import slices_from_targets
 from static_frame.core.util import to_datetime64
 from static_frame.core.util import to_timedelta64
 from static_frame.core.util import ufunc_all
@@ -167,6 +176,53 @@ class TestUnit(TestCase):
 
 
 
+    def test_groups_to_positions_a(self) -> None:
+
+        groups = np.array(['a', 'b', 'c'])
+        locations = np.array([2, 0, 2, 1, 0, 2])
+
+        positions, items = groups_to_positions(groups, locations)
+        self.assertEqual(positions.tolist(), [1, 4, 3, 0, 2, 5])
+        self.assertEqual(items, [('a', 0, 2), ('b', 2, 3), ('c', 3, 6)])
+
+    def test_chunks_from_sizes_a(self) -> None:
+        self.assertEqual(chunks_from_sizes([1, 1, 1, 1], 2),
+                [slice(0, 2), slice(2, 4)])
+        # a large item is given its own chunk
+        self.assertEqual(chunks_from_sizes([1, 1, 10, 1, 1], 4),
+                [slice(0, 2), slice(2, 3), slice(3, 5)])
+        self.assertEqual(chunks_from_sizes([], 4), [])
+
+    def test_array_factorize_a(self) -> None:
+        uniques, codes = array_factorize(np.array(['c', 'a', 'c', 'b']))
+        self.assertEqual(uniques.tolist(), ['a', 'b', 'c'])
+        self.assertEqual(codes.tolist(), [2, 0, 2, 1])
+
+        # unsortable values are factorized in order of appearance
+        uniques, codes = array_factorize(np.array([None, 'a', None, 3], dtype=object))
+        self.assertEqual(uniques.tolist(), [None, 'a', 3])
+        self.assertEqual(codes.tolist(), [0, 1, 0, 2])
+
+    def test_positions_unique_a(self) -> None:
+        self.assertTrue(positions_unique(np.array([], dtype=int)))
+        self.assertTrue(positions_unique(np.array([3])))
+        self.assertTrue(positions_unique(np.array([0, 2, 5])))
+
+        self.assertFalse(positions_unique(np.array([-1])))
+        self.assertFalse(positions_unique(np.array([-1, 2])))
+        self.assertFalse(positions_unique(np.array([0, 2, 2])))
+        self.assertFalse(positions_unique(np.array([2, 0])))
+        self.assertFalse(positions_unique(np.array([True, False])))
+
+    def test_positions_to_slice_a(self) -> None:
+        self.assertEqual(positions_to_slice(np.array([2, 3, 4])), slice(2, 5))
+        self.assertEqual(positions_to_slice(np.array([0])), slice(0, 1))
+
+        self.assertIsNone(positions_to_slice(np.array([], dtype=int)))
+        self.assertIsNone(positions_to_slice(np.array([0, 2])))
+        self.assertIsNone(positions_to_slice(np.array([3, 2])))
+        self.assertIsNone(positions_to_slice(np.array([-1, 0])))
+
     def test_isna_array_a(self) -> None:
 
         a1 = np.array([1, 2, 3])
@@ -1270,75 +1326,6 @@ class TestUnit(TestCase):
                 to_timedelta64(timedelta(minutes=4)),
                 np.timedelta64(240, 's'))
 
-    def test_binary_transition_a(self) -> None:
-        a1 = np.array([False, True, True, False, False, True, True, False])
-        self.assertEqual(binary_transition(a1).tolist(), [0, 3, 4, 7])
-
-        a1 = np.array([False, False, True, False, True, True, True, True])
-        self.assertEqual(binary_transition(a1).tolist(), [1, 3])
-
-
-        a1 = np.array([True, False, True])
-        self.assertEqual(binary_transition(a1).tolist(), [1])
-
-        a1 = np.array([False, True, False])
-        self.assertEqual(binary_transition(a1).tolist(), [0, 2])
-
-        a1 = np.array([True])
-        self.assertEqual(binary_transition(a1).tolist(), [])
-
-        a1 = np.array([False])
-        self.assertEqual(binary_transition(a1).tolist(), [])
-
-        a1 = np.array([False, True])
-        self.assertEqual(binary_transition(a1).tolist(), [0])
-
-        a1 = np.array([True, False])
-        self.assertEqual(binary_transition(a1).tolist(), [1])
-
-
-    def test_binary_transition_b(self) -> None:
-        # return index per axis (column or row) at False values where False was True, or will be True
-        a1 = np.array([[False, False, True, False],
-                       [True, False, True, False],
-                       [False, False, False, True]
-                       ])
-
-        self.assertEqual(
-                binary_transition(a1, axis=0).tolist(),
-                [[0, 2], None, [2,], [1,]]
-                )
-
-        self.assertEqual(
-                binary_transition(a1, axis=1).tolist(),
-                [[1, 3], [1, 3], [2,]]
-                )
-
-    def test_binary_transition_c(self) -> None:
-        # return index per axis (column or row) at False values where False was True, or will be True
-        a1 = np.array([[False, False, True, False],
-                       [True, False, True, False],
-                       [True, False, True, False],
-                       [True, False, False, True],
-                       [False, False, False, True]
-                       ])
-
-        self.assertEqual(
-                binary_transition(a1, axis=0).tolist(),
-                [[0, 4], None, [3,], [2,]]
-                )
-
-        self.assertEqual(
-                binary_transition(a1, axis=1).tolist(),
-                [[1, 3], [1, 3], [1, 3], [1, 2], [2,]]
-                )
-
-
-    def test_binary_transition_d(self) -> None:
-        with self.assertRaises(NotImplementedError):
-            binary_transition(np.arange(12).reshape((2, 2, 3)), 0)
-
-
     #---------------------------------------------------------------------------
 
     def test_roll_1d_a(self) -> None:
@@ -1921,6 +1908,75 @@ class TestUnit(TestCase):
                 [0, np.nan, 1]
                 )
 
+    def test_argnlargest_a(self) -> None:
+        a1 = np.array([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5])
+        # ties are selected and ordered by position
+        self.assertEqual(argnlargest((a1,), 4).tolist(), [5, 7, 4, 8])
+        self.assertEqual(argnsmallest((a1,), 4).tolist(), [1, 3, 6, 0])
+        self.assertEqual(argnsmallest((a1,), 0).tolist(), [])
+        self.assertEqual(argnlargest((a1,), 20).tolist(),
+                np.argsort(-a1, kind='stable').tolist())
+
+        a2 = np.array([3, np.nan, 4, 1, np.nan, 9])
+        self.assertEqual(argnlargest((a2,), 3).tolist(), [5, 2, 0])
+        self.assertEqual(argnsmallest((a2,), 10).tolist(), [3, 0, 2, 5])
+
+    def test_argnlargest_b(self) -> None:
+        a1 = np.array([2, 1, 2, 1, 2, 1])
+        a2 = np.array([5, 8, 7, 9, 7, 3])
+        self.assertEqual(argnlargest((a1, a2), 2).tolist(), [2, 4])
+        self.assertEqual(argnsmallest((a1, a2), 3).tolist(), [5, 1, 3])
+
+        a3 = np.array(['b', None, 'a', 'c'], dtype=object)
+        self.assertEqual(argnlargest((a3,), 2).tolist(), [3, 0])
+
+    def test_factorize_sortable_a(self) -> None:
+        a1 = np.array([3, 1, 3, 2])
+        self.assertEqual(factorize_sortable(a1).tolist(), [2, 0, 2, 1])
+
+        a2 = np.array(['c', 'a', 'c', 'b'], dtype=object)
+        self.assertEqual(factorize_sortable(a2).tolist(), [2, 0, 2, 1])
+
+        # mixed types are ordered by type name, then value, with real numbers first
+        a3 = np.array([3, 'b', None, 1, 'a', 3], dtype=object)
+        self.assertEqual(factorize_sortable(a3).tolist(), [1, 4, 2, 0, 3, 1])
+
+        # real numbers of different types are ordered by value
+        a4 = np.array([1, 2.5, 'x', 0.5, 3, True, np.int8(2)], dtype=object)
+        codes = factorize_sortable(a4)
+        self.assertEqual(a4[np.argsort(codes, kind='mergesort')].tolist(),
+                [0.5, 1, True, 2, 2.5, 3, 'x'])
+
+    def test_argsort_keys_a(self) -> None:
+        a1 = np.array([1, 2, 1, 2, 1])
+        # descending retains position order of ties
+        self.assertEqual(argsort_keys((a1,), (False,)).tolist(), [1, 3, 0, 2, 4])
+        self.assertEqual(argsort_keys((a1,), (True,)).tolist(), [0, 2, 4, 1, 3])
+
+        a2 = np.array(['b', 'a', 'a', 'c', 'b'], dtype=object)
+        self.assertEqual(argsort_keys((a1, a2), (True, False)).tolist(), [0, 4, 2, 3, 1])
+        self.assertEqual(argsort_keys((a1, a2), (False, True)).tolist(), [1, 3, 2, 0, 4])
+
+        a3 = np.array([None, 'a', 1, 'a', 0], dtype=object)
+        self.assertEqual(argsort_keys((a3,), (True,)).tolist(), [4, 2, 0, 1, 3])
+        self.assertEqual(argsort_keys((a3,), (False,)).tolist(), [1, 3, 0, 2, 4])
+
+        # int and float values are ordered by value, with and without multiple keys
+        a4 = np.array([1, 2.5, 'x', 0.5, 3], dtype=object)
+        self.assertEqual(a4[argsort_keys((a4,), (True,))].tolist(), [0.5, 1, 2.5, 3, 'x'])
+        self.assertEqual(a4[argsort_keys((np.zeros(5), a4), (True, True))].tolist(),
+                [0.5, 1, 2.5, 3, 'x'])
+
+    def test_argsort_keys_b(self) -> None:
+        a1 = np.array([3, 1, 2])
+        a2 = np.array([None, 'a', 1], dtype=object)
+        # kind is used for a single array in all paths
+        for array in (a1, a2):
+            for ascending in (True, False):
+                with self.assertRaises(ValueError):
+                    argsort_keys((array,), (ascending,), kind='foo')
+        self.assertEqual(argsort_keys((a1,), (False,), kind='quicksort').tolist(), [0, 2, 1])
+
 
     def test_column_1d_filter_a(self) -> None:
         a1 = np.arange(4)
@@ -2026,22 +2082,36 @@ class TestUnit(TestCase):
 
     #---------------------------------------------------------------------------
 
-    def test_slices_from_targets_a(self) -> None:
+    def test_fill_positions_directional_a(self) -> None:
+        isna = np.array([True, False, True, True, False, True])
 
-        target_index = binary_transition(np.array([False, True, True, True, False, False]))
-        target_values = list(range(len(target_index)))
+        source, distance = fill_positions_directional(isna, directional_forward=True)
+        self.assertEqual(source.tolist(), [-1, 1, 1, 1, 4, 4])
+        self.assertEqual(distance.tolist(), [1, 0, 1, 2, 0, 1])
 
-        post_iter = slices_from_targets(
-                target_index=target_index,
-                target_values=target_values,
-                length=len(target_values),
-                directional_forward=True,
-                limit=2,
-                slice_condition=lambda x: True,
-                )
+        source, distance = fill_positions_directional(isna, directional_forward=False)
+        self.assertEqual(source.tolist(), [1, 1, 4, 4, 4, 6])
+        self.assertEqual(distance.tolist(), [1, 0, 2, 1, 0, 1])
+
+    def test_array_fillna_directional_a(self) -> None:
+        a1 = np.array([np.nan, 1, np.nan, np.nan, np.nan, 2, np.nan])
+        self.assertAlmostEqualValues(
+                array_fillna_directional(a1, directional_forward=True).tolist(),
+                [np.nan, 1, 1, 1, 1, 2, 2])
+        self.assertAlmostEqualValues(
+                array_fillna_directional(a1, directional_forward=False, limit=2).tolist(),
+                [1, 1, np.nan, 2, 2, 2, np.nan])
+
+        a2 = np.array([[None, 'a', None], ['b', None, None]], dtype=object)
+        self.assertEqual(
+                array_fillna_directional(a2, directional_forward=True, axis=1).tolist(),
+                [[None, 'a', 'a'], ['b', 'b', 'b']])
+        self.assertEqual(
+                array_fillna_directional(a2, directional_forward=False, axis=0).tolist(),
+                [['b', 'a', None], ['b', None, None]])
 
-        post = tuple(post_iter)
-        self.assertEqual(post, ((slice(1, 4, None), 0),))
+        a3 = np.array([1, 2])
+        self.assertIs(array_fillna_directional(a3, directional_forward=True), a3)
 
     #---------------------------------------------------------------------------
     def test_array_from_element_method_a(self) -> None: